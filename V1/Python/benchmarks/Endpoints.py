@@ -0,0 +1,246 @@
+# --------------------------------------------------#
+# Endpoint benchmark suite                          #
+# File: benchmarks/Endpoints.py                     #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Runs every REST.py client function against the    #
+# local simulator (in its own process) and reports  #
+# throughput, p50/p99 latency and peak memory per   #
+# call. Results can be saved and compared against a #
+# saved baseline to catch regressions.              #
+#                                                   #
+# Usage: python -m benchmarks.Endpoints             #
+#        [--sensors 5000] [--seconds 2]             #
+#        [--save base.json] [--compare base.json]   #
+#-------------------------------------------------- #
+
+import argparse
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+import tracemalloc
+
+from placepod import AsyncREST
+from placepod import REST
+from placepod import Simulator
+
+
+# Run the simulator in a child process so the server doesn't compete with
+# the client for the GIL, and send its url back
+def serve(urls, sensors, latency, errorRate):
+    fleet = Simulator.SimulatedFleet(sensors=sensors, lots=max(sensors // 200, 1), commandDelay=0)
+    server = Simulator.SimulatorServer(fleet, latency=latency, errorRate=errorRate)
+    urls.put(server.url)
+    server.serveForever()
+
+def startSimulator(sensors, latency, errorRate):
+    urls = multiprocessing.Queue()
+    process = multiprocessing.Process(target=serve, args=(urls, sensors, latency, errorRate),
+                                      daemon=True)
+    process.start()
+    return process, urls.get(timeout=30)
+
+
+# Makes the rows the insert, update and remove calls work on. Each one is
+# made before the timed call, so only the call itself is measured.
+class Rows(object):
+    def __init__(self, parkingLotId):
+        self.parkingLotId = parkingLotId
+        self.count = 0
+
+    def name(self, kind):
+        self.count += 1
+        return "Benchmark " + kind + " " + str(self.count)
+
+    # Params of a new parking lot, gateway or sensor
+    def lotParams(self):
+        return json.dumps({'parkingLotName': self.name("lot"), 'description': "benchmark",
+                           'streetAddress': "123 here", 'latitude': '33.81',
+                           'longitude': '-117.91'})
+
+    def gatewayParams(self):
+        return json.dumps({'gatewayMac': '%016x' % (0xbe0000000000 + self.count),
+                           'gatewayName': self.name("gateway"), 'parkingLotId': self.parkingLotId})
+
+    def sensorParams(self):
+        self.count += 1
+        return json.dumps({'sensorId': '%016x' % (0xbe00000000000000 + self.count),
+                           'parkingSpace': "Benchmark space", 'parkingLotId': self.parkingLotId,
+                           'network': 'PNI', 'disabled': False, 'latitude': 33,
+                           'longitude': -111})
+
+    # Insert one and return its id
+    def lot(self):
+        params = self.lotParams()
+        REST.insertParkingLot(params)
+        name = json.loads(params)['parkingLotName']
+        return [lot.id for lot in REST.getParkingLots() if lot.name == name][0]
+
+    def gateway(self):
+        params = self.gatewayParams()
+        REST.insertGateway(params)
+        mac = json.loads(params)['gatewayMac']
+        return [gateway.id for gateway in REST.getGateways() if gateway.gatewayMac == mac][0]
+
+    def sensor(self):
+        params = self.sensorParams()
+        REST.insertSensor(params)
+        return json.loads(params)['sensorId']
+#---end Rows
+
+
+# (name, function) or (name, function, prepare) for every benchmarked call.
+# 'prepare' is called before every call of 'function', untimed, and what it
+# returns is passed to it.
+def cases(sensorId, parkingLotId):
+    rows = Rows(parkingLotId)
+    idParam = json.dumps({'sensorId': sensorId})
+    dayParam = json.dumps({'sensorId': sensorId, 'startTime': '2017-09-08T00:00:00.000Z',
+                           'endTime': '2017-09-09T00:00:00.000Z'})
+    weekParam = json.dumps({'sensorId': sensorId, 'startTime': '2017-09-01T00:00:00.000Z',
+                            'endTime': '2017-09-08T00:00:00.000Z'})
+
+    def asyncRecalibrate():
+        async def run():
+            async with AsyncREST.AsyncRestClient(concurrency=20) as client:
+                await asyncio.gather(*[client.recalibrate(idParam) for i in range(0, 100)])
+        asyncio.run(run())
+
+    def payload(value):
+        return json.dumps({'sensorId': sensorId, 'payload': value})
+
+    return [
+        ("getGateways", REST.getGateways),
+        ("getParkingLots", REST.getParkingLots),
+        ("getSensors", REST.getSensors),
+        ("streamSensors", lambda: sum(1 for sensor in REST.streamSensors())),
+        ("sensorHistory (1 day)", lambda: REST.sensorHistory(dayParam)),
+        ("streamSensorHistory (7 days)", lambda: sum(1 for row in REST.streamSensorHistory(weekParam))),
+        ("recalibrate", lambda: REST.recalibrate(idParam)),
+        ("forceVacant", lambda: REST.forceVacant(idParam)),
+        ("forceOccupied", lambda: REST.forceOccupied(idParam)),
+        ("setLoraWakeupInterval", lambda: REST.setLoraWakeupInterval(payload(5))),
+        ("setLoraTxPower", lambda: REST.setLoraTxPower(payload(14))),
+        ("setTxSpreadingFactor", lambda: REST.setTxSpreadingFactor(payload(9))),
+        ("setFrequencySubBand", lambda: REST.setFrequencySubBand(payload(2))),
+        ("ping", lambda: REST.ping(idParam, sensorId)),
+        ("bist", lambda: REST.bist(idParam, sensorId)),
+        ("async recalibrate x100", asyncRecalibrate),
+        # The lists grow and shrink here, so these come after the list calls
+        ("insertParkingLot", REST.insertParkingLot, rows.lotParams),
+        ("updateParkingLot", REST.updateParkingLot,
+         lambda: json.dumps({'id': rows.lot(), 'parkingLotName': rows.name("lot")})),
+        ("removeParkingLot", REST.removeParkingLot, lambda: json.dumps({'id': rows.lot()})),
+        ("insertGateway", REST.insertGateway, rows.gatewayParams),
+        ("updateGateway", REST.updateGateway,
+         lambda: json.dumps({'id': rows.gateway(), 'gatewayName': rows.name("gateway")})),
+        ("removeGateway", REST.removeGateway, lambda: json.dumps({'id': rows.gateway()})),
+        ("insertSensor", REST.insertSensor, rows.sensorParams),
+        ("updateSensor", REST.updateSensor,
+         lambda: json.dumps({'sensorId': rows.sensor(), 'parkingSpace': rows.name("space"),
+                             'latitude': 33.81, 'longitude': -117.91})),
+        ("removeSensor", REST.removeSensor, lambda: json.dumps({'sensorId': rows.sensor()})),
+    ]
+
+def percentile(values, share):
+    return values[min(int(len(values) * share), len(values) - 1)]
+
+# Time 'function' for about 'seconds' (at least 'minCalls' calls), then
+# measure the peak memory of one more call. Time spent in 'prepare' isn't
+# counted.
+def measure(function, seconds, minCalls, prepare=None):
+    def call(memory=False):
+        args = () if prepare is None else (prepare(),)
+        if memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        function(*args)
+        elapsed = time.perf_counter() - start
+        if memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return peak
+        return elapsed
+
+    call()
+    latencies = []
+    total = 0
+    while len(latencies) < minCalls or total < seconds:
+        latencies.append(call())
+        total += latencies[-1]
+    peak = call(memory=True)
+
+    latencies.sort()
+    return {'calls': len(latencies), 'throughput': len(latencies) / total,
+            'p50': percentile(latencies, 0.50) * 1000, 'p99': percentile(latencies, 0.99) * 1000,
+            'memory': peak / 1e6}
+
+# Names of the results that got worse than the baseline by more than 'tolerance'
+def regressions(results, baseline, tolerance):
+    worse = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        for field in ('p50', 'p99', 'memory'):
+            if old[field] > 0 and result[field] > old[field] * (1 + tolerance):
+                worse.append(name + " " + field + ": %.2f -> %.2f" % (old[field], result[field]))
+    return worse
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the REST client against the simulator")
+    parser.add_argument('--sensors', type=int, default=5000, help="size of the simulated fleet")
+    parser.add_argument('--seconds', type=float, default=2, help="time spent on each call")
+    parser.add_argument('--min-calls', type=int, default=5)
+    parser.add_argument('--latency', type=float, default=0, help="seconds the simulator adds per call")
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--only', help="only run calls whose name contains this")
+    parser.add_argument('--save', help="write the results to this JSON file")
+    parser.add_argument('--compare', help="JSON file from --save to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="allowed slowdown before a result counts as a regression")
+    args = parser.parse_args()
+
+    process, url = startSimulator(args.sensors, args.latency, args.error_rate)
+    REST.API_SERVER = url
+    REST.API_KEY = "simulator"
+    REST.setClient(REST.RestClient(url, "simulator"))
+    REST.disableCache()
+
+    print("Simulated fleet of " + str(args.sensors) + " sensors at " + url)
+    print("%-30s %8s %10s %10s %10s %10s" % ("call", "calls", "calls/s", "p50 ms", "p99 ms", "peak MB"))
+    results = {}
+    with open(os.devnull, 'w') as devnull:
+        with contextlib.redirect_stdout(devnull):
+            sensor = REST.getSensors()[0]
+        for case in cases(sensor.sensorId, sensor.parkingLotId):
+            name = case[0]
+            if args.only and args.only not in name:
+                continue
+            with contextlib.redirect_stdout(devnull):
+                result = measure(case[1], args.seconds, args.min_calls, *case[2:])
+            results[name] = result
+            print("%-30s %8d %10.1f %10.2f %10.2f %10.2f" % (name, result['calls'], result['throughput'],
+                                                             result['p50'], result['p99'],
+                                                             result['memory']))
+    process.terminate()
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(results, file, indent=2)
+        print("Saved results to " + args.save)
+    if args.compare:
+        with open(args.compare) as file:
+            worse = regressions(results, json.load(file), args.tolerance)
+        for line in worse:
+            print("Regression: " + line)
+        if worse:
+            sys.exit(1)
+        print("No regressions against " + args.compare)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# --------------------------------------------------#
+# MQTT event store benchmark                        #
+# File: benchmarks/EventSink.py                     #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Compares committing every MQTT event in its own   #
+# transaction with EventSink's micro-batches, both  #
+# keeping the minute and hour rollups up to date,   #
+# on a burst of Car Presence and Parking Lot Count  #
+# events like a morning arrival peak.               #
+#                                                   #
+# Usage: python -m benchmarks.EventSink [events]    #
+#        [batch size]                               #
+#-------------------------------------------------- #
+
+import os
+import sys
+import tempfile
+import time
+
+from placepod import EventSink
+from placepod import MQTT
+
+from benchmarks.JsonDecode import carPresencePacket, lotCountPacket, encode
+
+
+def events(count):
+    return [MQTT.decodePacket(encode(carPresencePacket(i) if i % 10 else lotCountPacket(i)))
+            for i in range(0, count)]
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    batchSize = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    decoded = events(count)
+    with tempfile.TemporaryDirectory() as directory:
+        # One transaction per event, through the same write path
+        sink = EventSink.EventSink(os.path.join(directory, "single.db"))
+        db = sink.connect()
+        start = time.perf_counter()
+        for event in decoded:
+            sink.write(db, [(event, EventSink.nowMillis())])
+        single = count / (time.perf_counter() - start)
+        db.close()
+        sink.close()
+        print("%-24s %10.0f events/s" % ("one row per event", single))
+
+        sink = EventSink.EventSink(os.path.join(directory, "batched.db"), batchSize=batchSize)
+        start = time.perf_counter()
+        for event in decoded:
+            sink.add(event)
+        sink.flush()
+        batched = count / (time.perf_counter() - start)
+        sink.close()
+        print("%-24s %10.0f events/s %7.2fx" % ("batches of " + str(batchSize), batched,
+                                                batched / single))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# --------------------------------------------------#
+# Import time benchmark                             #
+# File: benchmarks/ImportTime.py                    #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Imports each module in a fresh interpreter, the   #
+# way a short-lived CLI job or serverless handler   #
+# does on a cold start, and reports the median time #
+# over a bare interpreter along with the heavy      #
+# dependencies the import pulled in.                #
+#                                                   #
+# Usage: python -m benchmarks.ImportTime [runs]     #
+#        [module ...]                               #
+#-------------------------------------------------- #
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+MODULES = ['JsonDecoder', 'REST', 'MQTT', 'AsyncREST', 'HistoryFetcher', 'HistoryCache',
+           'CommandTracker', 'Dispatcher', 'Metrics', 'Export', 'HistoryFrame', 'ParquetExport']
+
+# Dependencies that should only be loaded once they are needed
+HEAVY = ['requests', 'paho', 'aiohttp', 'orjson', 'numpy', 'pyarrow']
+
+# Prints the heavy modules that ended up in sys.modules
+REPORT = ("import sys; print(','.join(name for name in %r if name in sys.modules))" % (HEAVY,))
+
+# Seconds a fresh interpreter takes to run 'code', and what it printed
+def run(code):
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return time.perf_counter() - start, output.strip()
+
+def median(code, runs):
+    return statistics.median(run(code)[0] for i in range(0, runs))
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    modules = sys.argv[2:] or MODULES
+    base = median("pass", runs)
+    print("Bare interpreter: %.1f ms (median of %d runs)" % (base * 1000, runs))
+    print("%-16s %10s  %s" % ("module", "ms", "heavy modules loaded"))
+    for module in modules:
+        try:
+            seconds = median("from placepod import " + module, runs)
+            loaded = run("from placepod import " + module + "; " + REPORT)[1]
+        except subprocess.CalledProcessError:
+            print("%-16s %10s" % (module, "failed"))
+            continue
+        print("%-16s %10.1f  %s" % (module, (seconds - base) * 1000, loaded or "-"))
+
+if __name__ == "__main__":
+    main()
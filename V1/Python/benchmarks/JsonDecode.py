@@ -0,0 +1,135 @@
+# --------------------------------------------------#
+# JSON decoding benchmark                           #
+# File: benchmarks/JsonDecode.py                    #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Times the old decode('utf_8') + json.loads path   #
+# against JsonDecoder with each available backend   #
+# on payloads shaped like the ones PlacePod sends:  #
+# MQTT packets, sensor lists, sensor history and a  #
+# double encoded ping-response.                     #
+#                                                   #
+# Usage: python -m benchmarks.JsonDecode [seconds]  #
+#-------------------------------------------------- #
+
+import json
+import sys
+import time
+
+from placepod import JsonDecoder
+from placepod import REST
+
+
+STATUSES = ['vacant', 'car entering', 'occupied', 'car leaving']
+
+# Car Presence packet from the MQTT API, as documented in the README
+def carPresencePacket(i):
+    return {
+        'sensorId': '00800000040%05x' % (i % 200),
+        'parkingSpace': 'Space #' + str(i % 200),
+        'network': 'PNI',
+        'lat': 38.42074876336795,
+        'lon': -122.75509041539759,
+        'createdAt': '2017-05-03T21:12:52.974Z',
+        'parkingName': 'Electric Vehicle Parking Lot',
+        'hostFirmware': '0.3.39',
+        'sensorFirmware': '1.3.0.0.284',
+        'Temperature': 23,
+        'Battery': 3.6482174396514893,
+        'GatewayTime': '2017-06-06T17:23:57.834Z',
+        'SENtralTime': 309467131 + i,
+        'ServerTime': '2017-06-06T17:17:08.977Z',
+        'CarPresence': i % 4 + 1,
+        'rssi': -79,
+        'snr': 11.6,
+        'status': STATUSES[i % 4],
+    }
+
+def lotCountPacket(i):
+    return {
+        'parkingLotId': '5a0c6d1f3b1c2e%010d' % (i % 5),
+        'parkingName': 'Electric Vehicle Parking Lot',
+        'totalNumberOfSpaces': 200,
+        'availableSpaces': i % 200,
+        'adjustedAvailableSpaces': i % 200,
+        'parkingLotClosed': False,
+    }
+
+# One row of getSensors or sensor history
+def sensorRow(i):
+    sensor = i % 200
+    return {
+        'sensorId': '00800000040%05x' % sensor,
+        'parkingSpace': 'Space #' + str(sensor),
+        'parkingLot': 'Electric Vehicle Parking Lot ' + str(sensor % 5),
+        'status': STATUSES[i % 4],
+        'carPresence': i % 4 + 1,
+        'gatewayTime': '2017-06-06T17:%02d:%02d.834Z' % (i // 60 % 60, i % 60),
+        'sentralTime': 309467131 + i * 1000,
+        'temperature': 23,
+        'battery': 3.6482174396514893,
+        'lat': 38.42074876336795,
+        'lon': -122.75509041539759,
+        'network': 'PNI' if sensor % 3 else 'SENET',
+        'parkingLotId': '5a0c6d1f3b1c2e%010d' % (sensor % 5),
+    }
+
+def pingResponse():
+    return [{'sensorId': '0080000004000675', 'rssi': -79, 'snr': 11.6,
+             'gatewayTime': '2017-06-06T17:23:57.834Z', 'serverTime': '2017-06-06T17:23:58.102Z'}]
+
+def encode(value):
+    return json.dumps(value).encode('utf_8')
+
+# (name, body bytes, object hook) for every payload
+def payloads():
+    return [
+        ("MQTT car presence", encode(carPresencePacket(7)), None),
+        ("MQTT lot count", encode(lotCountPacket(7)), None),
+        ("getSensors (1k)", encode([sensorRow(i) for i in range(0, 1000)]), REST.createSensorPayload),
+        ("sensor history (10k)", encode([sensorRow(i) for i in range(0, 10000)]), REST.createSensorPayload),
+        ("ping-response (string)", encode(json.dumps(pingResponse())), None),
+    ]
+
+# The decoding REST.py and MQTT.py did before JsonDecoder
+def oldLoads(content, objectHook=None):
+    payload = json.loads(content.decode('utf_8'), object_hook=objectHook)
+    if type(payload) is str:
+        payload = json.loads(payload)
+    return payload
+
+def newLoads(content, objectHook=None):
+    payload = JsonDecoder.loads(content, objectHook)
+    if type(payload) is str:
+        payload = JsonDecoder.loads(payload)
+    return payload
+
+# Microseconds per decode, running for about 'seconds'
+def measure(loads, content, objectHook, seconds):
+    loads(content, objectHook)
+    count = 0
+    start = time.perf_counter()
+    while True:
+        loads(content, objectHook)
+        count += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            return elapsed * 1e6 / count
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    JsonDecoder.loadBackend()
+    backends = [name for name in JsonDecoder.BACKENDS
+                if name != 'orjson' or JsonDecoder.orjson is not None]
+    print("%-24s %12s" % ("payload", "old") + "".join("%12s %8s" % (name, "speedup") for name in backends))
+    for name, content, objectHook in payloads():
+        old = measure(oldLoads, content, objectHook, seconds)
+        line = "%-24s %10.1fus" % (name, old)
+        for backend in backends:
+            JsonDecoder.setBackend(backend)
+            new = measure(newLoads, content, objectHook, seconds)
+            line += "%10.1fus %7.2fx" % (new, old / new)
+        print(line)
+
+if __name__ == "__main__":
+    main()
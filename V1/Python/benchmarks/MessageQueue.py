@@ -0,0 +1,55 @@
+# --------------------------------------------------#
+# MQTT message queue benchmark                      #
+# File: benchmarks/MessageQueue.py                  #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Measures how long paho's network thread is busy   #
+# per message when it handles packets itself versus #
+# when it only queues them for MessageQueue's       #
+# workers, with a handler that does some blocking   #
+# work, and how fast the workers drain the queue.   #
+#                                                   #
+# Usage: python -m benchmarks.MessageQueue          #
+#        [messages] [handler ms] [workers]          #
+#-------------------------------------------------- #
+
+import sys
+import time
+
+from placepod import MQTT
+from placepod import MessageQueue
+
+from benchmarks.JsonDecode import carPresencePacket, encode
+
+
+def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    handlerSeconds = (float(sys.argv[2]) if len(sys.argv) > 2 else 0.5) / 1000
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    bodies = [encode(carPresencePacket(i)) for i in range(0, messages)]
+    # Stands in for a handler that writes to a database or calls the api
+    MQTT.addEventHandler(MQTT.CarPresenceEvent, lambda event: time.sleep(handlerSeconds))
+
+    start = time.perf_counter()
+    for body in bodies:
+        MQTT.handleMessage(body)
+    inline = time.perf_counter() - start
+    print("Inline on_message:   network thread busy %8.1f us/message, done in %6.2f s"
+          % (inline * 1e6 / messages, inline))
+
+    for policy in MessageQueue.POLICIES:
+        queue = MessageQueue.MessageQueue(workers=workers, maxSize=messages // 4, policy=policy)
+        start = time.perf_counter()
+        for body in bodies:
+            queue.put(body)
+        network = time.perf_counter() - start
+        queue.close()
+        total = time.perf_counter() - start
+        stats = queue.stats()
+        print("%-12s x%-2d: network thread busy %8.1f us/message, done in %6.2f s,"
+              " max lag %6.3f s, dropped %d, spilled %d"
+              % (policy, workers, network * 1e6 / messages, total, stats['maxLag'],
+                 stats['dropped'], stats['spilledTotal']))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# --------------------------------------------------#
+# Model memory benchmark                            #
+# File: benchmarks/ModelMemory.py                   #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Compares the memory held by sensor history rows   #
+# decoded into the old plain Sensor class against   #
+# the slotted, interned Sensor in REST.py.          #
+#                                                   #
+# Usage: python -m benchmarks.ModelMemory [rows]    #
+#-------------------------------------------------- #
+
+import gc
+import json
+import sys
+import time
+
+from placepod import REST
+
+
+# The Sensor class as it was before __slots__ and interning
+class PlainSensor(object):
+    def __init__(self, sensorId, parkingSpace, parkingLot, status, carPresence,
+                 gatewayTime, sentralTime, temperature, battery, lat,
+                 lon, network, parkingLotId):
+        self.sensorId = sensorId
+        self.parkingSpace = parkingSpace
+        self.parkingLot = parkingLot
+        self.status = status
+        self.carPresence = carPresence
+        self.gateWayTime = gatewayTime
+        self.sentralTime = sentralTime
+        self.temperature = temperature
+        self.battery = battery
+        self.lat = lat
+        self.lon = lon
+        self.network = network
+        self.parkingLotId = parkingLotId
+
+def createPlainSensorPayload(dct):
+    return PlainSensor(dct['sensorId'], dct['parkingSpace'], dct['parkingLot'], dct['status'],
+                       dct['carPresence'], dct['gatewayTime'], dct['sentralTime'], dct['temperature'],
+                       dct['battery'], dct['lat'], dct['lon'], dct['network'], dct['parkingLotId'])
+
+
+STATUSES = ['vacant', 'occupied', 'car entering', 'car leaving']
+
+# History rows as they come out of the api, one small JSON object at a time so
+# every row gets its own copy of each string like a real response would
+def historyRows(count):
+    for i in range(0, count):
+        sensor = i % 200
+        yield json.dumps({
+            'sensorId': '00800000040%05x' % sensor,
+            'parkingSpace': 'Space #' + str(sensor),
+            'parkingLot': 'Electric Vehicle Parking Lot ' + str(sensor % 5),
+            'status': STATUSES[i % 4],
+            'carPresence': i % 4 + 1,
+            'gatewayTime': '2017-06-06T17:%02d:%02d.834Z' % (i // 60 % 60, i % 60),
+            'sentralTime': 309467131 + i * 1000,
+            'temperature': 23,
+            'battery': 3.6482174396514893,
+            'lat': 38.42074876336795,
+            'lon': -122.75509041539759,
+            'network': 'PNI' if sensor % 3 else 'SENET',
+            'parkingLotId': '5a0c6d1f3b1c2e%010d' % (sensor % 5),
+        })
+
+# Bytes held by the rows: each object, its __dict__ if it has one, and every
+# distinct value object they point at (shared values are only counted once)
+def footprint(rows):
+    seen = set()
+    total = 0
+    for row in rows:
+        total += sys.getsizeof(row)
+        if hasattr(row, '__dict__'):
+            total += sys.getsizeof(row.__dict__)
+            values = row.__dict__.values()
+        else:
+            values = [getattr(row, name) for name in row.__slots__]
+        for value in values:
+            if id(value) not in seen:
+                seen.add(id(value))
+                total += sys.getsizeof(value)
+    return total
+
+def measure(name, objectHook, count):
+    gc.collect()
+    start = time.perf_counter()
+    rows = [json.loads(row, object_hook=objectHook) for row in historyRows(count)]
+    elapsed = time.perf_counter() - start
+    size = footprint(rows)
+    print("%-22s %10.1f MB %8.1f bytes/row %8.2f s" % (name, size / 1e6, size / len(rows), elapsed))
+    del rows
+    return size
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print("Holding " + str(count) + " sensor history rows")
+    old = measure("plain Sensor", createPlainSensorPayload, count)
+    new = measure("slotted + interned", REST.createSensorPayload, count)
+    print("Saved %.1f%%" % (100.0 * (old - new) / old))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# --------------------------------------------------#
+# MQTT packet handling benchmark                    #
+# File: benchmarks/MqttDecode.py                    #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Times the old on_message path (a Payload object   #
+# and a hasattr check and print per field) against  #
+# decodePacket + dispatch, with and without the     #
+# debug sink, on a mix of Car Presence and Parking  #
+# Lot Count packets.                                #
+#                                                   #
+# Usage: python -m benchmarks.MqttDecode [seconds]  #
+#-------------------------------------------------- #
+
+import contextlib
+import os
+import sys
+import time
+
+from placepod import JsonDecoder
+from placepod import MQTT
+
+from benchmarks.JsonDecode import carPresencePacket, lotCountPacket, encode
+
+
+# The Payload object MQTT.py used before decodePacket
+class Payload(object):
+    def __init__(self, j):
+        self.__dict__ = JsonDecoder.loads(j)
+
+# Packet fields in the order the old on_message printed them
+OLD_FIELDS = ['sensorId', 'parkingSpace', 'network', 'lat', 'lon', 'createdAt', 'parkingName',
+              'hostFirmware', 'sensorFirmware', 'Temperature', 'Battery', 'GatewayTime',
+              'SENtralTime', 'ServerTime', 'CarPresence', 'rssi', 'snr', 'status',
+              'totalNumberOfSpaces', 'availableSpaces', 'adjustedAvailableSpaces', 'parkingLotId',
+              'parkingLotClosed']
+
+def oldOnMessage(result):
+    payload = Payload(result)
+    print("Packet contents")
+    for field in OLD_FIELDS:
+        if hasattr(payload, field):
+            print(field + ": " + str(getattr(payload, field)))
+    print("")
+    print("Waiting on publish...")
+
+def newOnMessage(result):
+    MQTT.dispatch(MQTT.decodePacket(result))
+
+# Packets per second over about 'seconds'
+def measure(function, packets, seconds):
+    count = 0
+    start = time.perf_counter()
+    while True:
+        for packet in packets:
+            function(packet)
+        count += len(packets)
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            return count / elapsed
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    # Car Presence packets far outnumber Parking Lot Count packets
+    packets = [encode(carPresencePacket(i)) if i % 10 else encode(lotCountPacket(i))
+               for i in range(0, 1000)]
+    events = []
+    MQTT.addMessageHandler(events.append)
+    MQTT.addMessageHandler(lambda event: events.clear() if len(events) > 1000 else None)
+
+    print("%-30s %14s %8s" % ("path", "packets/s", "speedup"))
+    with open(os.devnull, 'w') as devnull:
+        with contextlib.redirect_stdout(devnull):
+            old = measure(oldOnMessage, packets, seconds)
+        print("%-30s %14.0f %8s" % ("Payload + hasattr + print", old, "1.00x"))
+
+        MQTT.setDebugSink(True, devnull)
+        new = measure(newOnMessage, packets, seconds)
+        print("%-30s %14.0f %7.2fx" % ("decodePacket + debug sink", new, new / old))
+
+        MQTT.setDebugSink(False)
+        new = measure(newOnMessage, packets, seconds)
+        print("%-30s %14.0f %7.2fx" % ("decodePacket + dispatch", new, new / old))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# --------------------------------------------------#
+# Sharded MQTT subscriber scaling benchmark         #
+# File: benchmarks/ShardedSubscriber.py             #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Publishes Car Presence packets to a local broker  #
+# and times how fast ShardedSubscriber handles them #
+# with 1, 2, 4, ... shards, reporting the speedup   #
+# and scaling efficiency over a single shard. Needs #
+# a broker without TLS, e.g. mosquitto on           #
+# localhost:1883, and enough publishers to stay     #
+# ahead of the subscriber.                          #
+#                                                   #
+# Usage: python -m benchmarks.ShardedSubscriber     #
+#        [--shards 1,2,4] [--mode shared]           #
+#        [--messages 200000] [--work-us 50]         #
+#-------------------------------------------------- #
+
+import argparse
+import contextlib
+import functools
+import multiprocessing
+import os
+import time
+
+from placepod import MQTT
+from placepod import ShardedSubscriber
+
+from benchmarks.JsonDecode import carPresencePacket, encode
+
+
+SENSORS = 2000
+
+def sensorId(i):
+    return '00800000040%05x' % (i % SENSORS)
+
+# Stands in for the work a handler does per event, e.g. updating state
+def work(seconds, event):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+    return None
+
+# Publisher process: send 'count' packets as fast as the broker takes them
+def publish(host, port, first, count):
+    client = MQTT.loadPaho().Client()
+    client.connect(host, port, 60)
+    client.loop_start()
+    bodies = []
+    for i in range(0, 1000):
+        packet = carPresencePacket(first + i)
+        packet['sensorId'] = sensorId(first + i)
+        bodies.append(("placepod/uplink/bench/" + packet['sensorId'], encode(packet)))
+    for i in range(0, count):
+        topic, body = bodies[i % 1000]
+        client.publish(topic, body)
+    # Give the network thread time to send what is queued
+    while client.want_write():
+        time.sleep(0.01)
+    client.disconnect()
+    client.loop_stop()
+
+# Events per second handled by 'shards' shards
+def measure(args, shards):
+    options = {'serverURL': args.host, 'port': args.port, 'username': 'bench',
+               'password': 'bench', 'caCerts': None}
+    sensorIds = [sensorId(i) for i in range(0, SENSORS)]
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        subscriber = ShardedSubscriber.ShardedSubscriber(
+            shards, args.mode, topic="placepod/uplink/#", sensorIds=sensorIds,
+            process=functools.partial(work, args.work_us / 1e6), options=options, interval=0.1)
+        subscriber.start()
+        if not subscriber.waitSubscribed():
+            subscriber.stop()
+            raise SystemExit("Shards couldn't subscribe: " + str(subscriber.stats()['errors']))
+
+    perPublisher = args.messages // args.publishers
+    total = perPublisher * args.publishers
+    publishers = [multiprocessing.Process(target=publish,
+                                          args=(args.host, args.port, i * 1000, perPublisher))
+                  for i in range(0, args.publishers)]
+    start = time.perf_counter()
+    for publisher in publishers:
+        publisher.start()
+    deadline = start + args.timeout
+    while subscriber.stats()['events'] < total and time.perf_counter() < deadline:
+        subscriber.drain()
+        time.sleep(0.02)
+    elapsed = time.perf_counter() - start
+    handled = subscriber.stats()['events']
+    for publisher in publishers:
+        publisher.join()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        subscriber.stop()
+    if handled < total:
+        print("Warning: only " + str(handled) + " of " + str(total) + " messages arrived"
+              + " with " + str(shards) + " shards (QoS 0 drops or timeout)")
+    return handled / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ShardedSubscriber against a local broker")
+    parser.add_argument('--host', default="localhost")
+    parser.add_argument('--port', type=int, default=1883)
+    parser.add_argument('--mode', choices=ShardedSubscriber.MODES, default='shared')
+    parser.add_argument('--shards', default=None,
+                        help="comma separated shard counts, 1,2,4,... up to the cores by default")
+    parser.add_argument('--messages', type=int, default=200000)
+    parser.add_argument('--publishers', type=int, default=4)
+    parser.add_argument('--work-us', type=float, default=50,
+                        help="CPU time spent on each event by the handler, in microseconds")
+    parser.add_argument('--timeout', type=float, default=120)
+    args = parser.parse_args()
+
+    if args.shards is None:
+        counts = [1]
+        while counts[-1] * 2 <= multiprocessing.cpu_count():
+            counts.append(counts[-1] * 2)
+    else:
+        counts = [int(count) for count in args.shards.split(',')]
+
+    print("%d messages, %s mode, %.0f us of work per event, %d cores"
+          % (args.messages, args.mode, args.work_us, multiprocessing.cpu_count()))
+    print("%8s %14s %9s %11s" % ("shards", "events/s", "speedup", "efficiency"))
+    base = None
+    for shards in counts:
+        rate = measure(args, shards)
+        if base is None:
+            base = rate / shards
+        print("%8d %14.0f %8.2fx %10.0f%%" % (shards, rate, rate / base,
+                                               rate / (base * shards) * 100))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+# --------------------------------------------------#
+# PlacePod client benchmarks                        #
+# File: __init__.py                                 #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Each benchmark runs as a module from the          #
+# directory that holds the placepod package:        #
+#   python -m benchmarks.JsonDecode                 #
+#-------------------------------------------------- #
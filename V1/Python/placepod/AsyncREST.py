@@ -0,0 +1,308 @@
+# --------------------------------------------------#
+# Python asyncio WEB API client                     #
+# File: AsyncREST.py                                #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# asyncio counterpart of every API function in      #
+# REST.py. All calls share one aiohttp session and  #
+# a semaphore limits how many are in flight, so     #
+# hundreds of calls can be fanned out from a single #
+# event loop. Returns the same model objects.       #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import asyncio
+import time
+from . import JsonDecoder # Used to deserialize JSON obtained from the api
+
+from . import REST # Models, payload helpers and the API_SERVER / API_KEY values
+
+
+# Used to make asynchronous requests to the api. Imported when the first
+# session is opened rather than when this file is imported.
+aiohttp = None
+
+def loadAiohttp():
+    global aiohttp
+    if aiohttp is None:
+        import aiohttp
+    return aiohttp
+
+
+# Example:
+#   async def run():
+#       async with AsyncRestClient(concurrency=50) as client:
+#           sensors = await client.getSensors()
+#           await asyncio.gather(*[client.recalibrate('{"sensorId": "' + s.sensorId + '"}')
+#                                  for s in sensors])
+#   asyncio.run(run())
+#
+#   server: api server url, defaults to REST.API_SERVER
+#   apiKey: api key, defaults to REST.API_KEY
+#   concurrency: max number of calls in flight at once
+#   poolSize: max number of open connections to the server
+#   timeout: seconds to wait on the server before giving up
+#   budget: optional RequestBudget shared by every call made with this client
+#   retryPolicy, breakerThreshold, breakerReset: same as for REST.RestClient
+class AsyncRestClient(object):
+    def __init__(self, server=None, apiKey=None, concurrency=20, poolSize=100, timeout=60,
+                 budget=None, retryPolicy=None, breakerThreshold=5, breakerReset=30):
+        self.server = REST.API_SERVER if server is None else server
+        self.apiKey = REST.API_KEY if apiKey is None else apiKey
+        self.concurrency = concurrency
+        self.poolSize = poolSize
+        self.timeout = timeout
+        self.budget = budget
+        self.retryPolicy = REST.RetryPolicy() if retryPolicy is None else retryPolicy
+        self.breakers = REST.CircuitBreakers(breakerThreshold, breakerReset)
+        # Must set content-type on calls with a body or else a 415 responce error will occur
+        self.jsonHeaders = {'content-type': 'application/json; charset=utf-8'}
+        # The session and semaphore are created on first use so they belong
+        # to the running event loop
+        self.session = None
+        self.semaphore = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, excType, exc, tb):
+        await self.close()
+
+    async def open(self):
+        if self.session is None:
+            loadAiohttp()
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+            connector = aiohttp.TCPConnector(limit=self.poolSize)
+            self.session = aiohttp.ClientSession(connector=connector,
+                                                 headers={'X-API-KEY': self.apiKey},
+                                                 timeout=aiohttp.ClientTimeout(total=self.timeout))
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    #--------------------------------HTTP request methods----------------------------
+
+    # Makes an api call and returns the response body. Failed calls are
+    # retried and raised as a REST.PlacePodError just like REST.RestClient.send
+    # Every attempt, retries included, takes a token from the client's budget
+    # and from 'budget' if one is passed, e.g. a budget for one bulk command.
+    # Calls are reported to REST's call observers the same way: a CallRecord
+    # passed in is filled in and left for the caller to publish, otherwise one
+    # is made and published here while there are call observers.
+    async def request(self, method, urlPath, data=None, budget=None, record=None):
+        publish = record is None and len(REST.callObservers) > 0
+        if publish:
+            record = REST.CallRecord(method, urlPath)
+        try:
+            return await self.requestWithRetries(method, urlPath, data, budget, record)
+        except REST.PlacePodError as error:
+            if record is not None:
+                record.error = type(error).__name__
+            raise
+        finally:
+            if publish:
+                REST.publishCall(record)
+
+    async def requestWithRetries(self, method, urlPath, data, budget, record):
+        await self.open()
+        headers = None if data is None else self.jsonHeaders
+        breaker = self.breakers.get(method, urlPath)
+        attempt = 0
+        while True:
+            breaker.before()
+            if self.budget is not None:
+                await self.budget.acquire()
+            if budget is not None:
+                await budget.acquire()
+            if record is not None:
+                record.attempts += 1
+            try:
+                async with self.semaphore:
+                    # Time spent waiting on the budget and semaphore isn't network time
+                    start = time.perf_counter()
+                    try:
+                        async with self.session.request(method, self.server + urlPath,
+                                                        data=data, headers=headers) as response:
+                            content = await response.read()
+                    finally:
+                        if record is not None:
+                            record.network += time.perf_counter() - start
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                failure = REST.ConnectionFailedError(method, urlPath, error)
+            else:
+                if record is not None:
+                    record.status = response.status
+                    record.bytes = len(content)
+                if response.status == 200:
+                    breaker.succeeded()
+                    return content
+                failure = REST.apiError(response.status, content,
+                                        response.headers.get('Retry-After'))
+            breaker.failed(failure)
+            if not self.retryPolicy.shouldRetry(method, urlPath, failure, attempt):
+                raise failure
+            await asyncio.sleep(self.retryPolicy.delay(attempt, failure.retryAfter))
+            attempt += 1
+
+    async def get(self, urlPath):
+        return await self.request('GET', urlPath)
+
+    async def post(self, urlPath, data):
+        return await self.request('POST', urlPath, data)
+
+    async def put(self, urlPath, data):
+        return await self.request('PUT', urlPath, data)
+
+    async def delete(self, urlPath, data):
+        return await self.request('DELETE', urlPath, data)
+
+    # Get/post the url and break the returned JSON into model objects
+    async def fetch(self, method, urlPath, data, objectHook):
+        record = REST.CallRecord(method, urlPath) if REST.callObservers else None
+        try:
+            result = await self.request(method, urlPath, data, record=record)
+            # Stop running if the call returns empty JSON
+            if result == b'':
+                print("Error: " + urlPath + " returned no data")
+                return
+            if record is None:
+                return JsonDecoder.loads(result, objectHook)
+            # Parse first and build the models after, so each step can be timed
+            start = time.perf_counter()
+            payload = JsonDecoder.loads(result)
+            record.decode = time.perf_counter() - start
+            start = time.perf_counter()
+            payload = JsonDecoder.applyObjectHook(payload, objectHook)
+            record.model = time.perf_counter() - start
+            return payload
+        finally:
+            if record is not None:
+                REST.publishCall(record)
+
+    # Send a call that doesn't return data. Returns True if it succeeded.
+    async def send(self, method, urlPath, params, budget=None):
+        await self.request(method, urlPath, params, budget)
+        return True
+
+    #--------------------------------API Functions-----------------------------------
+    # Same order and names as REST.py
+
+    # ---------Gateway Functions---------
+
+    async def getGateways(self):
+        return await self.fetch('GET', "/api/gateways", None, REST.createGatewayPayload)
+
+    async def insertGateway(self, params):
+        return await self.send('POST', "/api/gateway/insert", params)
+
+    async def removeGateway(self, params):
+        return await self.send('DELETE', "/api/gateway/remove", params)
+
+    async def updateGateway(self, params):
+        return await self.send('PUT', "/api/gateway/update", params)
+
+    #---------Parking Lot Functions---------
+
+    async def getParkingLots(self):
+        return await self.fetch('GET', "/api/parking-lots", None, REST.createParkingLotPayload)
+
+    async def insertParkingLot(self, params):
+        return await self.send('POST', "/api/parking-lot/insert", params)
+
+    async def removeParkingLot(self, params):
+        return await self.send('DELETE', "/api/parking-lot/remove", params)
+
+    async def updateParkingLot(self, params):
+        return await self.send('PUT', "/api/parking-lot/update", params)
+
+    #---------Sensor Functions---------
+
+    async def getSensors(self):
+        # Sample sensor post request with no filters applied
+        return await self.fetch('POST', "/api/sensors", "{}", REST.createSensorPayload)
+
+    async def insertSensor(self, params):
+        return await self.send('POST', "/api/sensor/insert", params)
+
+    async def removeSensor(self, params):
+        return await self.send('DELETE', "/api/sensor/remove", params)
+
+    async def updateSensor(self, params):
+        return await self.send('PUT', "/api/sensor/update", params)
+
+    async def sensorHistory(self, params):
+        return await self.fetch('POST', "/api/sensor/history", params, REST.createSensorPayload)
+
+    async def recalibrate(self, params):
+        return await self.send('POST', "/api/sensor/recalibrate", params)
+
+    # Handles api/sensor/initialize-bist and api/sensor/bist-response/{SensorId}/{LastUpdated}.
+    # Returns the list of BIST results, or None if the sensor didn't answer in time.
+    async def bist(self, params, sensorId, timeout=300):
+        return await self.command("/api/sensor/initialize-bist", "/api/sensor/bist-response/",
+                                  params, sensorId, timeout)
+
+    # Handles api/sensor/ping and api/sensor/ping-response/{SensorId}/{LastUpdated}.
+    # Returns the list of ping results, or None if the sensor didn't answer in time.
+    async def ping(self, params, sensorId, timeout=300):
+        return await self.command("/api/sensor/ping", "/api/sensor/ping-response/",
+                                  params, sensorId, timeout)
+
+    # Send a command, then check its response once a second until the sensor
+    # answers. Other calls keep running on the event loop while this waits.
+    async def command(self, commandPath, responsePath, params, sensorId, timeout):
+        timeStr = REST.commandTime()
+        await self.send('POST', commandPath, params)
+        for timer in range(0, timeout):
+            result = await self.get(responsePath + str(sensorId) + "/" + timeStr)
+            payload = REST.commandResponse(result)
+            if payload is not None:
+                return payload
+            await asyncio.sleep(1)
+        return
+
+    async def forceVacant(self, params):
+        return await self.send('POST', "/api/sensor/force-vacant", params)
+
+    async def forceOccupied(self, params):
+        return await self.send('POST', "/api/sensor/force-occupied", params)
+
+    async def setLoraWakeupInterval(self, params):
+        return await self.send('POST', "/api/sensor/set-lora-wakeup-interval", params)
+
+    async def setLoraTxPower(self, params):
+        return await self.send('POST', "/api/sensor/set-lora-tx-power", params)
+
+    async def setTxSpreadingFactor(self, params):
+        return await self.send('POST', "/api/sensor/set-tx-spreading-factor", params)
+
+    async def setFrequencySubBand(self, params):
+        return await self.send('POST', "/api/sensor/set-frequency-sub-band", params)
+#---end AsyncRestClient
+
+
+#--- Request Budget ---
+# Token bucket that caps how many calls per second a client may make.
+# Up to 'burst' calls can go out at once, after which calls are spaced out
+# to 'rate' per second. Only meant to be used from one event loop.
+class RequestBudget(object):
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(rate if burst is None else burst)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+#---end RequestBudget
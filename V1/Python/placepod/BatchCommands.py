@@ -0,0 +1,173 @@
+# --------------------------------------------------#
+# Fleet BIST / Ping orchestrator                    #
+# File: BatchCommands.py                            #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Sends initialize-bist or ping to many sensors and #
+# tracks every pending *-response with a single     #
+# scheduler instead of one 300 second poll loop per #
+# sensor. Sensors are polled quickly at first and   #
+# then less often, every call goes through one      #
+# request budget, and results are handed back as    #
+# soon as each sensor answers.                      #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import asyncio
+import heapq
+import json # Used to build the params for each sensor
+
+from . import REST # Command time and response helpers
+from . import AsyncREST # Shared session, concurrency limit and request budget
+
+
+# Outcome of a command for one sensor
+#   status: 'response' if the sensor answered, 'timeout' if it didn't answer
+#           in time and 'failed' if a call returned an error
+#   payload: the decoded *-response list when status is 'response'
+#   error: the REST.PlacePodError when status is 'failed'
+#   polls: number of *-response calls made for this sensor
+#   elapsed: seconds from sending the command to the result
+class CommandResult(object):
+    def __init__(self, sensorId, status, payload, polls, elapsed, error=None):
+        self.sensorId = sensorId
+        self.status = status
+        self.payload = payload
+        self.error = error
+        self.polls = polls
+        self.elapsed = elapsed
+#---end CommandResult
+
+# Command that has been sent and is waiting on a response
+class PendingCommand(object):
+    def __init__(self, sensorId, timeStr, sentAt, interval):
+        self.sensorId = sensorId
+        self.timeStr = timeStr
+        self.sentAt = sentAt
+        self.interval = interval
+        self.polls = 0
+        self.payload = None
+        self.failed = False
+        self.error = None
+#---end PendingCommand
+
+
+# Example:
+#   async def run():
+#       budget = AsyncREST.RequestBudget(rate=50)
+#       async with AsyncREST.AsyncRestClient(concurrency=50, budget=budget) as client:
+#           batch = BatchCommand(client, 'bist', sensorIds)
+#           async for result in batch.results():
+#               print(result.sensorId + ": " + result.status)
+#   asyncio.run(run())
+#
+#   kind: 'bist' or 'ping'
+#   timeout: seconds to wait on each sensor before giving up
+#   firstInterval: seconds before the first *-response call
+#   maxInterval: longest time between two *-response calls for a sensor
+#   backoff: factor the interval grows by after every empty response
+class BatchCommand(object):
+    def __init__(self, client, kind, sensorIds, timeout=300, firstInterval=1,
+                 maxInterval=30, backoff=1.5):
+        if kind not in REST.COMMAND_CALLS:
+            raise ValueError("kind must be one of " + ", ".join(REST.COMMAND_CALLS))
+        self.client = client
+        self.commandPath, self.responsePath = REST.COMMAND_CALLS[kind]
+        # Sending the same command twice to a sensor only fills up its queue
+        self.sensorIds = list(dict.fromkeys(str(sensorId) for sensorId in sensorIds))
+        self.timeout = timeout
+        self.firstInterval = firstInterval
+        self.maxInterval = maxInterval
+        self.backoff = backoff
+
+    # Send the command to one sensor
+    async def send(self, sensorId):
+        loop = asyncio.get_running_loop()
+        timeStr = REST.commandTime()
+        pending = PendingCommand(sensorId, timeStr, loop.time(), self.firstInterval)
+        try:
+            await self.client.post(self.commandPath, json.dumps({'sensorId': sensorId}))
+        except REST.PlacePodError as error:
+            pending.failed = True
+            pending.error = error
+        return pending
+
+    # Check once whether a sensor has answered
+    async def poll(self, pending):
+        pending.polls += 1
+        try:
+            result = await self.client.get(self.responsePath + pending.sensorId + "/" + pending.timeStr)
+        except REST.PlacePodError as error:
+            pending.failed = True
+            pending.error = error
+        else:
+            pending.payload = REST.commandResponse(result)
+        return pending
+
+    def finish(self, pending, status, now):
+        return CommandResult(pending.sensorId, status, pending.payload, pending.polls,
+                             now - pending.sentAt, pending.error)
+
+    # Async generator that sends every command and yields a CommandResult
+    # for each sensor as soon as it is known
+    async def results(self):
+        loop = asyncio.get_running_loop()
+        sent = await asyncio.gather(*[self.send(sensorId) for sensorId in self.sensorIds])
+
+        # Heap of (next poll time, order, pending command) so the scheduler
+        # always knows which sensor is due next
+        schedule = []
+        for order, pending in enumerate(sent):
+            if pending.failed:
+                yield self.finish(pending, 'failed', loop.time())
+            else:
+                heapq.heappush(schedule, (pending.sentAt + pending.interval, order, pending))
+        order = len(sent)
+
+        polling = set()
+        while schedule or polling:
+            now = loop.time()
+            # Start every poll that is due
+            while schedule and schedule[0][0] <= now:
+                pending = heapq.heappop(schedule)[2]
+                polling.add(asyncio.ensure_future(self.poll(pending)))
+
+            # Sleep until a poll finishes or the next one is due
+            wait = max(schedule[0][0] - now, 0) if schedule else None
+            if not polling:
+                await asyncio.sleep(wait)
+                continue
+            done, polling = await asyncio.wait(polling, timeout=wait,
+                                               return_when=asyncio.FIRST_COMPLETED)
+
+            now = loop.time()
+            for task in done:
+                pending = task.result()
+                if pending.failed:
+                    yield self.finish(pending, 'failed', now)
+                elif pending.payload is not None:
+                    yield self.finish(pending, 'response', now)
+                elif now - pending.sentAt >= self.timeout:
+                    yield self.finish(pending, 'timeout', now)
+                else:
+                    # No answer yet, so wait a little longer before asking again
+                    pending.interval = min(pending.interval * self.backoff, self.maxInterval)
+                    nextPoll = min(now + pending.interval, pending.sentAt + self.timeout)
+                    heapq.heappush(schedule, (nextPoll, order, pending))
+                    order += 1
+#---end BatchCommand
+
+
+# Run a batch from blocking code and return the results in the order
+# they completed. Options are passed on to BatchCommand.
+#   concurrency: max number of calls in flight at once
+#   rate: max number of calls per second across the whole batch
+def runBatch(kind, sensorIds, concurrency=50, rate=50, **options):
+    async def run():
+        budget = AsyncREST.RequestBudget(rate)
+        async with AsyncREST.AsyncRestClient(concurrency=concurrency, budget=budget) as client:
+            batch = BatchCommand(client, kind, sensorIds, **options)
+            return [result async for result in batch.results()]
+    return asyncio.run(run())
+#---end runBatch
@@ -0,0 +1,160 @@
+# --------------------------------------------------#
+# MQTT driven command tracking                      #
+# File: CommandTracker.py                           #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Sends ping / BIST over REST, then waits on the    #
+# MQTT subscription instead of calling *-response   #
+# once a second. As soon as an uplink for the       #
+# sensor arrives the response is fetched once and   #
+# the command resolves. REST polling is only used   #
+# as a sparse fallback when nothing arrives.        #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import concurrent.futures
+import json # Used to build the params for each sensor
+import threading
+import time
+
+from . import REST # Sends the commands and fetches the responses
+from . import MQTT # Delivers the uplinks
+
+
+# Command that has been sent and is waiting on a response
+#   status: 'pending', 'response', 'timeout' or 'failed'
+#   payload: the decoded *-response list once status is 'response'
+#   error: the REST.PlacePodError once status is 'failed'
+#   polls: number of *-response calls made for this command
+class TrackedCommand(object):
+    def __init__(self, kind, sensorId, timeStr):
+        self.kind = kind
+        self.sensorId = sensorId
+        self.timeStr = timeStr
+        self.sentAt = REST.parseTime(timeStr)
+        self.status = 'pending'
+        self.payload = None
+        self.polls = 0
+        self.error = None
+        self.done = threading.Event()
+#---end TrackedCommand
+
+
+# Example:
+#   tracker = CommandTracker()
+#   tracker.attach()
+#   client = MQTT.connect()
+#   client.loop_start()
+#   command = tracker.ping(sensorId)
+#   if command.status == 'response':
+#       print(command.payload)
+#
+#   timeout: seconds to wait on a response before giving up
+#   fallbackInterval: seconds without a matching uplink before *-response
+#                     is called anyway
+#   workers: number of threads fetching responses, so REST calls never run
+#            on the MQTT network thread
+class CommandTracker(object):
+    def __init__(self, timeout=300, fallbackInterval=60, workers=4):
+        self.timeout = timeout
+        self.fallbackInterval = fallbackInterval
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+
+    # Start/stop receiving uplinks from MQTT.py
+    def attach(self):
+        MQTT.addEventHandler(MQTT.CarPresenceEvent, self.onMessage)
+
+    def detach(self):
+        MQTT.removeEventHandler(MQTT.CarPresenceEvent, self.onMessage)
+
+    # Send a command to a sensor and start tracking it. Returns the
+    # TrackedCommand, raises a REST.PlacePodError if it couldn't be sent.
+    def send(self, kind, sensorId):
+        commandPath = REST.COMMAND_CALLS[kind][0]
+        sensorId = str(sensorId)
+        command = TrackedCommand(kind, sensorId, REST.commandTime())
+        # Register before sending so an uplink that beats the post isn't missed
+        with self.lock:
+            self.pending.setdefault(sensorId, []).append(command)
+        try:
+            REST.post(commandPath, json.dumps({'sensorId': sensorId}))
+        except REST.PlacePodError as error:
+            command.status = 'failed'
+            command.error = error
+            self.resolve(command)
+            raise
+        return command
+
+    # Block until the command resolves. Falls back on calling *-response
+    # every fallbackInterval seconds if no uplink arrives for the sensor.
+    def wait(self, command):
+        deadline = time.monotonic() + self.timeout
+        while not command.done.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                command.status = 'timeout'
+                self.resolve(command)
+                break
+            if not command.done.wait(min(self.fallbackInterval, remaining)):
+                self.check(command)
+        return command
+
+    def ping(self, sensorId):
+        return self.wait(self.send('ping', sensorId))
+
+    def bist(self, sensorId):
+        return self.wait(self.send('bist', sensorId))
+
+    # Called by MQTT.py with every CarPresenceEvent. Only hands the check off
+    # to a worker, the network thread must not wait on REST calls.
+    def onMessage(self, event):
+        sensorId = event.sensorId
+        if sensorId is None:
+            return
+        with self.lock:
+            commands = list(self.pending.get(sensorId, ()))
+        if not commands:
+            return
+        # Retained packets from before the command can't be the answer
+        uplinkTime = event.serverTime
+        for command in commands:
+            if uplinkTime is None or uplinkTime >= command.sentAt:
+                self.executor.submit(self.check, command)
+
+    # Call *-response once and resolve the command if the sensor answered
+    def check(self, command):
+        if command.done.is_set():
+            return
+        responsePath = REST.COMMAND_CALLS[command.kind][1]
+        command.polls += 1
+        try:
+            result = REST.get(responsePath + command.sensorId + "/" + command.timeStr)
+        except REST.PlacePodError as error:
+            command.status = 'failed'
+            command.error = error
+            self.resolve(command)
+            return
+        payload = REST.commandResponse(result)
+        if payload is not None:
+            command.payload = payload
+            command.status = 'response'
+            self.resolve(command)
+
+    # Stop tracking a command and wake up anything waiting on it
+    def resolve(self, command):
+        with self.lock:
+            commands = self.pending.get(command.sensorId, [])
+            if command in commands:
+                commands.remove(command)
+            if not commands:
+                self.pending.pop(command.sensorId, None)
+        command.done.set()
+
+    def close(self):
+        self.detach()
+        self.executor.shutdown(wait=False)
+#---end CommandTracker
+
@@ -0,0 +1,252 @@
+# --------------------------------------------------#
+# MQTT duplicate suppression and reordering         #
+# File: Dedupe.py                                   #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Message retain is on, so every reconnect replays  #
+# the last packet of every sensor. DuplicateFilter  #
+# drops packets already seen (same sensorId,        #
+# SENtralTime and ServerTime) and ReorderBuffer     #
+# holds Car Presence events for a short window so   #
+# each sensor's events come out in ServerTime       #
+# order. Both are stages for MQTT.setStage.         #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import collections
+import heapq
+import itertools
+import threading
+import time
+
+from . import MQTT # Event types and deliver()
+
+
+# What makes two Car Presence packets the same uplink. None for packets that
+# can't be told apart, which are never dropped.
+def duplicateKey(event):
+    if type(event) is not MQTT.CarPresenceEvent:
+        return None
+    if event.sentralTime is None and event.serverTime is None:
+        return None
+    return (event.sensorId, event.sentralTime, event.serverTime)
+#---end duplicateKey
+
+
+# Example:
+#   MQTT.setStage(DuplicateFilter(maxSize=100000))
+#
+#   downstream: called with every event that isn't a duplicate, MQTT.deliver
+#               by default
+#   maxSize: keys remembered, the least recently seen is forgotten first. A
+#            few per sensor is enough to cover a reconnect's replay.
+class DuplicateFilter(object):
+    def __init__(self, downstream=None, maxSize=100000):
+        self.downstream = MQTT.deliver if downstream is None else downstream
+        self.maxSize = maxSize
+        self.seen = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.passed = 0
+        self.duplicates = 0
+
+    def __call__(self, event):
+        key = duplicateKey(event)
+        if key is not None:
+            with self.lock:
+                if key in self.seen:
+                    self.seen.move_to_end(key)
+                    self.duplicates += 1
+                    return
+                self.seen[key] = None
+                if len(self.seen) > self.maxSize:
+                    self.seen.popitem(last=False)
+                self.passed += 1
+        self.downstream(event)
+
+    def stats(self):
+        with self.lock:
+            return {'passed': self.passed, 'duplicates': self.duplicates, 'keys': len(self.seen)}
+#---end DuplicateFilter
+
+
+# Example:
+#   buffer = ReorderBuffer(window=2.0).start()
+#   MQTT.setStage(DuplicateFilter(buffer))
+#
+# Each Car Presence event is held until it has waited 'window' seconds, and a
+# sensor's events are let out in ServerTime order. An event whose ServerTime
+# is before one already let out for the same sensor arrived more than a
+# window late. Other events, and events without a ServerTime, go straight
+# through.
+# Events are passed downstream after the buffer's lock is let go, so
+# handlers for different sensors run at the same time on the MessageQueue
+# workers. Only one thread at a time delivers a given sensor's events, so
+# they still never overtake each other.
+#   window: seconds an event is held for
+#   downstream: called with the events in order, MQTT.deliver by default
+#   dropLate: drop events that arrive too late to be put in order, otherwise
+#             they are passed on as soon as they arrive
+#   maxSensors: sensors whose last ServerTime is remembered to spot late events
+class ReorderBuffer(object):
+    def __init__(self, window=2.0, downstream=None, dropLate=True, maxSensors=100000):
+        self.window = window
+        self.downstream = MQTT.deliver if downstream is None else downstream
+        self.dropLate = dropLate
+        self.maxSensors = maxSensors
+        # sensorId -> heap of (serverTime, sequence, time it arrived, event)
+        self.held = {}
+        # sensorId -> largest ServerTime in its heap
+        self.newest = {}
+        # Heap of (time it can be let out, sequence, sensorId) for every held event
+        self.due = []
+        # sensorId -> ServerTime of the last event let out, least recent first
+        self.lastOut = collections.OrderedDict()
+        # sensorId -> events let out but not passed downstream yet
+        self.outbox = {}
+        # Sensors whose outbox a thread is passing downstream
+        self.delivering = set()
+        self.sequence = itertools.count()
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.thread = None
+        self.pending = 0
+        self.reordered = 0
+        self.late = 0
+
+    def __call__(self, event):
+        if type(event) is not MQTT.CarPresenceEvent or event.serverTime is None:
+            self.downstream(event)
+            return
+        now = time.monotonic()
+        with self.lock:
+            last = self.lastOut.get(event.sensorId)
+            late = last is not None and event.serverTime < last
+            if late:
+                self.late += 1
+            else:
+                held = self.held.get(event.sensorId)
+                if held is None:
+                    held = []
+                    self.held[event.sensorId] = held
+                    self.newest[event.sensorId] = event.serverTime
+                elif event.serverTime < self.newest[event.sensorId]:
+                    self.reordered += 1
+                else:
+                    self.newest[event.sensorId] = event.serverTime
+                sequence = next(self.sequence)
+                heapq.heappush(held, (event.serverTime, sequence, now, event))
+                heapq.heappush(self.due, (now + self.window, sequence, event.sensorId))
+                self.pending += 1
+            claimed = self.release(now)
+        if late and not self.dropLate:
+            self.downstream(event)
+        self.deliver(claimed)
+
+    # Move every event whose window has passed to its sensor's outbox, in
+    # ServerTime order. Called with the lock held, returns the sensors the
+    # caller has to deliver.
+    def release(self, now):
+        claimed = []
+        due = self.due
+        while due and due[0][0] <= now:
+            sensorId = heapq.heappop(due)[2]
+            held = self.held.get(sensorId)
+            # An event with an earlier ServerTime that arrived later keeps the
+            # ones behind it waiting until its own window has passed
+            while held and held[0][2] + self.window <= now:
+                self.emit(sensorId, heapq.heappop(held)[3], claimed)
+            if held is not None and not held:
+                del self.held[sensorId]
+                del self.newest[sensorId]
+        return claimed
+
+    # Called with the lock held. The sensor is added to 'claimed' unless
+    # another thread is already delivering its events.
+    def emit(self, sensorId, event, claimed):
+        self.pending -= 1
+        self.lastOut[sensorId] = event.serverTime
+        self.lastOut.move_to_end(sensorId)
+        if len(self.lastOut) > self.maxSensors:
+            self.lastOut.popitem(last=False)
+        outbox = self.outbox.get(sensorId)
+        if outbox is None:
+            outbox = collections.deque()
+            self.outbox[sensorId] = outbox
+        outbox.append(event)
+        if sensorId not in self.delivering:
+            self.delivering.add(sensorId)
+            claimed.append(sensorId)
+
+    # Pass the outboxes of the claimed sensors downstream, without the lock
+    # held. Events another thread lets out for one of them meanwhile are
+    # passed on here too, after the ones before them.
+    def deliver(self, claimed):
+        claimed = list(claimed)
+        try:
+            while claimed:
+                sensorId = claimed[-1]
+                while True:
+                    with self.lock:
+                        outbox = self.outbox[sensorId]
+                        if not outbox:
+                            del self.outbox[sensorId]
+                            self.delivering.discard(sensorId)
+                            break
+                        event = outbox.popleft()
+                    self.downstream(event)
+                claimed.pop()
+        finally:
+            # A handler raised: let another thread deliver what is left
+            if claimed:
+                with self.lock:
+                    self.delivering.difference_update(claimed)
+
+    # Let out what is due. Called on every event, and by start()'s thread so
+    # events also come out when no more arrive.
+    def poll(self):
+        with self.lock:
+            claimed = self.release(time.monotonic())
+        self.deliver(claimed)
+
+    # Let out everything held right away, e.g. before shutting down
+    def flush(self):
+        claimed = []
+        with self.lock:
+            for sensorId in list(self.held):
+                held = self.held.pop(sensorId)
+                del self.newest[sensorId]
+                while held:
+                    self.emit(sensorId, heapq.heappop(held)[3], claimed)
+            self.due = []
+            # Outboxes a handler that raised left behind
+            for sensorId in self.outbox:
+                if sensorId not in self.delivering:
+                    self.delivering.add(sensorId)
+                    claimed.append(sensorId)
+        self.deliver(claimed)
+
+    # Poll from a background thread a few times per window
+    def start(self):
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.pollLoop, daemon=True, name="ReorderBuffer")
+        self.thread.start()
+        return self
+
+    def pollLoop(self):
+        while not self.stopping.wait(self.window / 4):
+            self.poll()
+
+    def stop(self, flush=True):
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if flush:
+            self.flush()
+
+    def stats(self):
+        with self.lock:
+            return {'pending': self.pending, 'reordered': self.reordered, 'late': self.late,
+                    'sensors': len(self.held)}
+#---end ReorderBuffer
@@ -0,0 +1,164 @@
+# --------------------------------------------------#
+# Bulk downlink command dispatcher                  #
+# File: Dispatcher.py                               #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Sends one downlink command (recalibrate, force    #
+# vacant, set wakeup interval, ...) to a whole list #
+# of sensors at once. The posts run concurrently    #
+# under a token bucket rate limit, repeats of the   #
+# same command to the same sensor are skipped, and  #
+# a result is reported for every sensor.            #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import asyncio
+import json # Used to build the params for each sensor
+import time
+
+from . import REST # Error types
+from . import AsyncREST # Shared session, concurrency limit and request budget
+
+
+# The call used by each command and whether it takes a payload
+COMMANDS = {
+    'recalibrate': ("/api/sensor/recalibrate", False),
+    'forceVacant': ("/api/sensor/force-vacant", False),
+    'forceOccupied': ("/api/sensor/force-occupied", False),
+    'setLoraWakeupInterval': ("/api/sensor/set-lora-wakeup-interval", True),
+    'setLoraTxPower': ("/api/sensor/set-lora-tx-power", True),
+    'setTxSpreadingFactor': ("/api/sensor/set-tx-spreading-factor", True),
+    'setFrequencySubBand': ("/api/sensor/set-frequency-sub-band", True),
+}
+
+
+# Outcome of a command for one sensor
+#   status: 'sent', 'failed', or 'duplicate' if the same command had already
+#           been sent to the sensor and was skipped
+#   elapsed: seconds the post took, 0 for duplicates
+#   error: the REST.PlacePodError a failed post raised, e.g. to tell an
+#          UnauthorizedError from a timeout or an open circuit. None otherwise.
+class DispatchResult(object):
+    __slots__ = ('sensorId', 'status', 'elapsed', 'error')
+
+    def __init__(self, sensorId, status, elapsed, error=None):
+        self.sensorId = sensorId
+        self.status = status
+        self.elapsed = elapsed
+        self.error = error
+#---end DispatchResult
+
+# Results of one dispatch keyed by sensor id
+class DispatchReport(object):
+    def __init__(self, command, payload):
+        self.command = command
+        self.payload = payload
+        self.results = {}
+        self.elapsed = 0
+
+    # Number of sensors with each status
+    def counts(self):
+        counts = {'sent': 0, 'failed': 0, 'duplicate': 0}
+        for result in self.results.values():
+            counts[result.status] += 1
+        return counts
+
+    def failed(self):
+        return [sensorId for sensorId, result in self.results.items() if result.status == 'failed']
+
+    # Errors of the failed sensors keyed by sensor id, None where no error
+    # was raised
+    def errors(self):
+        return dict((sensorId, result.error) for sensorId, result in self.results.items()
+                    if result.status == 'failed')
+
+    def summary(self):
+        counts = self.counts()
+        return (self.command + ": " + str(counts['sent']) + " sent, " + str(counts['failed'])
+                + " failed, " + str(counts['duplicate']) + " duplicates in "
+                + "%.1f" % self.elapsed + " seconds")
+#---end DispatchReport
+
+
+# Example:
+#   dispatcher = BulkDispatcher(rate=20, concurrency=50)
+#   report = dispatcher.dispatch('setLoraWakeupInterval', sensorIds, payload=5)
+#   print(report.summary())
+#   retry = dispatcher.dispatch('setLoraWakeupInterval', report.failed(), payload=5)
+#
+#   rate: posts per second allowed on average
+#   burst: posts that may go out at once before the rate applies
+#   concurrency: max number of posts in flight at once
+class BulkDispatcher(object):
+    def __init__(self, rate=10, burst=None, concurrency=20):
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = concurrency
+        # (command, payload, sensorId) of every command already sent, so the
+        # same change isn't queued on a sensor twice
+        self.sent = set()
+
+    # Forget what has been sent, e.g. to deliberately send it again
+    def reset(self):
+        self.sent.clear()
+
+    # Send 'command' to every sensor in sensorIds and return a DispatchReport
+    def dispatch(self, command, sensorIds, payload=None):
+        return asyncio.run(self.dispatchAsync(command, sensorIds, payload))
+
+    # Same as dispatch, for use inside a running event loop. An existing
+    # AsyncRestClient can be passed in to share its session.
+    async def dispatchAsync(self, command, sensorIds, payload=None, client=None):
+        if command not in COMMANDS:
+            raise ValueError("Unknown command: " + str(command))
+        urlPath, needsPayload = COMMANDS[command]
+        if needsPayload and payload is None:
+            raise ValueError(command + " needs a payload")
+
+        report = DispatchReport(command, payload)
+        start = time.monotonic()
+        toSend = []
+        for sensorId in sensorIds:
+            sensorId = str(sensorId)
+            # A sensor listed twice is only sent the command once
+            if sensorId in report.results:
+                continue
+            if (command, payload, sensorId) in self.sent:
+                report.results[sensorId] = DispatchResult(sensorId, 'duplicate', 0)
+            else:
+                report.results[sensorId] = DispatchResult(sensorId, 'failed', 0)
+                toSend.append(sensorId)
+
+        # Charged for every attempt, so retries count against the rate too
+        budget = AsyncREST.RequestBudget(self.rate, self.burst)
+        if client is None:
+            async with AsyncREST.AsyncRestClient(concurrency=self.concurrency) as client:
+                await self.sendAll(client, budget, urlPath, payload, command, toSend, report)
+        else:
+            await self.sendAll(client, budget, urlPath, payload, command, toSend, report)
+        report.elapsed = time.monotonic() - start
+        return report
+
+    async def sendAll(self, client, budget, urlPath, payload, command, sensorIds, report):
+        async def sendOne(sensorId):
+            params = {'sensorId': sensorId}
+            if payload is not None:
+                params['payload'] = payload
+            sentAt = time.monotonic()
+            failure = None
+            try:
+                result = await client.send('POST', urlPath, json.dumps(params), budget)
+            except REST.PlacePodError as error:
+                # One unreachable call shouldn't stop the rest of the batch
+                print("Error: " + sensorId + " - " + str(error))
+                failure = error
+                result = None
+            elapsed = time.monotonic() - sentAt
+            if result is None:
+                report.results[sensorId] = DispatchResult(sensorId, 'failed', elapsed, failure)
+            else:
+                self.sent.add((command, payload, sensorId))
+                report.results[sensorId] = DispatchResult(sensorId, 'sent', elapsed)
+        await asyncio.gather(*[sendOne(sensorId) for sensorId in sensorIds])
+#---end BulkDispatcher
@@ -0,0 +1,402 @@
+# --------------------------------------------------#
+# Micro-batched MQTT event store                    #
+# File: EventSink.py                                #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Persists the events MQTT.py decodes to a local    #
+# SQLite file. Events are grouped into batches by   #
+# size or time and each batch is written in one     #
+# transaction, together with the minute and hour    #
+# rollups it changes, so dashboards can read the    #
+# rollups instead of scanning every event.          #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import sqlite3 # Local storage of the events and rollups
+import threading
+import time
+
+from . import MQTT # Event types and handlers
+from . import HistoryCache # Millisecond time helpers
+from . import HistoryFetcher # Time parsing for the queries
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS car_presence (
+    sensorId TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    carPresence INTEGER,
+    status TEXT,
+    parkingName TEXT,
+    parkingSpace TEXT,
+    sentralTime,
+    temperature REAL,
+    battery REAL,
+    rssi REAL,
+    snr REAL
+);
+CREATE INDEX IF NOT EXISTS car_presence_sensor_time ON car_presence (sensorId, time);
+CREATE TABLE IF NOT EXISTS lot_count (
+    parkingLotId TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    totalNumberOfSpaces INTEGER,
+    availableSpaces INTEGER,
+    adjustedAvailableSpaces INTEGER,
+    parkingLotClosed INTEGER
+);
+CREATE INDEX IF NOT EXISTS lot_count_lot_time ON lot_count (parkingLotId, time);
+CREATE TABLE IF NOT EXISTS sensor_rollup (
+    sensorId TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    events INTEGER NOT NULL,
+    occupiedEvents INTEGER NOT NULL,
+    arrivals INTEGER NOT NULL,
+    departures INTEGER NOT NULL,
+    lastTime INTEGER NOT NULL,
+    lastCarPresence INTEGER,
+    PRIMARY KEY (sensorId, resolution, bucket)
+);
+CREATE TABLE IF NOT EXISTS lot_rollup (
+    parkingLotId TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    occupiedSum INTEGER NOT NULL,
+    occupiedMin INTEGER NOT NULL,
+    occupiedMax INTEGER NOT NULL,
+    lastTime INTEGER NOT NULL,
+    lastOccupied INTEGER NOT NULL,
+    totalNumberOfSpaces INTEGER,
+    PRIMARY KEY (parkingLotId, resolution, bucket)
+);
+"""
+
+# Rollup resolutions and their bucket length in milliseconds
+RESOLUTIONS = (('minute', 60 * 1000), ('hour', 60 * 60 * 1000))
+
+# CarPresence values of a space with a car in it: entering, parked, leaving
+OCCUPIED = (2, 3, 4)
+ENTERING = 2
+LEAVING = 4
+
+SENSOR_ROLLUP_UPSERT = """
+INSERT INTO sensor_rollup (sensorId, resolution, bucket, events, occupiedEvents, arrivals,
+                           departures, lastTime, lastCarPresence)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (sensorId, resolution, bucket) DO UPDATE SET
+    events = events + excluded.events,
+    occupiedEvents = occupiedEvents + excluded.occupiedEvents,
+    arrivals = arrivals + excluded.arrivals,
+    departures = departures + excluded.departures,
+    lastCarPresence = CASE WHEN excluded.lastTime >= lastTime
+                           THEN excluded.lastCarPresence ELSE lastCarPresence END,
+    lastTime = max(lastTime, excluded.lastTime)
+"""
+
+LOT_ROLLUP_UPSERT = """
+INSERT INTO lot_rollup (parkingLotId, resolution, bucket, samples, occupiedSum, occupiedMin,
+                        occupiedMax, lastTime, lastOccupied, totalNumberOfSpaces)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (parkingLotId, resolution, bucket) DO UPDATE SET
+    samples = samples + excluded.samples,
+    occupiedSum = occupiedSum + excluded.occupiedSum,
+    occupiedMin = min(occupiedMin, excluded.occupiedMin),
+    occupiedMax = max(occupiedMax, excluded.occupiedMax),
+    lastOccupied = CASE WHEN excluded.lastTime >= lastTime
+                        THEN excluded.lastOccupied ELSE lastOccupied END,
+    totalNumberOfSpaces = CASE WHEN excluded.lastTime >= lastTime
+                               THEN excluded.totalNumberOfSpaces ELSE totalNumberOfSpaces END,
+    lastTime = max(lastTime, excluded.lastTime)
+"""
+
+
+# Example:
+#   sink = EventSink("events.db", batchSize=1000, batchInterval=1.0)
+#   sink.attach()
+#   client = MQTT.connect()
+#   client.loop_forever()
+#   ...
+#   rows = sink.lotRollups(lotId, 'minute', '2017-09-01T08:00:00Z', '2017-09-01T10:00:00Z')
+#
+# Car Presence events go to car_presence and the sensor_rollup table, Parking
+# Lot Count events to lot_count and the lot_rollup table. A rollup row covers
+# one minute or hour bucket (start time in milliseconds since the epoch).
+# Car Presence events are placed by ServerTime, or GatewayTime if they have
+# no ServerTime:
+#   sensor_rollup: events, occupiedEvents (CarPresence 2-4), arrivals
+#                  (CarPresence 2), departures (CarPresence 4), lastCarPresence
+#   lot_rollup: samples, occupiedSum / occupiedMin / occupiedMax (spaces taken,
+#               average is occupiedSum / samples), lastOccupied
+#
+#   path: SQLite file to write to
+#   batchSize: events written by one transaction at most
+#   batchInterval: seconds an event may wait for its batch to fill up
+#   maxPending: events waiting on a write before add() blocks, which slows
+#               down the MQTT workers instead of using up memory
+#   retries / retryDelay: times a batch that couldn't be written is tried
+#                         again, waiting retryDelay seconds (doubling) in
+#                         between. A batch that still fails is counted in
+#                         stats()['failed'] and the error kept in self.error.
+class EventSink(object):
+    def __init__(self, path="events.db", batchSize=1000, batchInterval=1.0, maxPending=None,
+                 retries=3, retryDelay=0.5):
+        self.path = path
+        self.batchSize = batchSize
+        self.batchInterval = batchInterval
+        self.maxPending = batchSize * 10 if maxPending is None else maxPending
+        self.retries = retries
+        self.retryDelay = retryDelay
+        self.pending = []
+        self.firstPendingAt = None
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+        self.closed = False
+        # Counters, see stats()
+        self.batches = 0
+        self.written = 0
+        self.failed = 0
+        self.lastBatchSeconds = 0.0
+        self.writing = 0
+        self.error = None
+        db = self.connect()
+        db.executescript(SCHEMA)
+        db.close()
+        self.thread = threading.Thread(target=self.writeLoop, daemon=True, name="EventSink")
+        self.thread.start()
+
+    def connect(self):
+        db = sqlite3.connect(self.path)
+        # Readers don't block the writer, and a commit doesn't wait on fsync
+        # of the whole database
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    # Start / stop receiving every event MQTT.py dispatches
+    def attach(self):
+        MQTT.addMessageHandler(self.add)
+        return self
+
+    def detach(self):
+        MQTT.removeMessageHandler(self.add)
+
+    # Queue an event for the next batch
+    def add(self, event):
+        with self.lock:
+            while len(self.pending) >= self.maxPending and not self.closed:
+                self.changed.wait()
+            if self.closed:
+                raise ValueError("EventSink is closed")
+            self.pending.append((event, nowMillis()))
+            if len(self.pending) == 1:
+                # Start the batch interval of the writer
+                self.firstPendingAt = time.monotonic()
+                self.changed.notify_all()
+            elif len(self.pending) >= self.batchSize:
+                self.changed.notify_all()
+
+    # Writer thread: take a batch once it is full or its oldest event has
+    # waited batchInterval, and write it
+    def writeLoop(self):
+        db = self.connect()
+        try:
+            while True:
+                with self.lock:
+                    while True:
+                        if len(self.pending) >= self.batchSize or (self.closed and self.pending):
+                            break
+                        if self.closed:
+                            return
+                        if self.pending:
+                            wait = self.firstPendingAt + self.batchInterval - time.monotonic()
+                            if wait <= 0:
+                                break
+                            self.changed.wait(wait)
+                        else:
+                            self.changed.wait()
+                    batch = self.pending[:self.batchSize]
+                    del self.pending[:self.batchSize]
+                    self.firstPendingAt = time.monotonic() if self.pending else None
+                    self.writing = len(batch)
+                    self.changed.notify_all()
+                start = time.perf_counter()
+                error = self.writeWithRetries(db, batch)
+                with self.lock:
+                    self.writing = 0
+                    if error is None:
+                        self.batches += 1
+                        self.written += len(batch)
+                    else:
+                        self.failed += len(batch)
+                        self.error = error
+                    self.lastBatchSeconds = time.perf_counter() - start
+                    self.changed.notify_all()
+        finally:
+            db.close()
+
+    # Write a batch, trying again if it fails, e.g. because another
+    # connection holds the database lock. Returns the last error, None once
+    # the batch is written.
+    def writeWithRetries(self, db, batch):
+        delay = self.retryDelay
+        for attempt in range(0, self.retries + 1):
+            try:
+                self.write(db, batch)
+                return None
+            except sqlite3.Error as error:
+                lastError = error
+                if attempt < self.retries:
+                    time.sleep(delay)
+                    delay *= 2
+        print("Error: couldn't write " + str(len(batch)) + " events - " + str(lastError))
+        return lastError
+
+    # Write one batch and the rollups it changes in a single transaction.
+    # A failed write rolls back, so the batch can be written again.
+    def write(self, db, batch):
+        carRows = []
+        lotRows = []
+        sensorRollups = {}
+        lotRollups = {}
+        for event, receivedAt in batch:
+            if type(event) is MQTT.CarPresenceEvent:
+                # ServerTime is the canonical time, gateway clocks can drift
+                eventTime = event.serverTime or event.gatewayTime
+                millis = receivedAt if eventTime is None else HistoryCache.toMillis(eventTime)
+                carRows.append((event.sensorId, millis, event.carPresence, event.status,
+                                event.parkingName, event.parkingSpace, event.sentralTime,
+                                event.temperature, event.battery, event.rssi, event.snr))
+                addSensorRollup(sensorRollups, event, millis)
+            elif type(event) is MQTT.LotCountEvent:
+                # Lot count packets don't carry a time, use when they arrived
+                lotRows.append((event.parkingLotId, receivedAt, event.totalNumberOfSpaces,
+                                event.availableSpaces, event.adjustedAvailableSpaces,
+                                event.parkingLotClosed))
+                addLotRollup(lotRollups, event, receivedAt)
+        with db:
+            db.executemany("INSERT INTO car_presence VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                           carRows)
+            db.executemany("INSERT INTO lot_count VALUES (?, ?, ?, ?, ?, ?)", lotRows)
+            db.executemany(SENSOR_ROLLUP_UPSERT,
+                           [key + tuple(values) for key, values in sensorRollups.items()])
+            db.executemany(LOT_ROLLUP_UPSERT,
+                           [key + tuple(values) for key, values in lotRollups.items()])
+
+    # Wait until everything added so far has been written. Returns False on
+    # timeout or if any of it couldn't be written.
+    def flush(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.lock:
+            failed = self.failed
+            # Don't wait out the batch interval
+            self.firstPendingAt = time.monotonic() - self.batchInterval if self.pending else None
+            self.changed.notify_all()
+            while (self.pending or self.writing) and self.thread.is_alive():
+                wait = None if deadline is None else deadline - time.monotonic()
+                if wait is not None and wait <= 0:
+                    return False
+                self.changed.wait(wait)
+            return self.failed == failed
+
+    # Write what is left and stop the writer thread
+    def close(self, timeout=None):
+        self.detach()
+        with self.lock:
+            self.closed = True
+            self.changed.notify_all()
+        self.thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        self.close()
+
+    # Batches written, events written, events waiting and how long the last
+    # batch took
+    def stats(self):
+        with self.lock:
+            return {'batches': self.batches, 'written': self.written, 'failed': self.failed,
+                    'pending': len(self.pending) + self.writing,
+                    'lastBatchSeconds': self.lastBatchSeconds,
+                    'error': None if self.error is None else str(self.error)}
+
+    #--------------------------------Rollup queries----------------------------------
+    # Rows are dictionaries in bucket order, for startTime..endTime (end
+    # exclusive, ISO 8601 strings or datetimes). They are read with their own
+    # connection, so they can run while events are being written.
+
+    def sensorRollups(self, sensorId, resolution, startTime, endTime):
+        return self.query("SELECT * FROM sensor_rollup WHERE sensorId = ? AND resolution = ?"
+                          + " AND bucket >= ? AND bucket < ? ORDER BY bucket",
+                          sensorId, resolution, startTime, endTime)
+
+    def lotRollups(self, parkingLotId, resolution, startTime, endTime):
+        return self.query("SELECT * FROM lot_rollup WHERE parkingLotId = ? AND resolution = ?"
+                          + " AND bucket >= ? AND bucket < ? ORDER BY bucket",
+                          parkingLotId, resolution, startTime, endTime)
+
+    def query(self, sql, key, resolution, startTime, endTime):
+        if resolution not in dict(RESOLUTIONS):
+            raise ValueError("resolution must be one of "
+                             + ", ".join(name for name, length in RESOLUTIONS))
+        db = sqlite3.connect(self.path)
+        try:
+            db.row_factory = sqlite3.Row
+            rows = db.execute(sql, (key, resolution,
+                                    HistoryCache.toMillis(HistoryFetcher.toDatetime(startTime)),
+                                    HistoryCache.toMillis(HistoryFetcher.toDatetime(endTime))))
+            return [dict(row) for row in rows]
+        finally:
+            db.close()
+#---end EventSink
+
+
+# Fold a Car Presence event into the batch's sensor rollups, keyed by
+# (sensorId, resolution, bucket)
+def addSensorRollup(rollups, event, millis):
+    carPresence = event.carPresence
+    for resolution, length in RESOLUTIONS:
+        key = (event.sensorId, resolution, millis - millis % length)
+        values = rollups.get(key)
+        if values is None:
+            # events, occupiedEvents, arrivals, departures, lastTime, lastCarPresence
+            values = [0, 0, 0, 0, millis, carPresence]
+            rollups[key] = values
+        values[0] += 1
+        values[1] += carPresence in OCCUPIED
+        values[2] += carPresence == ENTERING
+        values[3] += carPresence == LEAVING
+        if millis >= values[4]:
+            values[4] = millis
+            values[5] = carPresence
+#---end addSensorRollup
+
+# Fold a Parking Lot Count event into the batch's lot rollups, keyed by
+# (parkingLotId, resolution, bucket)
+def addLotRollup(rollups, event, millis):
+    if event.totalNumberOfSpaces is None or event.availableSpaces is None:
+        return
+    occupied = event.totalNumberOfSpaces - event.availableSpaces
+    for resolution, length in RESOLUTIONS:
+        key = (event.parkingLotId, resolution, millis - millis % length)
+        values = rollups.get(key)
+        if values is None:
+            # samples, occupiedSum, occupiedMin, occupiedMax, lastTime,
+            # lastOccupied, totalNumberOfSpaces
+            values = [0, 0, occupied, occupied, millis, occupied, event.totalNumberOfSpaces]
+            rollups[key] = values
+        values[0] += 1
+        values[1] += occupied
+        values[2] = min(values[2], occupied)
+        values[3] = max(values[3], occupied)
+        if millis >= values[4]:
+            values[4] = millis
+            values[5] = occupied
+            values[6] = event.totalNumberOfSpaces
+#---end addLotRollup
+
+def nowMillis():
+    return int(time.time() * 1000)
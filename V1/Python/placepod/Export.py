@@ -0,0 +1,318 @@
+# --------------------------------------------------#
+# Headless fleet export                             #
+# File: Export.py                                   #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Non-interactive command line export of parking    #
+# lots, gateways, sensors and sensor history for a  #
+# date range to NDJSON or CSV files. History is     #
+# fetched for several sensors at once, and a        #
+# checkpoint file lets an interrupted export pick   #
+# up where it stopped.                              #
+#                                                   #
+# Usage: python -m placepod.Export                  #
+#        --start 2017-09-01                         #
+#        --end 2017-09-02 --output export           #
+#        [--format csv] [--concurrency 16]          #
+# The API key is read from --api-key or the         #
+# PLACEPOD_API_KEY environment variable.            #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import argparse
+import concurrent.futures
+import contextlib
+import csv
+import datetime
+import json
+import os
+import sys
+
+from . import REST # Lists, pooled transport and models
+from . import HistoryFetcher # Windowed history with retries
+
+
+# Fields written for each model. The Sensor model spells gatewayTime as
+# gateWayTime, the export uses the api's name.
+FIELDS = {
+    'parkingLots': ('id', 'name'),
+    'gateways': ('id', 'gatewayMac', 'name', 'parkingLotId'),
+    'sensors': ('sensorId', 'parkingSpace', 'parkingLot', 'status', 'carPresence', 'gatewayTime',
+                'sentralTime', 'temperature', 'battery', 'lat', 'lon', 'network', 'parkingLotId'),
+}
+FIELDS['history'] = FIELDS['sensors']
+
+FORMATS = ('ndjson', 'csv')
+
+
+# Model object as a dictionary of the exported fields
+def toRow(model, fields):
+    row = {}
+    for field in fields:
+        row[field] = getattr(model, 'gateWayTime' if field == 'gatewayTime' else field)
+    return row
+#---end toRow
+
+
+# Appends rows to an NDJSON or CSV file. Rows are only guaranteed to be on
+# disk once sync() returns.
+class RowWriter(object):
+    def __init__(self, path, fields, format):
+        self.fields = fields
+        self.format = format
+        self.file = open(path, 'a', encoding='utf_8', newline='')
+        self.csv = None
+        if format == 'csv':
+            self.csv = csv.DictWriter(self.file, fieldnames=fields)
+            if self.file.tell() == 0:
+                self.csv.writeheader()
+
+    def write(self, row):
+        if self.csv is not None:
+            self.csv.writerow(row)
+        else:
+            self.file.write(json.dumps(row) + "\n")
+
+    # Flush to disk and return the size of the file
+    def sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return self.file.tell()
+
+    def close(self):
+        self.file.close()
+#---end RowWriter
+
+
+# Append-only record of the export's progress. The first line describes the
+# export, every other line is a sensor whose history has been written along
+# with the size of the history file after it.
+class Checkpoint(object):
+    def __init__(self, path, settings):
+        self.path = path
+        self.settings = settings
+        self.listsDone = False
+        self.done = set()
+        self.historyBytes = 0
+        self.file = None
+
+    # Load the progress of an earlier run. Returns False if there is none.
+    # Raises ValueError if the earlier run was a different export.
+    def load(self):
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, encoding='utf_8') as file:
+            lines = file.read().split("\n")
+        if json.loads(lines[0]) != self.settings:
+            raise ValueError(self.path + " is from an export with different settings,"
+                             + " use --restart to start over")
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # The last line may have been cut off
+                continue
+            if entry.get('lists'):
+                self.listsDone = True
+            if 'sensorId' in entry:
+                self.done.add(entry['sensorId'])
+                self.historyBytes = max(self.historyBytes, entry['historyBytes'])
+        return True
+
+    def open(self):
+        exists = os.path.exists(self.path)
+        self.file = open(self.path, 'a', encoding='utf_8')
+        if not exists:
+            self.append(self.settings)
+
+    def append(self, entry):
+        self.file.write(json.dumps(entry) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def markLists(self):
+        self.listsDone = True
+        self.append({'lists': True})
+
+    def markSensor(self, sensorId, historyBytes):
+        self.done.add(sensorId)
+        self.historyBytes = historyBytes
+        self.append({'sensorId': sensorId, 'historyBytes': historyBytes})
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+#---end Checkpoint
+
+
+# Example:
+#   export = FleetExport("export", '2017-09-01', '2017-09-02', format='csv', concurrency=16)
+#   failed = export.run()
+#
+#   output: directory the files are written to
+#   format: 'ndjson' or 'csv'
+#   concurrency: number of sensors whose history is fetched at once
+#   window: length of time fetched by a single history call
+#   sensorIds: only export the history of these sensors, all sensors if None
+#   restart: ignore an existing checkpoint and export everything again
+class FleetExport(object):
+    def __init__(self, output, startTime, endTime, format='ndjson', concurrency=8,
+                 window=datetime.timedelta(days=1), sensorIds=None, restart=False, log=sys.stderr):
+        if format not in FORMATS:
+            raise ValueError("format must be one of " + ", ".join(FORMATS))
+        self.output = output
+        self.start = HistoryFetcher.toDatetime(startTime)
+        self.end = HistoryFetcher.toDatetime(endTime)
+        self.format = format
+        self.concurrency = concurrency
+        self.fetcher = HistoryFetcher.HistoryFetcher(window=window, workers=1)
+        self.sensorIds = sensorIds
+        self.restart = restart
+        self.log = log
+
+    def path(self, name):
+        return os.path.join(self.output, name + "." + self.format)
+
+    def message(self, text):
+        print(text, file=self.log)
+
+    # Run the export and return the ids of the sensors whose history couldn't
+    # be fetched. Running it again picks up where it stopped.
+    def run(self):
+        os.makedirs(self.output, exist_ok=True)
+        settings = {'start': HistoryFetcher.formatTime(self.start),
+                    'end': HistoryFetcher.formatTime(self.end), 'format': self.format}
+        checkpoint = Checkpoint(os.path.join(self.output, "checkpoint.json"), settings)
+        if self.restart:
+            paths = [self.path(name) for name in FIELDS] + [checkpoint.path]
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
+        elif checkpoint.load():
+            self.message("Resuming export: " + str(len(checkpoint.done)) + " sensors already done")
+        checkpoint.open()
+        try:
+            sensors = REST.getSensors()
+            if not checkpoint.listsDone:
+                self.writeList('parkingLots', REST.getParkingLots())
+                self.writeList('gateways', REST.getGateways())
+                self.writeList('sensors', sensors)
+                checkpoint.markLists()
+            sensorIds = self.sensorIds
+            if sensorIds is None:
+                sensorIds = [sensor.sensorId for sensor in sensors or ()]
+            todo = [sensorId for sensorId in sensorIds if sensorId not in checkpoint.done]
+            return self.writeHistory(todo, checkpoint)
+        finally:
+            checkpoint.close()
+
+    def writeList(self, name, models):
+        # Lists are written in one go, so start the file over on a rerun
+        if os.path.exists(self.path(name)):
+            os.remove(self.path(name))
+        writer = RowWriter(self.path(name), FIELDS[name], self.format)
+        try:
+            for model in models or ():
+                writer.write(toRow(model, FIELDS[name]))
+            writer.sync()
+        finally:
+            writer.close()
+        self.message("Wrote " + str(len(models or ())) + " " + name)
+
+    def fetchHistory(self, sensorId):
+        return list(self.fetcher.fetch(sensorId, self.start, self.end))
+
+    # Fetch history for up to 'concurrency' sensors at once and append each
+    # sensor's rows as soon as they are in, recording it in the checkpoint
+    def writeHistory(self, sensorIds, checkpoint):
+        path = self.path('history')
+        # Drop rows written after the last checkpointed sensor, the sensor
+        # they belong to will be fetched again
+        if os.path.exists(path) and os.path.getsize(path) > checkpoint.historyBytes:
+            with open(path, 'r+b') as file:
+                file.truncate(checkpoint.historyBytes)
+        writer = RowWriter(path, FIELDS['history'], self.format)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency)
+        failed = []
+        pending = {}
+        remaining = iter(sensorIds)
+        written = 0
+        try:
+            while True:
+                # Only keep a couple of sensors per worker queued, so the
+                # fetched rows waiting to be written stay bounded
+                for sensorId in remaining:
+                    pending[executor.submit(self.fetchHistory, sensorId)] = sensorId
+                    if len(pending) >= self.concurrency * 2:
+                        break
+                if not pending:
+                    break
+                done, notDone = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    sensorId = pending.pop(future)
+                    try:
+                        rows = future.result()
+                    except (HistoryFetcher.HistoryError, REST.PlacePodError) as error:
+                        self.message("Error: " + sensorId + " - " + str(error))
+                        failed.append(sensorId)
+                        continue
+                    for sensor in rows:
+                        writer.write(toRow(sensor, FIELDS['history']))
+                    checkpoint.markSensor(sensorId, writer.sync())
+                    written += 1
+                    if written % 100 == 0:
+                        self.message("History written for " + str(written) + " of "
+                                     + str(len(sensorIds)) + " sensors")
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            writer.close()
+        self.message("History written for " + str(written) + " sensors, "
+                     + str(len(failed)) + " failed")
+        return failed
+#---end FleetExport
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Export PlacePod parking lots, gateways, sensors and sensor history")
+    parser.add_argument('--start', required=True, help="start of the history range, ISO 8601")
+    parser.add_argument('--end', required=True, help="end of the history range (exclusive), ISO 8601")
+    parser.add_argument('--output', default="export", help="directory to write the files to")
+    parser.add_argument('--format', choices=FORMATS, default='ndjson')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help="number of sensors whose history is fetched at once")
+    parser.add_argument('--window-hours', type=float, default=24,
+                        help="hours of history fetched by a single call")
+    parser.add_argument('--sensor', action='append', dest='sensorIds',
+                        help="only export the history of this sensor, can be repeated")
+    parser.add_argument('--restart', action='store_true', help="ignore the checkpoint and start over")
+    parser.add_argument('--server', default=os.environ.get('PLACEPOD_API_SERVER', REST.API_SERVER))
+    parser.add_argument('--api-key', default=os.environ.get('PLACEPOD_API_KEY', REST.API_KEY))
+    parser.add_argument('--verbose', action='store_true', help="show the REST client's output")
+    args = parser.parse_args(argv)
+
+    if args.api_key == '':
+        print("API key not set! Use --api-key or PLACEPOD_API_KEY", file=sys.stderr)
+        return 2
+    REST.setClient(REST.RestClient(args.server, args.api_key, poolSize=args.concurrency))
+
+    export = FleetExport(args.output, args.start, args.end, args.format, args.concurrency,
+                         datetime.timedelta(hours=args.window_hours), args.sensorIds, args.restart)
+    try:
+        with contextlib.ExitStack() as stack:
+            # The REST functions print every step, which is only noise here
+            if not args.verbose:
+                stack.enter_context(contextlib.redirect_stdout(stack.enter_context(open(os.devnull, 'w'))))
+            failed = export.run()
+    except (REST.PlacePodError, ValueError) as error:
+        print("Error: " + str(error), file=sys.stderr)
+        return 1
+    # Rerunning the same command retries the sensors that failed
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+# --------------------------------------------------#
+# Indexed fleet snapshot                            #
+# File: Fleet.py                                    #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Holds the sensors, parking lots and gateways from #
+# getSensors / getParkingLots / getGateways with    #
+# hash indexes on the fields that get looked up, so #
+# questions like "vacant sensors in lot X" or       #
+# "sensor for Space #54" don't scan every object.   #
+# A refresh only touches the index entries of the   #
+# objects that changed.                             #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import threading
+
+from . import REST # Fetches the lists
+
+
+# Objects of one type keyed by a unique field, with an index for each of
+# 'indexFields' mapping a field value to the keys of the objects that have it
+class Table(object):
+    def __init__(self, keyField, indexFields):
+        self.keyField = keyField
+        self.indexFields = indexFields
+        self.rows = {}
+        self.indexes = {}
+        for field in indexFields:
+            self.indexes[field] = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def get(self, key):
+        return self.rows.get(key)
+
+    # Objects whose 'field' equals 'value'
+    def find(self, field, value):
+        return [self.rows[key] for key in self.indexes[field].get(value, ())]
+
+    # Keys of the objects whose 'field' equals 'value'
+    def keys(self, field, value):
+        return self.indexes[field].get(value, set())
+
+    # Add or replace one object, only moving the index entries that changed.
+    # Returns True if anything changed.
+    def put(self, row):
+        key = getattr(row, self.keyField)
+        old = self.rows.get(key)
+        self.rows[key] = row
+        if old is None:
+            for field in self.indexFields:
+                self.indexes[field].setdefault(getattr(row, field), set()).add(key)
+            return True
+        changed = False
+        for field in self.indexFields:
+            oldValue = getattr(old, field)
+            newValue = getattr(row, field)
+            if oldValue != newValue:
+                self.unindex(field, oldValue, key)
+                self.indexes[field].setdefault(newValue, set()).add(key)
+                changed = True
+        return changed or any(getattr(old, name) != getattr(row, name) for name in row.__slots__)
+
+    def remove(self, key):
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        for field in self.indexFields:
+            self.unindex(field, getattr(row, field), key)
+
+    def unindex(self, field, value, key):
+        keys = self.indexes[field].get(value)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.indexes[field][value]
+
+    # Make the table match 'rows', returning the number of objects added,
+    # changed or removed
+    def replace(self, rows):
+        changes = 0
+        seen = set()
+        for row in rows:
+            seen.add(getattr(row, self.keyField))
+            if self.put(row):
+                changes += 1
+        for key in [key for key in self.rows if key not in seen]:
+            self.remove(key)
+            changes += 1
+        return changes
+#---end Table
+
+
+# Example:
+#   fleet = FleetSnapshot()
+#   fleet.refresh()
+#   for sensor in fleet.sensorsInLot(parkingLotId, status='vacant'):
+#       print(sensor.parkingSpace)
+#   print(fleet.sensorForSpace('Space #54').sensorId)
+#
+# Every query takes the lock, so the snapshot can be refreshed from another
+# thread while it's being used.
+class FleetSnapshot(object):
+    def __init__(self):
+        self.sensors = Table('sensorId', ('parkingLotId', 'status', 'network', 'parkingSpace'))
+        self.parkingLots = Table('id', ('name',))
+        self.gateways = Table('id', ('gatewayMac', 'parkingLotId'))
+        self.lock = threading.RLock()
+
+    # Fetch the lists again and update only what changed. A list that
+    # couldn't be fetched is left as it was. Returns the number of changes.
+    def refresh(self, sensors=True, parkingLots=True, gateways=True):
+        changes = 0
+        if parkingLots:
+            changes += self.updateParkingLots(REST.getParkingLots())
+        if gateways:
+            changes += self.updateGateways(REST.getGateways())
+        if sensors:
+            changes += self.updateSensors(REST.getSensors())
+        return changes
+
+    def updateSensors(self, sensors):
+        if sensors is None:
+            return 0
+        with self.lock:
+            return self.sensors.replace(sensors)
+
+    def updateParkingLots(self, parkingLots):
+        if parkingLots is None:
+            return 0
+        with self.lock:
+            return self.parkingLots.replace(parkingLots)
+
+    def updateGateways(self, gateways):
+        if gateways is None:
+            return 0
+        with self.lock:
+            return self.gateways.replace(gateways)
+
+    # Add or replace a single sensor, e.g. after an update call
+    def updateSensor(self, sensor):
+        with self.lock:
+            self.sensors.put(sensor)
+
+    def removeSensor(self, sensorId):
+        with self.lock:
+            self.sensors.remove(sensorId)
+
+    #---------Queries---------
+
+    def sensor(self, sensorId):
+        with self.lock:
+            return self.sensors.get(sensorId)
+
+    # Sensors in a lot, optionally only those with the given status and/or network
+    def sensorsInLot(self, parkingLotId, status=None, network=None):
+        with self.lock:
+            keys = self.sensors.keys('parkingLotId', parkingLotId)
+            if status is not None:
+                keys = keys & self.sensors.keys('status', status)
+            if network is not None:
+                keys = keys & self.sensors.keys('network', network)
+            return [self.sensors.get(key) for key in keys]
+
+    def sensorsWithStatus(self, status):
+        with self.lock:
+            return self.sensors.find('status', status)
+
+    def sensorsOnNetwork(self, network):
+        with self.lock:
+            return self.sensors.find('network', network)
+
+    # Sensor assigned to a parking space. Space names can repeat between
+    # lots, so pass parkingLotId to pick the lot. None if there isn't one.
+    def sensorForSpace(self, parkingSpace, parkingLotId=None):
+        with self.lock:
+            keys = self.sensors.keys('parkingSpace', parkingSpace)
+            if parkingLotId is not None:
+                keys = keys & self.sensors.keys('parkingLotId', parkingLotId)
+            for key in keys:
+                return self.sensors.get(key)
+
+    # Number of sensors in a lot with each status
+    def statusCounts(self, parkingLotId):
+        with self.lock:
+            inLot = self.sensors.keys('parkingLotId', parkingLotId)
+            counts = {}
+            for status, keys in self.sensors.indexes['status'].items():
+                count = len(inLot & keys)
+                if count:
+                    counts[status] = count
+            return counts
+
+    def parkingLot(self, parkingLotId):
+        with self.lock:
+            return self.parkingLots.get(parkingLotId)
+
+    # Parking lot with the given name, None if there isn't one
+    def parkingLotByName(self, name):
+        with self.lock:
+            for parkingLot in self.parkingLots.find('name', name):
+                return parkingLot
+
+    def gateway(self, gatewayId):
+        with self.lock:
+            return self.gateways.get(gatewayId)
+
+    # Gateway with the given MAC, None if there isn't one
+    def gatewayByMac(self, gatewayMac):
+        with self.lock:
+            for gateway in self.gateways.find('gatewayMac', gatewayMac):
+                return gateway
+
+    def gatewaysInLot(self, parkingLotId):
+        with self.lock:
+            return self.gateways.find('parkingLotId', parkingLotId)
+#---end FleetSnapshot
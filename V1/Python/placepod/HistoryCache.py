@@ -0,0 +1,159 @@
+# --------------------------------------------------#
+# Local sensor history cache                        #
+# File: HistoryCache.py                             #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Keeps fetched sensor history in a local SQLite    #
+# file along with the time ranges already fetched   #
+# for every sensor. A history request only calls    #
+# /api/sensor/history for the parts of the range    #
+# that aren't cached yet and serves the rest from   #
+# disk.                                             #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import datetime
+import sqlite3 # Local storage of the history rows
+
+from . import REST # Sensor model
+from . import HistoryFetcher # Windowed fetch of the missing ranges
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    sensorId TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    parkingSpace TEXT,
+    parkingLot TEXT,
+    status TEXT,
+    carPresence INTEGER,
+    gatewayTime TEXT,
+    sentralTime,
+    temperature REAL,
+    battery REAL,
+    lat REAL,
+    lon REAL,
+    network TEXT,
+    parkingLotId TEXT
+);
+-- SQLite treats NULLs as different from each other in a UNIQUE index, so
+-- rows without a SENtralTime would be inserted again on every fetch
+CREATE UNIQUE INDEX IF NOT EXISTS history_sensor_time
+    ON history (sensorId, time, coalesce(sentralTime, -1));
+CREATE TABLE IF NOT EXISTS fetched (
+    sensorId TEXT NOT NULL,
+    startTime INTEGER NOT NULL,
+    endTime INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fetched_sensor ON fetched (sensorId, startTime);
+"""
+
+COLUMNS = ('sensorId', 'time', 'parkingSpace', 'parkingLot', 'status', 'carPresence',
+           'gatewayTime', 'sentralTime', 'temperature', 'battery', 'lat', 'lon',
+           'network', 'parkingLotId')
+
+
+# Example:
+#   cache = HistoryCache("history.db")
+#   history = cache.history(sensorId, '2017-09-01T00:00:00.000Z', '2017-10-01T00:00:00.000Z')
+#   print("Number of results: " + str(len(history)) + ", calls made: " + str(cache.fetches))
+#
+# Ranges are start inclusive and end exclusive.
+#   path: SQLite file to keep the history in
+#   fetcher: HistoryFetcher used for the missing ranges
+#   settle: how far back from now a range has to end before it is marked as
+#           fetched, since the newest history may still be arriving
+class HistoryCache(object):
+    def __init__(self, path="history.db", fetcher=None, settle=datetime.timedelta(minutes=5)):
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+        self.fetcher = HistoryFetcher.HistoryFetcher() if fetcher is None else fetcher
+        self.settle = settle
+        # Number of missing ranges fetched from the api
+        self.fetches = 0
+
+    def close(self):
+        self.db.close()
+
+    # List of Sensor rows for startTime..endTime in time order, fetching
+    # only what isn't cached yet
+    def history(self, sensorId, startTime, endTime):
+        sensorId = str(sensorId)
+        start = HistoryFetcher.toDatetime(startTime)
+        end = HistoryFetcher.toDatetime(endTime)
+        for gapStart, gapEnd in self.gaps(sensorId, toMillis(start), toMillis(end)):
+            self.fill(sensorId, fromMillis(gapStart), fromMillis(gapEnd))
+        return self.cached(sensorId, start, end)
+
+    # Rows already in the cache for startTime..endTime, without fetching
+    def cached(self, sensorId, startTime, endTime):
+        rows = self.db.execute("SELECT " + ", ".join(COLUMNS) + " FROM history"
+                               + " WHERE sensorId = ? AND time >= ? AND time < ? ORDER BY time",
+                               (str(sensorId), toMillis(HistoryFetcher.toDatetime(startTime)),
+                                toMillis(HistoryFetcher.toDatetime(endTime))))
+        return [createSensorFromRow(row) for row in rows]
+
+    # Parts of start..end (in milliseconds) not covered by a fetched range
+    def gaps(self, sensorId, start, end):
+        gaps = []
+        ranges = self.db.execute("SELECT startTime, endTime FROM fetched"
+                                 + " WHERE sensorId = ? AND endTime > ? AND startTime < ?"
+                                 + " ORDER BY startTime", (sensorId, start, end))
+        for rangeStart, rangeEnd in ranges:
+            if rangeStart > start:
+                gaps.append((start, rangeStart))
+            start = max(start, rangeEnd)
+        if start < end:
+            gaps.append((start, end))
+        return gaps
+
+    # Fetch one missing range from the api and store it
+    def fill(self, sensorId, start, end):
+        self.fetches += 1
+        rows = []
+        for sensor in self.fetcher.fetch(sensorId, start, end):
+            time = toMillis(HistoryFetcher.historyTime(sensor))
+            # The fetcher includes rows on the end time, they belong to the next range
+            if time < toMillis(end):
+                rows.append((sensor.sensorId, time, sensor.parkingSpace, sensor.parkingLot,
+                             sensor.status, sensor.carPresence, sensor.gateWayTime,
+                             sensor.sentralTime, sensor.temperature, sensor.battery,
+                             sensor.lat, sensor.lon, sensor.network, sensor.parkingLotId))
+
+        # History close to now may still change, so don't mark it as fetched
+        settled = min(end, datetime.datetime.now(datetime.timezone.utc) - self.settle)
+        with self.db:
+            self.db.executemany("INSERT OR IGNORE INTO history (" + ", ".join(COLUMNS) + ")"
+                                + " VALUES (" + ", ".join("?" * len(COLUMNS)) + ")", rows)
+            if settled > start:
+                self.markFetched(sensorId, toMillis(start), toMillis(settled))
+
+    # Record start..end as fetched, merging it with the ranges it touches
+    def markFetched(self, sensorId, start, end):
+        touching = self.db.execute("SELECT rowid, startTime, endTime FROM fetched"
+                                   + " WHERE sensorId = ? AND endTime >= ? AND startTime <= ?",
+                                   (sensorId, start, end)).fetchall()
+        for rowid, rangeStart, rangeEnd in touching:
+            start = min(start, rangeStart)
+            end = max(end, rangeEnd)
+            self.db.execute("DELETE FROM fetched WHERE rowid = ?", (rowid,))
+        self.db.execute("INSERT INTO fetched (sensorId, startTime, endTime) VALUES (?, ?, ?)",
+                        (sensorId, start, end))
+#---end HistoryCache
+
+
+def createSensorFromRow(row):
+    return REST.Sensor(REST.intern(row[0]), REST.intern(row[2]), REST.intern(row[3]),
+                       REST.intern(row[4]), row[5], row[6], row[7], row[8], row[9], row[10],
+                       row[11], REST.intern(row[12]), REST.intern(row[13]))
+#---end createSensorFromRow
+
+# Times are stored as milliseconds since the epoch so they compare as numbers
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+def toMillis(value):
+    return (value - EPOCH) // datetime.timedelta(milliseconds=1)
+
+def fromMillis(value):
+    return EPOCH + datetime.timedelta(milliseconds=value)
@@ -0,0 +1,136 @@
+# --------------------------------------------------#
+# Windowed sensor history fetch                     #
+# File: HistoryFetcher.py                           #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Splits a startTime..endTime history request into  #
+# smaller windows, fetches them in parallel over    #
+# the pooled REST client and streams the rows back  #
+# in timestamp order. Each window is retried on     #
+# its own by the REST client's RetryPolicy.         #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import collections
+import concurrent.futures
+import datetime
+import json # Used to build the params for each window
+import threading
+
+from . import REST # Pooled transport, Sensor model and time helpers
+
+
+# Raised when a window still fails after the REST client's retries, or its
+# circuit breaker is open
+class HistoryError(Exception):
+    def __init__(self, sensorId, start, end):
+        Exception.__init__(self, "Couldn't fetch history for " + sensorId + " from "
+                           + formatTime(start) + " to " + formatTime(end))
+        self.sensorId = sensorId
+        self.start = start
+        self.end = end
+#---end HistoryError
+
+
+# Example:
+#   fetcher = HistoryFetcher(window=datetime.timedelta(hours=6), workers=8)
+#   for sensor in fetcher.fetch(sensorId, '2017-09-01T00:00:00.000Z', '2017-10-01T00:00:00.000Z'):
+#       print(sensor.gateWayTime + ": " + sensor.status)
+#
+#   window: length of time fetched by a single call
+#   workers: number of windows fetched at the same time
+#
+# Failed windows are retried by the RetryPolicy of the REST client, see
+# REST.setClient, so they aren't retried again here.
+# Rows without a GatewayTime can't be placed in a window, they are skipped
+# and counted in self.untimed.
+class HistoryFetcher(object):
+    def __init__(self, window=datetime.timedelta(days=1), workers=4):
+        self.window = window
+        self.workers = workers
+        self.untimed = 0
+        self.lock = threading.Lock()
+
+    # Split start..end into back to back windows
+    def windows(self, start, end):
+        windows = []
+        while start < end:
+            windowEnd = min(start + self.window, end)
+            windows.append((start, windowEnd))
+            start = windowEnd
+        return windows
+
+    # Fetch one window. Rows on the end boundary belong to the next window
+    # so they aren't returned twice.
+    def fetchWindow(self, sensorId, start, end, last):
+        params = json.dumps({'sensorId': sensorId,
+                             'startTime': formatTime(start),
+                             'endTime': formatTime(end)})
+        try:
+            history = REST.sensorHistory(params)
+        except REST.PlacePodError as error:
+            # Errors like 401 or 404 aren't about this window
+            if not error.retryable and not isinstance(error, REST.CircuitOpenError):
+                raise
+            raise HistoryError(sensorId, start, end) from error
+        if history is None:
+            raise HistoryError(sensorId, start, end)
+        rows = [(historyTime(sensor), sensor) for sensor in history]
+        timed = [row for row in rows if row[0] is not None]
+        if len(timed) < len(rows):
+            with self.lock:
+                self.untimed += len(rows) - len(timed)
+        rows = [row for row in timed if start <= row[0] and (row[0] < end or last)]
+        rows.sort(key=lambda row: row[0])
+        return [row[1] for row in rows]
+
+    # Generator of Sensor rows for startTime..endTime in timestamp order.
+    # Times may be ISO 8601 strings or datetimes. Windows are fetched ahead
+    # in parallel but only a few are held at once.
+    def fetch(self, sensorId, startTime, endTime):
+        sensorId = str(sensorId)
+        windows = self.windows(toDatetime(startTime), toDatetime(endTime))
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers)
+        # Windows don't overlap, so yielding them in order keeps the whole
+        # stream in timestamp order
+        fetching = collections.deque()
+        try:
+            nextWindow = 0
+            while nextWindow < len(windows) or fetching:
+                while nextWindow < len(windows) and len(fetching) < self.workers * 2:
+                    start, end = windows[nextWindow]
+                    last = nextWindow == len(windows) - 1
+                    fetching.append(executor.submit(self.fetchWindow, sensorId, start, end, last))
+                    nextWindow += 1
+                for sensor in fetching.popleft().result():
+                    yield sensor
+        finally:
+            # Stop fetching ahead if the caller stopped reading
+            for future in fetching:
+                future.cancel()
+            executor.shutdown(wait=False)
+#---end HistoryFetcher
+
+
+# Time a history row happened at, None if it has no GatewayTime. SENtralTime
+# is a tick count, not a time, so it is never used instead.
+def historyTime(sensor):
+    if not sensor.gateWayTime:
+        return None
+    return REST.parseTime(sensor.gateWayTime)
+#---end historyTime
+
+def toDatetime(value):
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return value
+    return REST.parseTime(value)
+#---end toDatetime
+
+# Format a datetime the way the history call expects, e.g. 2017-09-08T01:00:00.000Z
+def formatTime(value):
+    value = value.astimezone(datetime.timezone.utc)
+    return value.strftime('%Y-%m-%dT%H:%M:%S.') + '%03dZ' % (value.microsecond // 1000)
+#---end formatTime
@@ -0,0 +1,259 @@
+# --------------------------------------------------#
+# Columnar sensor history                           #
+# File: HistoryFrame.py                             #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Holds sensor history as typed NumPy columns       #
+# instead of a list of Sensor objects, so analysis  #
+# over battery, temperature, car presence and the   #
+# timestamps is vectorized. Rows can still be       #
+# turned back into Sensor objects when needed.      #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import datetime
+from . import JsonDecoder # Used to deserialize JSON obtained from the api
+import numpy # Typed column storage
+
+from . import REST # History call, Sensor model and time helpers
+
+
+# Marks a missing time in the int64 time columns
+MISSING_TIME = numpy.iinfo(numpy.int64).min
+# Stored in the int8 carPresence column for rows without a CarPresence. The
+# README's values are 0 to 4, so it can't be mistaken for a real one.
+MISSING_CAR_PRESENCE = -1
+
+
+# Column of repeated strings stored as small integer codes plus the list of
+# distinct values, e.g. status or network
+class Categorical(object):
+    def __init__(self, codes, categories):
+        self.codes = codes
+        self.categories = categories
+
+    # Encode a list of values, numbering categories in order of appearance
+    @classmethod
+    def fromValues(cls, values):
+        lookup = {}
+        codes = [lookup.setdefault(value, len(lookup)) for value in values]
+        categories = list(lookup)
+        return cls(numpy.array(codes, dtype=codeType(len(categories))), categories)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, numpy.integer)):
+            return self.categories[self.codes[index]]
+        return Categorical(self.codes[index], self.categories)
+
+    # Boolean mask of the rows equal to value
+    def equals(self, value):
+        if value not in self.categories:
+            return numpy.zeros(len(self.codes), dtype=bool)
+        return self.codes == self.categories.index(value)
+
+    # Plain list of the values
+    def values(self):
+        return [self.categories[code] for code in self.codes]
+#---end Categorical
+
+# Smallest signed integer type that can hold 'count' different codes
+def codeType(count):
+    if count <= 127:
+        return numpy.int8
+    if count <= 32767:
+        return numpy.int16
+    return numpy.int32
+#---end codeType
+
+
+# Example:
+#   frame = sensorHistoryFrame(params)
+#   frame = frame.between('2017-09-08T01:00:00.000Z', '2017-09-08T01:05:00.000Z')
+#   occupied = frame.filter(frame.status.equals('occupied'))
+#   print(occupied.battery.mean())
+#   for sensor in occupied.toSensors():
+#       print(sensor.gateWayTime)
+#
+# Columns (all the same length, sorted by gatewayTime):
+#   battery, temperature: float32, NaN if absent
+#   carPresence: int8, MISSING_CAR_PRESENCE if absent
+#   gatewayTime, sentralTime: int64 milliseconds since the epoch, MISSING_TIME if absent
+#   lat, lon: float64, NaN if absent
+#   sensorId, parkingSpace, parkingLot, parkingLotId, status, network: Categorical
+class HistoryFrame(object):
+    NUMBER_COLUMNS = ('battery', 'temperature', 'carPresence', 'gatewayTime', 'sentralTime',
+                      'lat', 'lon')
+    CATEGORY_COLUMNS = ('sensorId', 'parkingSpace', 'parkingLot', 'parkingLotId', 'status',
+                        'network')
+
+    # sentralTicks: True when sentralTime holds SENtral ticks rather than times
+    def __init__(self, columns, sentralTicks=False):
+        for name in HistoryFrame.NUMBER_COLUMNS + HistoryFrame.CATEGORY_COLUMNS:
+            setattr(self, name, columns[name])
+        self.sentralTicks = sentralTicks
+
+    # Build a frame from the decoded history JSON (a list of dictionaries)
+    @classmethod
+    def fromRows(cls, rows):
+        fields = {}
+        for name in HistoryFrame.NUMBER_COLUMNS + HistoryFrame.CATEGORY_COLUMNS:
+            fields[name] = []
+        for row in rows:
+            for name, values in fields.items():
+                values.append(row.get(name))
+        return cls.fromFields(fields)
+
+    # Build a frame from Sensor objects, e.g. the rows of streamSensorHistory
+    @classmethod
+    def fromSensors(cls, sensors):
+        fields = {}
+        for name in HistoryFrame.NUMBER_COLUMNS + HistoryFrame.CATEGORY_COLUMNS:
+            fields[name] = []
+        for sensor in sensors:
+            for name, values in fields.items():
+                # The Sensor model spells gatewayTime as gateWayTime
+                values.append(getattr(sensor, 'gateWayTime' if name == 'gatewayTime' else name))
+        return cls.fromFields(fields)
+
+    # Build a frame straight from the bytes returned by the history call
+    @classmethod
+    def fromJson(cls, content):
+        return cls.fromRows(JsonDecoder.loads(content))
+
+    @classmethod
+    def fromFields(cls, fields):
+        columns = {
+            'battery': numpy.array(fields['battery'], dtype=numpy.float32),
+            'temperature': numpy.array(fields['temperature'], dtype=numpy.float32),
+            'carPresence': numpy.array([MISSING_CAR_PRESENCE if value is None else value
+                                        for value in fields['carPresence']], dtype=numpy.int8),
+            'gatewayTime': epochMillis(fields['gatewayTime']),
+            'sentralTime': epochMillis(fields['sentralTime']),
+            'lat': numpy.array(fields['lat'], dtype=numpy.float64),
+            'lon': numpy.array(fields['lon'], dtype=numpy.float64),
+        }
+        for name in HistoryFrame.CATEGORY_COLUMNS:
+            columns[name] = Categorical.fromValues(fields[name])
+        # Rows without a SENtralTime don't say whether the column holds ticks
+        sentralTimes = [value for value in fields['sentralTime'] if value is not None]
+        sentralTicks = all(type(value) is int for value in sentralTimes)
+        frame = cls(columns, sentralTicks and len(sentralTimes) > 0)
+        # Keep the rows in time order so between() can use a binary search
+        order = numpy.argsort(frame.gatewayTime, kind='stable')
+        if len(order) and (order != numpy.arange(len(order))).any():
+            frame = frame.take(order)
+        return frame
+
+    def __len__(self):
+        return len(self.gatewayTime)
+
+    # New frame with the rows at 'index' (a slice, mask or list of positions)
+    def take(self, index):
+        columns = {}
+        for name in HistoryFrame.NUMBER_COLUMNS + HistoryFrame.CATEGORY_COLUMNS:
+            columns[name] = getattr(self, name)[index]
+        return HistoryFrame(columns, self.sentralTicks)
+
+    # New frame with only the rows where mask is True, e.g.
+    # frame.filter((frame.battery < 3.3) & frame.network.equals('PNI'))
+    def filter(self, mask):
+        return self.take(numpy.asarray(mask, dtype=bool))
+
+    # New frame with the rows from start (inclusive) to end (exclusive).
+    # Times can be ISO 8601 strings, datetimes or epoch milliseconds.
+    def between(self, start=None, end=None):
+        first = 0 if start is None else numpy.searchsorted(self.gatewayTime, toMillis(start), 'left')
+        last = len(self) if end is None else numpy.searchsorted(self.gatewayTime, toMillis(end), 'left')
+        return self.take(slice(first, last))
+
+    # Rebuild the Sensor object for one row
+    def row(self, index):
+        if not self.sentralTicks:
+            sentralTime = formatMillis(self.sentralTime[index])
+        elif self.sentralTime[index] == MISSING_TIME:
+            sentralTime = None
+        else:
+            sentralTime = int(self.sentralTime[index])
+        carPresence = int(self.carPresence[index])
+        if carPresence == MISSING_CAR_PRESENCE:
+            carPresence = None
+        return REST.Sensor(self.sensorId[index], self.parkingSpace[index], self.parkingLot[index],
+                           self.status[index], carPresence,
+                           formatMillis(self.gatewayTime[index]), sentralTime,
+                           toFloat(self.temperature[index]), toFloat(self.battery[index]),
+                           toFloat(self.lat[index]), toFloat(self.lon[index]), self.network[index],
+                           self.parkingLotId[index])
+
+    # Generator of Sensor objects, one per row
+    def toSensors(self):
+        for index in range(0, len(self)):
+            yield self.row(index)
+#---end HistoryFrame
+
+
+#--- Sensor History Frame ---
+# Same call as REST.sensorHistory, but the response is put straight into
+# a HistoryFrame without creating any Sensor objects
+def sensorHistoryFrame(params):
+    print("Fetching Sensor history...")
+    result = REST.post("/api/sensor/history", params)
+    # Stop running if the post call returns empty JSON
+    if result == b'':
+        print("Error: Post request returned no data")
+        return
+    frame = HistoryFrame.fromJson(result)
+    print("Got Sensor History")
+    return frame
+#---end sensorHistoryFrame
+
+
+#--- Time helpers ---
+# Convert a list of API times into int64 milliseconds since the epoch.
+# Numbers (e.g. SENtral ticks) are kept as they are.
+def epochMillis(values):
+    if all(type(value) is int for value in values):
+        return numpy.array(values, dtype=numpy.int64)
+    try:
+        # NumPy parses ISO 8601 itself as long as there's no time zone on it
+        return numpy.array([stripUtc(value) for value in values],
+                           dtype='datetime64[ms]').astype(numpy.int64)
+    except (AttributeError, TypeError, ValueError):
+        return numpy.array([toMillis(value) for value in values], dtype=numpy.int64)
+
+# Drop the UTC marker from an ISO 8601 time, other offsets raise ValueError
+def stripUtc(value):
+    if value.endswith('Z'):
+        return value[:-1]
+    if value.endswith('+00:00'):
+        return value[:-6]
+    if len(value) > 19 and value[-6] in '+-' and value[-3] == ':':
+        raise ValueError("Time isn't in UTC: " + value)
+    return value
+
+def toMillis(value):
+    if value is None:
+        return MISSING_TIME
+    if isinstance(value, (int, numpy.integer)):
+        return int(value)
+    if isinstance(value, str):
+        value = REST.parseTime(value)
+    elif value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return int(value.timestamp() * 1000)
+
+# Format milliseconds since the epoch the way the api does, e.g. 2017-09-08T01:00:00.000Z
+def formatMillis(value):
+    if value == MISSING_TIME:
+        return None
+    return str(numpy.datetime64(int(value), 'ms')) + 'Z'
+
+# Float column value as a Python float, None for the NaN a missing value became
+def toFloat(value):
+    if numpy.isnan(value):
+        return None
+    return float(value)
+#---end Time helpers
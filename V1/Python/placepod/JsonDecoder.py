@@ -0,0 +1,87 @@
+# --------------------------------------------------#
+# JSON decoding backend                             #
+# File: JsonDecoder.py                              #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Decodes the JSON sent by the REST and MQTT APIs.  #
+# Uses orjson when it is installed and the json     #
+# module otherwise. Bodies are passed in as the     #
+# bytes from the server; orjson parses them without #
+# decoding them to a str first.                     #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import json
+
+# orjson is optional: pip install orjson. It is imported on the first call
+# to loads rather than when this file is imported.
+orjson = None
+
+
+# Backends that can be picked with setBackend
+BACKENDS = ('orjson', 'json')
+
+# Backend used by loads, orjson whenever it is available. None until it has
+# been picked by loadBackend.
+backend = None
+
+# Error raised by loads for invalid JSON with either backend
+# (orjson.JSONDecodeError is a subclass of it)
+JSONDecodeError = json.JSONDecodeError
+
+
+# Pick orjson if it can be imported, otherwise json. Returns the backend.
+def loadBackend():
+    global backend, orjson
+    if backend is None:
+        try:
+            import orjson
+            backend = 'orjson'
+        except ImportError:
+            backend = 'json'
+    return backend
+#---end loadBackend
+
+# Pick the backend used by loads, e.g. to compare them
+def setBackend(name):
+    global backend
+    if name not in BACKENDS:
+        raise ValueError("backend must be one of " + ", ".join(BACKENDS))
+    loadBackend()
+    if name == 'orjson' and orjson is None:
+        raise ValueError("orjson isn't installed")
+    backend = name
+#---end setBackend
+
+
+# Decode a JSON document from bytes (or str). objectHook is called on every
+# JSON object, innermost first, and its result used in place of the
+# dictionary, the same as json.loads(content, object_hook=objectHook).
+def loads(content, objectHook=None):
+    if backend is None:
+        loadBackend()
+    if backend == 'orjson':
+        value = orjson.loads(content)
+        if objectHook is None:
+            return value
+        return applyObjectHook(value, objectHook)
+    # json.loads would detect the encoding of bytes first, the API always sends UTF-8
+    if type(content) is bytes:
+        content = content.decode('utf_8')
+    return json.loads(content, object_hook=objectHook)
+#---end loads
+
+# orjson has no object_hook, so walk the decoded value and call it the way
+# the json module would
+def applyObjectHook(value, objectHook):
+    if type(value) is dict:
+        for key, item in value.items():
+            if type(item) is dict or type(item) is list:
+                value[key] = applyObjectHook(item, objectHook)
+        return objectHook(value)
+    if type(value) is list:
+        return [applyObjectHook(item, objectHook) if type(item) is dict or type(item) is list
+                else item for item in value]
+    return value
+#---end applyObjectHook
@@ -0,0 +1,383 @@
+# -------------------------------------------------#
+# Python MQTT API client                           #
+# File: MQTT.py                                    #
+# Author: Scott Williams swilliams@pnicorp.com     #
+# Date: June 8th, 2017                             #
+# Last updated: October 18th, 2026                 #
+# Developed in: PyCharm Community Edition 2016.3.2 #
+# Project interpreter: 3.5.0                       #
+# Tests the MQTT API for PlacePod. Will run until  #
+# user terminated.                                 #
+#--------------------------------------------------#
+
+# Used to subscribe to the api. Imported by MqttClient.connect() rather than
+# here, so importing this file to reuse the decoder or the handlers stays cheap.
+mqtt = None
+
+# Used to deserialize JSON obtained from the api
+from . import JsonDecoder
+
+# Used to parse the times in packets
+from . import REST
+
+# MQTT API connection values
+
+# To get these values: 1) Login to PNI cloud account at https://parking.pnicloud.com
+#                      2) Click on settings > MQTT API
+#                      3) Click "Re-Generate MQTT Credentials"
+#                      4) Click Show Password"
+#                      5) Copy all three values into the respective fields below
+#                      6) Select the topic you want to listen to. There are currently 2 options:
+#                           Car Presence Topic
+#                           Parking Lot Count Topic
+#                      7) Paste the listed topic into the topic field below.
+# For serverURL, don't include "mqtts://" or ":8883", otherwise the connection will not work
+
+
+serverURL = "api.pnicloud.com"
+username = ""
+password = ""
+
+topic = "#"
+
+# Port used
+port = 8883
+
+#--------------------------------Packet decoding------------------------------------
+# Each packet is decoded once into a slotted event object with its times
+# parsed to datetimes. Car Presence packets become CarPresenceEvent and
+# Parking Lot Count packets become LotCountEvent.
+
+# A 'Car Presence Topic' packet
+class CarPresenceEvent(object):
+    __slots__ = ('sensorId', 'parkingSpace', 'parkingName', 'network', 'status', 'carPresence',
+                 'lat', 'lon', 'temperature', 'battery', 'rssi', 'snr', 'hostFirmware',
+                 'sensorFirmware', 'createdAt', 'gatewayTime', 'serverTime', 'sentralTime')
+
+    def __init__(self, packet):
+        get = packet.get
+        self.sensorId = get('sensorId')
+        self.parkingSpace = get('parkingSpace')
+        self.parkingName = get('parkingName')
+        self.network = get('network')
+        self.status = get('status')
+        self.carPresence = get('CarPresence')
+        self.lat = get('lat')
+        self.lon = get('lon')
+        self.temperature = get('Temperature')
+        self.battery = get('Battery')
+        self.rssi = get('rssi')
+        self.snr = get('snr')
+        self.hostFirmware = get('hostFirmware')
+        self.sensorFirmware = get('sensorFirmware')
+        self.createdAt = parseTime(get('createdAt'))
+        self.gatewayTime = parseTime(get('GatewayTime'))
+        self.serverTime = parseTime(get('ServerTime'))
+        # Ticks of the sensor's own clock, not a time of day
+        self.sentralTime = get('SENtralTime')
+#---end CarPresenceEvent
+
+# A 'Parking Lot Count Topic' packet
+class LotCountEvent(object):
+    __slots__ = ('parkingLotId', 'parkingName', 'totalNumberOfSpaces', 'availableSpaces',
+                 'adjustedAvailableSpaces', 'parkingLotClosed')
+
+    def __init__(self, packet):
+        get = packet.get
+        self.parkingLotId = get('parkingLotId')
+        self.parkingName = get('parkingName')
+        self.totalNumberOfSpaces = get('totalNumberOfSpaces')
+        self.availableSpaces = get('availableSpaces')
+        self.adjustedAvailableSpaces = get('adjustedAvailableSpaces')
+        self.parkingLotClosed = get('parkingLotClosed')
+#---end LotCountEvent
+
+EVENT_TYPES = (CarPresenceEvent, LotCountEvent)
+
+
+# ISO 8601 time from a packet as an aware datetime, None if it is missing or
+# can't be read
+def parseTime(value):
+    if not value:
+        return None
+    try:
+        return REST.parseTime(value)
+    except (TypeError, ValueError):
+        return None
+#---end parseTime
+
+# Decode the body of a message into a CarPresenceEvent or LotCountEvent.
+# Returns None if the body isn't a packet of either kind.
+def decodePacket(content):
+    packet = JsonDecoder.loads(content)
+    if type(packet) is not dict:
+        return None
+    # Only Car Presence packets have a sensorId, only Parking Lot Count
+    # packets have availableSpaces
+    if 'sensorId' in packet:
+        return CarPresenceEvent(packet)
+    if 'availableSpaces' in packet:
+        return LotCountEvent(packet)
+    return None
+#---end decodePacket
+
+#-----------------------------------------------------------------------------------
+
+
+#--------------------------------Event handlers-------------------------------------
+# Handlers are called on the network thread with each decoded event, so they
+# should hand slow work off to another thread.
+
+# event type -> functions called with every event of that type.
+# Add one with addEventHandler(CarPresenceEvent, handler).
+eventHandlers = {}
+for eventType in EVENT_TYPES:
+    eventHandlers[eventType] = []
+
+# Functions called with every event, whatever its type
+messageHandlers = []
+
+# Optional function called with every event (or None for a packet that
+# couldn't be decoded) before the handlers, see setDebugSink
+debugSink = None
+
+# Optional function every event goes through on its way to the handlers, e.g.
+# a Dedupe.DuplicateFilter. It calls deliver() with the events that should
+# reach them, possibly later or not at all. See setStage.
+stage = None
+
+def addEventHandler(eventType, handler):
+    eventHandlers[eventType].append(handler)
+
+def removeEventHandler(eventType, handler):
+    if handler in eventHandlers[eventType]:
+        eventHandlers[eventType].remove(handler)
+
+def addMessageHandler(handler):
+    messageHandlers.append(handler)
+
+def removeMessageHandler(handler):
+    if handler in messageHandlers:
+        messageHandlers.remove(handler)
+
+# Print every packet as it arrives, to 'file' (sys.stdout if None). Pass
+# enabled=False to stop printing.
+def setDebugSink(enabled=True, file=None):
+    global debugSink
+    if not enabled:
+        debugSink = None
+    else:
+        debugSink = lambda event: printEvent(event, file)
+
+# Put a function between the decoder and the handlers, None to remove it
+def setStage(newStage):
+    global stage
+    stage = newStage
+
+# Hand an event to the debug sink, then to the stage or straight to the handlers
+def dispatch(event):
+    if debugSink is not None:
+        debugSink(event)
+    if event is None:
+        return
+    if stage is not None:
+        stage(event)
+    else:
+        deliver(event)
+#---end dispatch
+
+# Hand an event to the handlers for its type and the message handlers
+def deliver(event):
+    for handler in eventHandlers[type(event)]:
+        handler(event)
+    for handler in messageHandlers:
+        handler(event)
+#---end deliver
+
+# Print the fields of an event, the debug sink used by setDebugSink
+def printEvent(event, file=None):
+    if event is None:
+        print("Error: Published packet isn't a Car Presence or Parking Lot Count packet", file=file)
+        return
+    print("Packet contents", file=file)
+    for field in type(event).__slots__:
+        value = getattr(event, field)
+        # Packets don't always have every field
+        if value is None:
+            continue
+        if hasattr(value, 'isoformat'):
+            value = value.isoformat()
+        print(field + ": " + str(value), file=file)
+    print("", file=file)
+    print("Waiting on publish...", file=file)
+#---end printEvent
+
+#-----------------------------------------------------------------------------------
+
+
+# The callback for when the client receives a CONNACK response from the server.
+def on_connect(client, userdata, flags, rc):
+
+    # Connection code 0 works
+    print("Connected with result code " + str(rc))
+
+    if rc == 5:
+        print("Error: Invalid username or password!")
+        exit(1)
+
+    # The other possible connection codes are not documented, so warn the user that something may have happened
+    if rc != 0:
+        print("Warning: Connected with code other than 0, errors may occur...")
+
+    # Subscribing in on_connect() means that if we lose the connection and
+    # reconnect then subscriptions will be renewed.
+    print("\nWaiting on publish...\n")
+    subscribeTo = topic if userdata is None else userdata.topic
+    if isinstance(subscribeTo, (list, tuple)):
+        # One SUBSCRIBE for all of a shard's topics
+        client.subscribe([(name, 0) for name in subscribeTo])
+    else:
+        client.subscribe(subscribeTo)
+
+
+# The callback for when a PUBLISH message is received from the server.
+def on_message(client, userdata, msg):
+    handleMessage(msg.payload)
+
+
+# Decode the body of a message and dispatch the event. Called by on_message,
+# or by the MessageQueue workers when the network thread only queues bodies.
+def handleMessage(result):
+    # Don't populate fields if JSON is empty. The "byte string" from MQTT
+    # is decoded as it is, without turning it into a str first.
+    if result == b'':
+        print("Error: Published returned empty data")
+        return
+
+    try:
+        event = decodePacket(result)
+    except ValueError:
+        print("Error: Published packet isn't valid JSON")
+        return
+    dispatch(event)
+
+
+def main():
+    # Blocking call that processes network traffic, dispatches callbacks and
+    # handles reconnecting.
+    # Other loop*() functions are available that give a threaded interface and a
+    # manual interface.
+    setDebugSink()
+    # Packets are printed by a single worker so they come out whole and in
+    # order. The handler is passed in since this file runs as __main__ here.
+    from . import MessageQueue
+    queue = MessageQueue.MessageQueue(workers=1, handler=handleMessage)
+    client = MqttClient(queue=queue).connect()
+    if client is None:
+        return
+    client.loop_forever()
+
+
+# Import paho the first time a client is created
+def loadPaho():
+    global mqtt
+    if mqtt is None:
+        import paho.mqtt.client as mqtt
+    return mqtt
+
+
+# Connection values for one MQTT client. Anything left as None falls back to
+# the module values above.
+# Example:
+#   client = MqttClient(username="user", password="secret", topic="#").connect()
+#   if client is not None:
+#       client.loop_forever()
+#
+#   topic: topic filter, or a list of them, to subscribe to
+#   caCerts: path of the broker's root CA certificate, see connect(). None
+#            turns TLS off.
+#   queue: optional MessageQueue.MessageQueue. If set, the network thread only
+#          queues each message and the queue's workers decode and handle it
+class MqttClient(object):
+    def __init__(self, serverURL=None, username=None, password=None, topic=None, port=None,
+                 caCerts="./SFSRootCAG2.pem", queue=None):
+        module = globals()
+        self.serverURL = module['serverURL'] if serverURL is None else serverURL
+        self.username = module['username'] if username is None else username
+        self.password = module['password'] if password is None else password
+        self.topic = module['topic'] if topic is None else topic
+        self.port = module['port'] if port is None else port
+        self.caCerts = caCerts
+        self.queue = queue
+
+    # Create a paho client and connect it to the broker. Returns None if the
+    # connection values aren't set or the connection failed. Call
+    # loop_forever() or loop_start() on the returned client to start
+    # receiving messages.
+    def connect(self):
+        if self.serverURL == '':
+            print("serverURL not set!")
+            return
+        if self.username == '':
+            print("username not set!")
+            return
+        if self.password == '':
+            print("password not set!")
+            return
+        if self.topic == '':
+            print("topic not set!")
+            return
+
+        # Create a MQTT client. It is handed this object so on_connect
+        # subscribes to this client's topic.
+        client = loadPaho().Client(userdata=self)
+
+        # Specify functions to use for connection and publish messages
+        client.on_connect = on_connect
+        client.on_message = on_message if self.queue is None else self.queue.onMessage
+
+        # Set the username and password for the broker
+        # Client ID must be unique otherwise if multiple users are using the same ID it will knock them off
+        # Since a client ID is not provided, paho randomly generates one for us giving a high probability of uniqueness
+        client.username_pw_set(self.username, self.password)
+        print("Username and password successfully set!")
+
+        # Enable TLS
+        # On macOS it is sufficient to leave the parameter as a "0"
+        # If you are on another system or this does not work, then do the following:
+        # 1) Login to PNI cloud account at https://parking.pnicloud.com
+        # 2) Click on settings > MQTT API
+        # 3) Where it says "* SSL/TLS required", click on the Certificate Authority URL
+        # 4) Under "Root CAs" look for the certificate that has G2 in its name
+        # 5) On the right hand side, right click on PEM to save the certificate.
+        # 6) Put the .PEM file in the same directory as this script
+        # 7) Pass the file name as caCerts
+        #    example:
+        #    MqttClient(caCerts="./SFSRootCAG2.pem")
+        #    or
+        #    MqttClient(caCerts=0)
+        # caCerts=None connects without TLS, e.g. to a local test broker
+        if self.caCerts is not None:
+            client.tls_set(self.caCerts)
+            print("TLS successfully set!")
+
+        # Establish the connection to the broker
+        print("Attempting to connect...")
+        try:
+            client.connect(self.serverURL, self.port, 60)
+        except:
+            print("Couldn't connect to serverURL address.")
+            return
+        return client
+#---end MqttClient
+
+
+# Create a MQTT client from the module's connection values and connect it to
+# the broker. See MqttClient.connect().
+def connect():
+    return MqttClient().connect()
+
+
+# Only run main when started as a script so other modules can import this one
+if __name__ == "__main__":
+    main()
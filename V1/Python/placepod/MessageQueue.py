@@ -0,0 +1,258 @@
+# --------------------------------------------------#
+# MQTT message queue and worker pool                #
+# File: MessageQueue.py                             #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Takes decoding and handling off paho's network    #
+# thread. on_message only puts the raw body in a    #
+# bounded queue, and a pool of workers decodes and  #
+# dispatches it. Each sensorId is handled by the    #
+# same worker, so its packets stay in order. When   #
+# the queue is full it blocks, drops the oldest     #
+# body or spills to disk.                           #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import collections
+import struct
+import tempfile
+import threading
+import time
+import zlib
+
+from . import MQTT # Decodes and dispatches the bodies
+
+
+POLICIES = ('block', 'drop-oldest', 'spill')
+
+# Spill file record header: time queued, key length, body length
+SPILL_HEADER = struct.Struct('>dII')
+
+
+# Key whose packets must be handled in order: the sensorId of a Car Presence
+# packet or the parkingLotId of a Parking Lot Count packet. Read straight
+# from the body, so the network thread never decodes it.
+def routingKey(body):
+    for name in (b'"sensorId"', b'"parkingLotId"'):
+        index = body.find(name)
+        if index != -1:
+            start = body.find(b'"', index + len(name))
+            end = body.find(b'"', start + 1)
+            if start != -1 and end != -1:
+                return body[start + 1:end]
+    return b''
+#---end routingKey
+
+
+# Example:
+#   queue = MessageQueue(workers=4, maxSize=10000, policy='spill')
+#   client = MQTT.connect()
+#   queue.attach(client)
+#   client.loop_forever()
+#
+#   workers: number of threads decoding and handling bodies
+#   maxSize: bodies held in memory before the policy kicks in
+#   policy: what to do with a body when the queue is full
+#           'block': make the network thread wait for room. Nothing is lost,
+#                    but keep-alives stall if the handlers fall far behind
+#           'drop-oldest': throw away the body that has waited longest
+#           'spill': append it to a file in spillDir, it is read back in
+#                    order once the queue has room again
+#   handler: called with each body by the workers, MQTT.handleMessage by default
+class MessageQueue(object):
+    def __init__(self, workers=4, maxSize=10000, policy='block', spillDir=None, handler=None):
+        if policy not in POLICIES:
+            raise ValueError("policy must be one of " + ", ".join(POLICIES))
+        self.maxSize = maxSize
+        self.policy = policy
+        self.spillDir = spillDir
+        self.handler = MQTT.handleMessage if handler is None else handler
+        self.lock = threading.Lock()
+        self.notFull = threading.Condition(self.lock)
+        # One deque of (time queued, body) per worker, picked by routingKey
+        self.shards = [collections.deque() for i in range(0, workers)]
+        self.ready = [threading.Condition(self.lock) for i in range(0, workers)]
+        self.depth = 0
+        self.closed = False
+        # Spill file, bodies in it and the offset the next one is read from
+        self.spillFile = None
+        self.spilled = 0
+        self.spillRead = 0
+        # Counters, see stats()
+        self.received = 0
+        self.handled = 0
+        self.dropped = 0
+        self.spilledTotal = 0
+        self.errors = 0
+        self.lastLag = 0.0
+        self.maxLag = 0.0
+        self.totalLag = 0.0
+        self.threads = []
+        for index in range(0, workers):
+            thread = threading.Thread(target=self.work, args=(index,), daemon=True,
+                                      name="MessageQueue-" + str(index))
+            thread.start()
+            self.threads.append(thread)
+
+    # Make a paho client queue its messages here instead of handling them on
+    # the network thread
+    def attach(self, client):
+        client.on_message = self.onMessage
+        return client
+
+    # paho on_message callback
+    def onMessage(self, client, userdata, msg):
+        self.put(msg.payload)
+
+    # Queue one body. Applies the policy if the queue is full.
+    def put(self, body):
+        key = routingKey(body)
+        shard = zlib.crc32(key) % len(self.shards)
+        with self.lock:
+            if self.closed:
+                raise ValueError("MessageQueue is closed")
+            self.received += 1
+            now = time.monotonic()
+            if self.spilled and self.depth <= self.maxSize // 2:
+                self.refill()
+            if self.policy == 'spill' and (self.spilled or self.depth >= self.maxSize):
+                # Once anything is on disk, later bodies go after it to keep the order
+                self.spill(key, now, body)
+                return
+            if self.policy == 'block':
+                while self.depth >= self.maxSize and not self.closed:
+                    self.notFull.wait()
+                if self.closed:
+                    raise ValueError("MessageQueue is closed")
+            elif self.policy == 'drop-oldest' and self.depth >= self.maxSize:
+                self.dropOldest()
+            self.shards[shard].append((now, body))
+            self.depth += 1
+            self.ready[shard].notify()
+
+    # Called with the lock held
+    def dropOldest(self):
+        oldest = None
+        for shard in self.shards:
+            if shard and (oldest is None or shard[0][0] < oldest[0][0]):
+                oldest = shard
+        oldest.popleft()
+        self.depth -= 1
+        self.dropped += 1
+
+    # Append a body to the spill file. Called with the lock held.
+    def spill(self, key, queuedAt, body):
+        if self.spillFile is None:
+            self.spillFile = tempfile.TemporaryFile(prefix="placepod-mqtt-", dir=self.spillDir)
+        self.spillFile.seek(0, 2)
+        self.spillFile.write(SPILL_HEADER.pack(queuedAt, len(key), len(body)) + key + body)
+        self.spilled += 1
+        self.spilledTotal += 1
+
+    # Move spilled bodies back into memory until the queue is full or the
+    # file is empty. Called with the lock held.
+    def refill(self):
+        self.spillFile.seek(self.spillRead)
+        while self.spilled and self.depth < self.maxSize:
+            queuedAt, keyLength, bodyLength = SPILL_HEADER.unpack(
+                self.spillFile.read(SPILL_HEADER.size))
+            key = self.spillFile.read(keyLength)
+            body = self.spillFile.read(bodyLength)
+            shard = zlib.crc32(key) % len(self.shards)
+            self.shards[shard].append((queuedAt, body))
+            self.depth += 1
+            self.spilled -= 1
+            self.ready[shard].notify()
+        self.spillRead = self.spillFile.tell()
+        if not self.spilled:
+            # Start the file over instead of letting it grow forever
+            self.spillFile.seek(0)
+            self.spillFile.truncate()
+            self.spillRead = 0
+            for ready in self.ready:
+                ready.notify()
+
+    # Worker thread: handle the bodies of one shard in order
+    def work(self, index):
+        shard = self.shards[index]
+        ready = self.ready[index]
+        while True:
+            with self.lock:
+                while not shard:
+                    if self.spilled:
+                        self.refill()
+                        if shard:
+                            break
+                    # Only stop once everything, including the spill file, is handled
+                    if self.closed and not self.spilled:
+                        return
+                    ready.wait()
+                queuedAt, body = shard.popleft()
+                self.depth -= 1
+                if self.spilled and self.depth <= self.maxSize // 2:
+                    self.refill()
+                self.notFull.notify()
+                self.handled += 1
+                lag = time.monotonic() - queuedAt
+                self.lastLag = lag
+                self.totalLag += lag
+                if lag > self.maxLag:
+                    self.maxLag = lag
+            try:
+                self.handler(body)
+            except Exception as error:
+                print("Error: MQTT message handler failed - " + repr(error))
+                with self.lock:
+                    self.errors += 1
+
+    # Seconds the oldest body still in memory has been waiting
+    def oldestAge(self):
+        with self.lock:
+            times = [shard[0][0] for shard in self.shards if shard]
+        return time.monotonic() - min(times) if times else 0.0
+
+    # Queue depth, lag and counters
+    #   depth: bodies waiting in memory, spilled: bodies waiting on disk
+    #   handled: bodies picked up by a worker
+    #   lag / maxLag / meanLag: seconds between a body being queued and a
+    #   worker picking it up, for the last one, the worst one and on average
+    #   oldestAge: seconds the oldest waiting body has been in the queue
+    def stats(self):
+        oldestAge = self.oldestAge()
+        with self.lock:
+            return {
+                'depth': self.depth,
+                'spilled': self.spilled,
+                'received': self.received,
+                'handled': self.handled,
+                'dropped': self.dropped,
+                'spilledTotal': self.spilledTotal,
+                'errors': self.errors,
+                'lag': self.lastLag,
+                'maxLag': self.maxLag,
+                'meanLag': self.totalLag / self.handled if self.handled else 0.0,
+                'oldestAge': oldestAge,
+            }
+
+    # Stop taking bodies, let the workers finish the ones already queued and
+    # wait up to 'timeout' seconds for them
+    def close(self, timeout=None):
+        with self.lock:
+            self.closed = True
+            self.notFull.notify_all()
+            for ready in self.ready:
+                ready.notify()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self.threads:
+            thread.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+        if self.spillFile is not None and not self.spilled:
+            self.spillFile.close()
+            self.spillFile = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        self.close()
+#---end MessageQueue
@@ -0,0 +1,184 @@
+# --------------------------------------------------#
+# REST call metrics                                 #
+# File: Metrics.py                                  #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Call observer for REST.py that keeps per-endpoint #
+# request counts, status codes, bytes received and  #
+# network / decode / model timings, and renders     #
+# them in the Prometheus text format. Can serve     #
+# them on /metrics for a Prometheus server to       #
+# scrape.                                           #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import bisect
+import http.server
+import threading
+
+from . import REST # Call observers and CallRecord
+
+
+# Upper bounds in seconds of the timing histogram buckets
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PHASES = ('network', 'decode', 'model')
+
+
+# Counts of observations per bucket plus their sum, for one histogram series
+class Histogram(object):
+    __slots__ = ('counts', 'total', 'count')
+
+    def __init__(self, bucketCount):
+        self.counts = [0] * bucketCount
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, buckets, value):
+        index = bisect.bisect_left(buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.total += value
+        self.count += 1
+#---end Histogram
+
+
+# Example:
+#   exporter = PrometheusExporter()
+#   exporter.attach()
+#   exporter.serve(9100)      # or print(exporter.render())
+#   sensors = REST.getSensors()
+#
+# Metrics (labels method and endpoint, e.g. POST /api/sensors):
+#   placepod_requests_total{status}: calls by HTTP status, "error" if none was received
+#   placepod_request_attempts_total: times calls were sent, including retries
+#   placepod_response_bytes_total: bytes of response bodies received
+#   placepod_request_seconds{phase}: histogram of network, decode and model times
+class PrometheusExporter(object):
+    def __init__(self, buckets=DEFAULT_BUCKETS, prefix="placepod_"):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self.lock = threading.Lock()
+        self.requests = {}
+        self.attempts = {}
+        self.bytes = {}
+        self.seconds = {}
+        self.server = None
+
+    # Start / stop receiving the CallRecord of every REST call
+    def attach(self):
+        REST.addCallObserver(self)
+        return self
+
+    def detach(self):
+        REST.removeCallObserver(self)
+
+    # Called by REST with each CallRecord
+    def __call__(self, record):
+        key = (record.method, record.endpoint)
+        status = "error" if record.status is None else str(record.status)
+        with self.lock:
+            self.requests[key + (status,)] = self.requests.get(key + (status,), 0) + 1
+            self.attempts[key] = self.attempts.get(key, 0) + record.attempts
+            self.bytes[key] = self.bytes.get(key, 0) + record.bytes
+            for phase in PHASES:
+                value = getattr(record, phase)
+                # Only calls that got a body are decoded and turned into models
+                if phase != 'network' and value == 0:
+                    continue
+                histogram = self.seconds.get(key + (phase,))
+                if histogram is None:
+                    histogram = Histogram(len(self.buckets))
+                    self.seconds[key + (phase,)] = histogram
+                histogram.observe(self.buckets, value)
+
+    def reset(self):
+        with self.lock:
+            self.requests.clear()
+            self.attempts.clear()
+            self.bytes.clear()
+            self.seconds.clear()
+
+    # The metrics in the Prometheus text exposition format
+    def render(self):
+        name = self.prefix
+        lines = []
+        with self.lock:
+            lines.append("# HELP " + name + "requests_total PlacePod API calls by HTTP status.")
+            lines.append("# TYPE " + name + "requests_total counter")
+            for (method, endpoint, status), count in sorted(self.requests.items()):
+                lines.append(name + "requests_total" + labels(method, endpoint, status=status)
+                             + " " + str(count))
+
+            lines.append("# HELP " + name + "request_attempts_total Times PlacePod API calls were"
+                         + " sent, including retries.")
+            lines.append("# TYPE " + name + "request_attempts_total counter")
+            for (method, endpoint), count in sorted(self.attempts.items()):
+                lines.append(name + "request_attempts_total" + labels(method, endpoint)
+                             + " " + str(count))
+
+            lines.append("# HELP " + name + "response_bytes_total Bytes of PlacePod API"
+                         + " responses received.")
+            lines.append("# TYPE " + name + "response_bytes_total counter")
+            for (method, endpoint), count in sorted(self.bytes.items()):
+                lines.append(name + "response_bytes_total" + labels(method, endpoint)
+                             + " " + str(count))
+
+            lines.append("# HELP " + name + "request_seconds Time spent on PlacePod API calls"
+                         + " by phase.")
+            lines.append("# TYPE " + name + "request_seconds histogram")
+            for (method, endpoint, phase), histogram in sorted(self.seconds.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(name + "request_seconds_bucket"
+                                 + labels(method, endpoint, phase=phase, le=repr(bound))
+                                 + " " + str(cumulative))
+                lines.append(name + "request_seconds_bucket"
+                             + labels(method, endpoint, phase=phase, le="+Inf")
+                             + " " + str(histogram.count))
+                lines.append(name + "request_seconds_sum" + labels(method, endpoint, phase=phase)
+                             + " " + repr(histogram.total))
+                lines.append(name + "request_seconds_count" + labels(method, endpoint, phase=phase)
+                             + " " + str(histogram.count))
+        return "\n".join(lines) + "\n"
+
+    # Serve render() on http://host:port/metrics from a background thread
+    def serve(self, port=9100, host=""):
+        exporter = self
+
+        class MetricsHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode('utf_8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self.server
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+#---end PrometheusExporter
+
+
+# {method="GET",endpoint="/api/gateways",...} with the extra labels in order
+def labels(method, endpoint, **extra):
+    pairs = [('method', method), ('endpoint', endpoint)] + list(extra.items())
+    return "{" + ",".join(key + '="' + escape(value) + '"' for key, value in pairs) + "}"
+
+def escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
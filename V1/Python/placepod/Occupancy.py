@@ -0,0 +1,311 @@
+# --------------------------------------------------#
+# Live occupancy state                              #
+# File: Occupancy.py                                #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Keeps the current state of every parking space    #
+# and the occupied / available counts of every lot  #
+# in memory, updated from the MQTT subscription one #
+# packet at a time. A getSensors() snapshot every   #
+# so often fixes anything a missed packet left      #
+# wrong, instead of polling REST for the state.     #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import threading
+import time
+
+from . import REST # getSensors snapshots
+from . import MQTT # Event types, handlers and time parsing
+
+
+# CarPresence values of a space with a car in it: entering, parked, leaving
+OCCUPIED = (2, 3, 4)
+
+
+# State of one parking space. Never changed once it is in the store, an
+# update puts a new one in its place, so readers never see half of an update.
+#   source: 'mqtt' or 'rest', where the status came from
+#   updatedAt: time.time() when the store took it
+class SpaceState(object):
+    __slots__ = ('sensorId', 'parkingLotId', 'parkingSpace', 'status', 'carPresence', 'occupied',
+                 'battery', 'gatewayTime', 'serverTime', 'source', 'updatedAt')
+
+    def __init__(self, sensorId, parkingLotId, parkingSpace, status, carPresence, battery,
+                 gatewayTime, serverTime, source, updatedAt):
+        self.sensorId = sensorId
+        self.parkingLotId = parkingLotId
+        self.parkingSpace = parkingSpace
+        self.status = status
+        self.carPresence = carPresence
+        self.occupied = isOccupied(carPresence, status)
+        self.battery = battery
+        self.gatewayTime = gatewayTime
+        self.serverTime = serverTime
+        self.source = source
+        self.updatedAt = updatedAt
+#---end SpaceState
+
+# Counts for one lot, replaced as a whole like SpaceState.
+#   spaces / occupied: counted from the sensors in the store
+#   reportedTotal / reportedAvailable / reportedAt: from the last Parking Lot
+#   Count packet, None if none has arrived
+class LotState(object):
+    __slots__ = ('parkingLotId', 'spaces', 'occupied', 'reportedTotal', 'reportedAvailable',
+                 'reportedAt')
+
+    def __init__(self, parkingLotId, spaces=0, occupied=0, reportedTotal=None,
+                 reportedAvailable=None, reportedAt=None):
+        self.parkingLotId = parkingLotId
+        self.spaces = spaces
+        self.occupied = occupied
+        self.reportedTotal = reportedTotal
+        self.reportedAvailable = reportedAvailable
+        self.reportedAt = reportedAt
+
+    @property
+    def available(self):
+        return self.spaces - self.occupied
+#---end LotState
+
+
+# Example:
+#   store = OccupancyStore()
+#   store.refresh()             # seed it from getSensors()
+#   store.attach()
+#   store.start(interval=900)   # reconcile every 15 minutes
+#   client = MQTT.connect()
+#   client.loop_start()
+#   print(store.lot(parkingLotId).available)
+#   print(store.space(sensorId).status)
+#
+# Updates take a lock that is only held for one sensor at a time. Queries
+# take no lock: they read whole SpaceState / LotState objects that updates
+# replace rather than change. The one exception is spacesInLot, which takes
+# the lock to copy a lot's sensors after one has joined or left it.
+# Car Presence packets don't say which lot a sensor is in, so a sensor is
+# only counted in a lot once a snapshot has placed it there.
+class OccupancyStore(object):
+    def __init__(self):
+        # sensorId -> SpaceState
+        self.spaces = {}
+        # parkingLotId -> LotState
+        self.lots = {}
+        # parkingLotId -> set of sensorIds, changed with the lock held
+        self.members = {}
+        # parkingLotId -> tuple copy of its members for spacesInLot, dropped
+        # when the set changes
+        self.memberSnapshots = {}
+        self.lock = threading.Lock()
+        # Counters, see stats()
+        self.updates = 0
+        self.stale = 0
+        self.corrections = 0
+        self.reconciles = 0
+        self.lastReconcile = None
+        self.stopping = threading.Event()
+        self.thread = None
+
+    # Start / stop receiving the events MQTT.py dispatches
+    def attach(self):
+        MQTT.addEventHandler(MQTT.CarPresenceEvent, self.onCarPresence)
+        MQTT.addEventHandler(MQTT.LotCountEvent, self.onLotCount)
+        return self
+
+    def detach(self):
+        MQTT.removeEventHandler(MQTT.CarPresenceEvent, self.onCarPresence)
+        MQTT.removeEventHandler(MQTT.LotCountEvent, self.onLotCount)
+
+    #--------------------------------Updates-----------------------------------------
+
+    def onCarPresence(self, event):
+        with self.lock:
+            old = self.spaces.get(event.sensorId)
+            if old is not None and isStale(event, old):
+                # A retained or redelivered packet older than what we have
+                self.stale += 1
+                return
+            self.updates += 1
+            self.setSpace(old, SpaceState(
+                event.sensorId, None if old is None else old.parkingLotId,
+                event.parkingSpace if old is None else old.parkingSpace,
+                event.status, event.carPresence, event.battery, event.gatewayTime,
+                event.serverTime, 'mqtt', time.time()))
+
+    def onLotCount(self, event):
+        with self.lock:
+            lot = self.lots.get(event.parkingLotId)
+            spaces, occupied = (0, 0) if lot is None else (lot.spaces, lot.occupied)
+            self.lots[event.parkingLotId] = LotState(event.parkingLotId, spaces, occupied,
+                                                     event.totalNumberOfSpaces,
+                                                     event.availableSpaces, time.time())
+
+    # Put a new state in place of 'old' and move the lot counts by the
+    # difference. Called with the lock held.
+    def setSpace(self, old, new):
+        self.spaces[new.sensorId] = new
+        if old is not None and old.parkingLotId == new.parkingLotId:
+            if old.occupied != new.occupied:
+                self.adjustLot(new.parkingLotId, 0, 1 if new.occupied else -1)
+            return
+        if old is not None:
+            self.adjustLot(old.parkingLotId, -1, -1 if old.occupied else 0)
+            self.moveMember(old.parkingLotId, old.sensorId, False)
+        self.adjustLot(new.parkingLotId, 1, 1 if new.occupied else 0)
+        self.moveMember(new.parkingLotId, new.sensorId, True)
+
+    def removeSpace(self, sensorId):
+        old = self.spaces.pop(sensorId, None)
+        if old is not None:
+            self.adjustLot(old.parkingLotId, -1, -1 if old.occupied else 0)
+            self.moveMember(old.parkingLotId, sensorId, False)
+
+    def adjustLot(self, parkingLotId, spaces, occupied):
+        if parkingLotId is None:
+            return
+        lot = self.lots.get(parkingLotId)
+        if lot is None:
+            lot = LotState(parkingLotId)
+        self.lots[parkingLotId] = LotState(parkingLotId, lot.spaces + spaces, lot.occupied + occupied,
+                                           lot.reportedTotal, lot.reportedAvailable, lot.reportedAt)
+
+    # Only happens when a sensor joins or leaves a lot, not on status changes
+    def moveMember(self, parkingLotId, sensorId, add):
+        if parkingLotId is None:
+            return
+        members = self.members.get(parkingLotId)
+        if members is None:
+            members = set()
+            self.members[parkingLotId] = members
+        if add:
+            members.add(sensorId)
+        else:
+            members.discard(sensorId)
+        self.memberSnapshots.pop(parkingLotId, None)
+
+    #--------------------------------Reconcile---------------------------------------
+
+    # Make the store match a getSensors() snapshot fetched at 'fetchedAt'
+    # (time.time()). Sensors updated over MQTT after the snapshot was fetched
+    # keep their status. Returns the number of sensors whose status the
+    # snapshot corrected or that were added or removed.
+    def reconcile(self, sensors, fetchedAt=None):
+        if fetchedAt is None:
+            fetchedAt = time.time()
+        seeded = self.reconciles > 0
+        corrections = 0
+        seen = set()
+        for sensor in sensors:
+            seen.add(sensor.sensorId)
+            with self.lock:
+                old = self.spaces.get(sensor.sensorId)
+                if old is not None and old.updatedAt >= fetchedAt:
+                    # Newer than the snapshot, only take where the sensor is
+                    new = SpaceState(old.sensorId, sensor.parkingLotId, sensor.parkingSpace,
+                                     old.status, old.carPresence, old.battery, old.gatewayTime,
+                                     old.serverTime, old.source, old.updatedAt)
+                else:
+                    new = SpaceState(sensor.sensorId, sensor.parkingLotId, sensor.parkingSpace,
+                                     sensor.status, sensor.carPresence, sensor.battery,
+                                     MQTT.parseTime(sensor.gateWayTime),
+                                     None if old is None else old.serverTime, 'rest', fetchedAt)
+                    if old is None or (old.status, old.carPresence) != (new.status, new.carPresence):
+                        corrections += 1
+                self.setSpace(old, new)
+        with self.lock:
+            for sensorId in [sensorId for sensorId, state in self.spaces.items()
+                             if sensorId not in seen and state.updatedAt < fetchedAt]:
+                self.removeSpace(sensorId)
+                corrections += 1
+            self.reconciles += 1
+            self.lastReconcile = fetchedAt
+            # The first snapshot only seeds the store, it doesn't correct anything
+            if seeded:
+                self.corrections += corrections
+        return corrections if seeded else 0
+
+    # Fetch a getSensors() snapshot and reconcile with it. Returns the number
+    # of corrections, None if the sensors couldn't be fetched.
+    def refresh(self):
+        fetchedAt = time.time()
+        sensors = REST.getSensors()
+        if sensors is None:
+            return None
+        return self.reconcile(sensors, fetchedAt)
+
+    # Reconcile every 'interval' seconds from a background thread
+    def start(self, interval=900):
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.reconcileLoop, args=(interval,), daemon=True,
+                                       name="OccupancyStore")
+        self.thread.start()
+
+    def reconcileLoop(self, interval):
+        while not self.stopping.wait(interval):
+            try:
+                corrections = self.refresh()
+            except REST.PlacePodError as error:
+                print("Error: couldn't reconcile occupancy - " + str(error))
+                continue
+            if corrections:
+                print("Occupancy reconcile corrected " + str(corrections) + " sensors")
+
+    def stop(self):
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    #--------------------------------Queries-----------------------------------------
+
+    # SpaceState of a sensor, None if it isn't known
+    def space(self, sensorId):
+        return self.spaces.get(sensorId)
+
+    # LotState of a lot, None if it isn't known
+    def lot(self, parkingLotId):
+        return self.lots.get(parkingLotId)
+
+    # Spaces available in a lot, counted from its sensors
+    def available(self, parkingLotId):
+        lot = self.lots.get(parkingLotId)
+        return None if lot is None else lot.available
+
+    # SpaceStates of the sensors in a lot, optionally only occupied or vacant ones
+    def spacesInLot(self, parkingLotId, occupied=None):
+        members = self.memberSnapshots.get(parkingLotId)
+        if members is None:
+            with self.lock:
+                members = tuple(self.members.get(parkingLotId, ()))
+                self.memberSnapshots[parkingLotId] = members
+        spaces = []
+        for sensorId in members:
+            state = self.spaces.get(sensorId)
+            if state is not None and (occupied is None or state.occupied == occupied):
+                spaces.append(state)
+        return spaces
+
+    # Update, stale packet, correction and reconcile counts
+    def stats(self):
+        return {'sensors': len(self.spaces), 'lots': len(self.lots), 'updates': self.updates,
+                'stale': self.stale, 'corrections': self.corrections,
+                'reconciles': self.reconciles, 'lastReconcile': self.lastReconcile}
+#---end OccupancyStore
+
+
+def isOccupied(carPresence, status):
+    if carPresence is not None:
+        return carPresence in OCCUPIED
+    return status is not None and status != 'vacant'
+
+# True if a Car Presence event is older than the state it would replace.
+# ServerTime is compared when both have one, since gateway clocks drift.
+def isStale(event, old):
+    if event.serverTime is not None and old.serverTime is not None and event.serverTime != old.serverTime:
+        return event.serverTime < old.serverTime
+    return isOlder(event.gatewayTime, old.gatewayTime)
+
+# True if time 'a' is known to be before time 'b'
+def isOlder(a, b):
+    return a is not None and b is not None and a < b
@@ -0,0 +1,252 @@
+# --------------------------------------------------#
+# Parquet sensor history export                     #
+# File: ParquetExport.py                            #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Streams sensor history from the api straight into #
+# Parquet files partitioned by parkingLotId and     #
+# date, without building Sensor objects. Rows are   #
+# buffered per partition and written as row groups, #
+# and the buffers are flushed early whenever they   #
+# would go over the memory budget, so exports of    #
+# any size use a fixed amount of memory.            #
+#                                                   #
+# Usage: python -m placepod.ParquetExport           #
+#        --start 2017-09-01                         #
+#        --end 2017-10-01 --output history          #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import urllib.parse
+
+import pyarrow # Columnar buffers and Parquet files
+import pyarrow.parquet
+
+from . import REST # Streaming history call
+from . import HistoryFetcher # Window and time helpers
+
+
+# Strings that repeat on almost every row are dictionary encoded
+DICTIONARY = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+
+# Columns of the files. parkingLotId and the date are in the directory names
+# (hive partitioning), so they aren't repeated inside the files.
+SCHEMA = pyarrow.schema([
+    ('sensorId', DICTIONARY),
+    ('parkingSpace', DICTIONARY),
+    ('parkingLot', DICTIONARY),
+    ('status', DICTIONARY),
+    ('network', DICTIONARY),
+    ('carPresence', pyarrow.int8()),
+    ('gatewayTime', pyarrow.timestamp('ms', tz='UTC')),
+    # SENtral time is sometimes a time and sometimes ticks, keep it as sent
+    ('sentralTime', pyarrow.string()),
+    ('temperature', pyarrow.float32()),
+    ('battery', pyarrow.float32()),
+    ('lat', pyarrow.float64()),
+    ('lon', pyarrow.float64()),
+])
+
+COLUMNS = SCHEMA.names
+
+
+# Example:
+#   writer = HistoryParquetWriter("history", memoryBudget=256 * 1024 * 1024)
+#   for row in REST.streamPost("/api/sensor/history", params, None):
+#       writer.add(row)
+#   writer.close()
+#
+# Files are written to root/parkingLotId=<id>/date=<YYYY-MM-DD>/part-<n>.parquet
+# and can be read back with pyarrow.dataset.dataset(root, partitioning='hive').
+#   rowGroupSize: rows buffered for a partition before they are written as a row group
+#   memoryBudget: bytes the buffered rows may take up in total
+#   maxOpenFiles: Parquet files kept open at once, the least recently used is
+#                 closed first and a new part is started if it gets more rows
+#   compression: Parquet compression codec
+class HistoryParquetWriter(object):
+    def __init__(self, root, rowGroupSize=100000, memoryBudget=256 * 1024 * 1024,
+                 maxOpenFiles=32, compression='zstd'):
+        self.root = root
+        self.rowGroupSize = rowGroupSize
+        self.memoryBudget = memoryBudget
+        self.maxOpenFiles = maxOpenFiles
+        self.compression = compression
+        # partition -> {column: list of values}
+        self.buffers = {}
+        self.bufferedRows = 0
+        # Measured from the first row, see rowBytes()
+        self.bytesPerRow = None
+        # partition -> ParquetWriter, in least recently used order
+        self.writers = {}
+        self.parts = {}
+        self.rowCount = 0
+        self.files = []
+
+    # Add one history row as decoded from the api (a dictionary)
+    def add(self, row):
+        # The date is the first 10 characters of the UTC gatewayTime
+        date = (row.get('gatewayTime') or '')[:10] or 'unknown'
+        partition = (row.get('parkingLotId') or 'unknown', date)
+        buffer = self.buffers.get(partition)
+        if buffer is None:
+            buffer = {}
+            for column in COLUMNS:
+                buffer[column] = []
+            self.buffers[partition] = buffer
+        for column in COLUMNS:
+            buffer[column].append(row.get(column))
+        self.bufferedRows += 1
+        self.rowCount += 1
+
+        if self.bytesPerRow is None:
+            self.bytesPerRow = rowBytes(row)
+        if len(buffer['sensorId']) >= self.rowGroupSize:
+            self.flush(partition)
+        elif self.bufferedRows * self.bytesPerRow > self.memoryBudget:
+            # Over budget: write out the biggest buffer as a smaller row group
+            self.flush(max(self.buffers, key=lambda key: len(self.buffers[key]['sensorId'])))
+
+    def addAll(self, rows):
+        for row in rows:
+            self.add(row)
+
+    # Write a partition's buffered rows as one row group
+    def flush(self, partition):
+        buffer = self.buffers.pop(partition, None)
+        if buffer is None:
+            return
+        count = len(buffer['sensorId'])
+        self.bufferedRows -= count
+        arrays = []
+        for field in SCHEMA:
+            values = buffer[field.name]
+            if field.type == DICTIONARY:
+                array = pyarrow.array(values, pyarrow.string()).dictionary_encode()
+            elif field.type == pyarrow.string():
+                array = pyarrow.array([None if value is None else str(value) for value in values],
+                                      pyarrow.string())
+            elif pyarrow.types.is_timestamp(field.type):
+                # ISO 8601 strings are parsed by Arrow in one go
+                array = pyarrow.array(values, pyarrow.string()).cast(field.type)
+            else:
+                array = pyarrow.array(values).cast(field.type)
+            arrays.append(array)
+            # Let the Python values go as soon as their column is built
+            buffer[field.name] = None
+        self.writer(partition).write_table(pyarrow.Table.from_arrays(arrays, schema=SCHEMA),
+                                           row_group_size=count)
+
+    # Open Parquet writer for a partition, closing the least recently used
+    # one if too many are open
+    def writer(self, partition):
+        writer = self.writers.pop(partition, None)
+        if writer is None:
+            if len(self.writers) >= self.maxOpenFiles:
+                oldest = next(iter(self.writers))
+                self.writers.pop(oldest).close()
+            lotId, date = partition
+            directory = os.path.join(self.root, "parkingLotId=" + urllib.parse.quote(lotId, safe=''),
+                                     "date=" + date)
+            os.makedirs(directory, exist_ok=True)
+            part = self.parts.get(partition, 0)
+            path = os.path.join(directory, "part-%05d.parquet" % part)
+            # Earlier exports to the same root leave parts behind, don't overwrite them
+            while os.path.exists(path):
+                part += 1
+                path = os.path.join(directory, "part-%05d.parquet" % part)
+            self.parts[partition] = part + 1
+            writer = pyarrow.parquet.ParquetWriter(path, SCHEMA, compression=self.compression,
+                                                   use_dictionary=True)
+            self.files.append(path)
+        self.writers[partition] = writer
+        return writer
+
+    # Write everything still buffered and close the files
+    def close(self):
+        for partition in list(self.buffers):
+            self.flush(partition)
+        for writer in self.writers.values():
+            writer.close()
+        self.writers.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        self.close()
+#---end HistoryParquetWriter
+
+
+# Rough bytes a buffered row takes up: every value plus a list slot for it
+def rowBytes(row):
+    return sum(sys.getsizeof(row.get(column)) + 8 for column in COLUMNS)
+#---end rowBytes
+
+
+# Stream the history of every sensor in sensorIds for startTime..endTime into
+# a HistoryParquetWriter, one window per call. Returns the number of rows.
+def exportHistory(writer, sensorIds, startTime, endTime, window=datetime.timedelta(days=1)):
+    start = HistoryFetcher.toDatetime(startTime)
+    end = HistoryFetcher.toDatetime(endTime)
+    windows = HistoryFetcher.HistoryFetcher(window=window).windows(start, end)
+    rows = 0
+    for sensorId in sensorIds:
+        for index, (windowStart, windowEnd) in enumerate(windows):
+            params = json.dumps({'sensorId': sensorId,
+                                 'startTime': HistoryFetcher.formatTime(windowStart),
+                                 'endTime': HistoryFetcher.formatTime(windowEnd)})
+            last = index == len(windows) - 1
+            # No object hook, so the decoded dictionaries go straight into the buffers
+            for row in REST.streamPost("/api/sensor/history", params, None):
+                time = row.get('gatewayTime') or ''
+                # Rows on a window's end belong to the next window
+                if not last and time and REST.parseTime(time) >= windowEnd:
+                    continue
+                writer.add(row)
+                rows += 1
+    return rows
+#---end exportHistory
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export PlacePod sensor history to Parquet")
+    parser.add_argument('--start', required=True, help="start of the history range, ISO 8601")
+    parser.add_argument('--end', required=True, help="end of the history range (exclusive), ISO 8601")
+    parser.add_argument('--output', default="history", help="directory to write the dataset to")
+    parser.add_argument('--sensor', action='append', dest='sensorIds',
+                        help="only export this sensor, can be repeated")
+    parser.add_argument('--window-hours', type=float, default=24,
+                        help="hours of history fetched by a single call")
+    parser.add_argument('--row-group-size', type=int, default=100000)
+    parser.add_argument('--memory-mb', type=int, default=256, help="memory budget for buffered rows")
+    parser.add_argument('--server', default=os.environ.get('PLACEPOD_API_SERVER', REST.API_SERVER))
+    parser.add_argument('--api-key', default=os.environ.get('PLACEPOD_API_KEY', REST.API_KEY))
+    args = parser.parse_args(argv)
+
+    if args.api_key == '':
+        print("API key not set! Use --api-key or PLACEPOD_API_KEY", file=sys.stderr)
+        return 2
+    REST.setClient(REST.RestClient(args.server, args.api_key))
+    sensorIds = args.sensorIds
+    if sensorIds is None:
+        sensorIds = [sensor.sensorId for sensor in REST.getSensors() or ()]
+
+    writer = HistoryParquetWriter(args.output, args.row_group_size, args.memory_mb * 1024 * 1024)
+    try:
+        with writer:
+            rows = exportHistory(writer, sensorIds, args.start, args.end,
+                                 datetime.timedelta(hours=args.window_hours))
+    except REST.PlacePodError as error:
+        print("Error: " + str(error), file=sys.stderr)
+        return 1
+    print("Wrote " + str(rows) + " rows to " + str(len(writer.files)) + " files in " + args.output)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
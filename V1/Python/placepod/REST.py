@@ -0,0 +1,1592 @@
+# --------------------------------------------------#
+# Python WEB API client                             #
+# File: REST.py                                     #
+# Author: Scott Williams swilliams@pnicorp.com      #
+# Date: June 8th, 2017                              #
+# Last updated: October 18th, 2026                  #
+# Developed in: PyCharm Community Edition 2016.3.2  #
+# Project interpreter: 3.5.0                        #
+# Tests the Rest Web API for PlacePod. This program #
+# assumes that the gotten data will conform to the  #
+# below class objects. Program may crash otherwise. #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import codecs
+import datetime
+import random
+import sys
+import threading
+import time
+import json # Used to deserialize JSON obtained from the get call
+from . import JsonDecoder # Fast decoding of the JSON straight from the response bytes
+
+
+# To get these values: 1) Login to PNI cloud account at https://parking.pnicloud.com
+#                      2) Click on settings > REST API
+#                      3) Click "Generate API Key"
+#                      4) Copy the API URL and the API Key into the below values
+API_SERVER = "https://api.pnicloud.com"
+API_KEY = ""
+
+
+def main():
+    print("This first sample application will test the get, insert, update, and "
+          + "remove function of 'gateways', 'parking lots' and 'sensors'")
+    userInput = input("Run first sample application (y/n)? ")
+    if userInput == 'y' or userInput == 'Y':
+        try:
+            getInsertUpdateRemoveTests()
+        except PlacePodError as error:
+            print("Error: " + str(error))
+            print("Exiting...")
+
+    print("This second sample application will test the other 'sensor' operations. "
+          + "A sensor ID must be provided to proceed.")
+    userInput = input("Run second sample application (y/n)? ")
+    if userInput == 'y' or userInput == 'Y':
+        sensorId = input("Enter sensor ID: ")
+        try:
+            sensorOperations(sensorId)
+        except PlacePodError as error:
+            print("Error: " + str(error))
+            print("Exiting...")
+
+
+#--------------------------------First Sample Application----------------------------#
+# Title: Get/Insert/Update/Remove tests:  'getInsertUpdateRemoveTests()'             #
+#                                                                                    #
+# Description: Program will do the following (CRUD) tasks, waiting for input         #
+# between tasks for user verification:                                               #
+#   1) Get all parking lots                                                          #
+#   2) Get all sensors                                                               #
+#   3) Get all gateways                                                              #
+#   4) Insert a new 'test' parking lot and get its ID                                #
+#   5) Update the 'test' parking lot using its ID                                    #
+#   6) Insert a new 'test' sensor to the 'test' lot                                  #
+#   7) Update the 'test' sensor                                                      #
+#   8) Insert a new 'test' gateway                                                   #
+#   9) Update the 'test' gateway using its ID                                        #
+#  10) Remove the 'test' gateway                                                     #
+#  11) Remove the 'test' sensor                                                      #
+#  12) Remove the 'test' parking lot                                                 #
+# NOTE: If all tasks complete, then there will be no test data left on your account  #
+# from this test application.                                                        #
+#                                                                                    #
+# If a task fails, the error message will be displayed in the output, and the        #
+# program will stop since several tasks rely on the results of the previous tasks.   #
+# Calls that fail with a temporary error (429, 5xx) are retried first. You will also #
+# want to remove any test data left on your account due to the insert calls. This    #
+# can be done on either the API's Swagger page or through the parking Cloud.         #
+#------------------------------------------------------------------------------------#
+def getInsertUpdateRemoveTests():
+
+#----- Get Parking Lots -----
+    # Test '/api/parking-lots'
+    parkingLots = getParkingLots()
+    # Sample iteration of retrieved parking lot data
+    print("Got " + str(len(parkingLots)) + " Parking Lots: ")
+    for i in range(0, len(parkingLots)):
+        print("--> " + parkingLots[i].id + ": " + parkingLots[i].name)
+    print("")
+    wait()
+
+#----- Get Sensors -----
+    # Test '/api/sensors'
+    sensors = getSensors()
+    # Sample iteration of retrieved sensor data
+    print("Got " + str(len(sensors)) + " Sensors: ")
+    for i in range(0, len(sensors)):
+        print("--> " + sensors[i].sensorId + ": " + sensors[i].parkingSpace + ", "
+              + sensors[i].status + ", " + sensors[i].parkingLot)
+    print("")
+    wait()
+
+#----- Get Gateways -----
+    # Test '/api/gateways'
+    gateways= getGateways()
+    # Sample iteration of retrieved gateway data
+    print("Got " + str(len(gateways)) + " Gateways: ")
+    for i in range(0, len(gateways)):
+        print("--> " + gateways[i].gatewayMac + ": " + gateways[i].name)
+    print("")
+    wait()
+
+#----- Insert Parking Lot -----
+    # 'JSON' object for inserting a new parking lot. Used += just for JSON readability
+    params =  "{"
+    params +=   " 'parkingLotName': 'TEST: python-api-lot-insert', "
+    params +=   " 'description': 'python client test', "
+    params +=   " 'streetAddress': '123 here', "
+    params +=   " 'latitude': '33.810280507079874', "
+    params +=   " 'longitude': '-117.9189795255661' "
+    params += "}"
+    # Test '/api/parking-lot/insert'
+    insertParkingLot(params)
+    # Get the id of the parking lot inserted above for further operations
+    parkingLots = getParkingLots()
+    parkingLotId = ""
+    for i in range(0, len(parkingLots)):
+        if parkingLots[i].name == 'TEST: python-api-lot-insert':
+            parkingLotId = parkingLots[i].id
+    print("ID of inserted parking lot: " + parkingLotId)
+    wait()
+
+#----- Update Parking Lot -----
+    # 'JSON' object for updating the name of the new parking lot
+    params =  "{"
+    params +=   " 'id': '" + parkingLotId + "', "
+    params +=   " 'parkingLotName': 'TEST: python-api-lot-update' "
+    params += "}"
+    # Test '/api/parking-lot/update'
+    updateParkingLot(params)
+    wait()
+
+#----- Insert Sensor -----
+    sensorId = "abcd12340987fedc"
+    # 'JSON' Object for inserting a new sensor
+    params =  "{"
+    params +=   " 'sensorId': '" + sensorId + "', "
+    params +=   " 'parkingSpace': 'TEST: python-api-sensor-insert', "
+    params +=   " 'parkingLotId': '" + parkingLotId + "', "
+    params +=   " 'network': 'PNI', "
+    params +=   " 'disabled': false, "
+    params +=   " 'latitude':  33, "
+    params +=   " 'longitude': -111 "
+    params += "}"
+    # Test '/api/sensor/insert'
+    insertSensor(params)
+    wait()
+
+#----- Update Sensor -----
+    # 'JSON' Object for updating the name and location of the new sensor
+    params =  "{"
+    params +=   " 'sensorId': '" + sensorId + "', "
+    params +=   " 'parkingSpace': 'TEST: python-api-sensor-update', "
+    params +=   " 'latitude':  33.810280507079874, "
+    params +=   " 'longitude': -117.9189795255661 "
+    params += "}"
+    # Test '/api/sensor/update'
+    updateSensor(params)
+    wait()
+
+#----- Insert Gateway -----
+    # 'JSON' Object for inserting a new gateway
+    params =  "{"
+    params +=   " 'gatewayMac': 'cdef78904321dcba', "
+    params +=   " 'gatewayName':  'TEST: python-api-gateway-insert', "
+    params +=   " 'parkingLotId': '" + parkingLotId + "' "
+    params += "}"
+    # Test '/api/gateway/insert'
+    insertGateway(params)
+    # Get the id of the gateway inserted above for further operations
+    gateways = getGateways()
+    gatewayId = ""
+    for i in range(0, len(gateways)):
+        if gateways[i].gatewayMac == "cdef78904321dcba":
+            gatewayId = gateways[i].id
+    print("ID of inserted gateway: " + gatewayId)
+    wait()
+
+#----- Update Gateway -----
+    # 'JSON' Object for updating the name of the new gateway
+    params =  "{"
+    params +=   " 'id': '" + gatewayId + "', "
+    params +=   " 'gatewayName': 'TEST: python-api-gateway-update' "
+    params += "}"
+    # Test '/api/gateway/update'
+    updateGateway(params)
+    wait()
+
+#----- Remove Gateway -----
+    # 'JSON' Object for removing the new gateway
+    params =  "{"
+    params +=   " 'id': '" + gatewayId + "' "
+    params += "}"
+    # Test '/api/gateway/remove'
+    removeGateway(params)
+    wait()
+
+#----- Remove Sensor -----
+    # 'JSON' Object for removing the new sensor
+    params =  "{"
+    params +=   " 'sensorId': '" + sensorId + "', "
+    params += "}"
+    # Test '/api/sensor/remove'
+    removeSensor(params)
+    wait()
+
+#----- Remove Parking Lot -----
+    # 'JSON' for removing the new parking lot
+    params =  "{"
+    params +=   " 'id': '" + parkingLotId + "', "
+    params += "}"
+    # Test '/api/parkingLot/remove'
+    removeParkingLot(params)
+    wait()
+
+    print("First Sample Application Finished")
+#---end getInsertUpdateRemoveTests
+
+
+#--------------------------------Second Sample Application---------------------------#
+# Title: Sensor Operation tests:  'sensorOperations()'                               #
+#                                                                                    #
+# Description: This function tests non-CRUD sensor API functions and how to          #
+# properly call them. Note that while there can be used on a 'test' sensor that      #
+# doesn't actually exist, you will want to use this on a real installed sensor.      #
+# You can see the results of this test on the Parking Cloud by going to the sensor's #
+# diagnostic information.                                                            #
+# The tasks that can be optionally performed are:                                    #
+#   1) Get sensor history                                                            #
+#   2) Send a recalibrate                                                            #
+#   3) Run a full BIST test (give up to 5 minutes for a response)                    #
+#   4) Send a Ping and wait for response (up to 5 minutes)                           #
+#   5) Send a force vacant                                                           #
+#   6) Send a force occupied                                                         #
+#   7) Send a set lora wakeup interval to 5 minutes                                  #
+#   8) Send a set loRa Tx power call to 11dB                                         #
+#   9) Send a Tx spreading factor call to SF 7, BW 125 kHz                           #
+#  10) Send a set frequency sub band call to 902.3 kHz  - 903.7 kHz - 125k           #
+#                                                                                    #
+# NOTE: There are only so many requests that can be queued by a sensor at a time,    #
+# so it is suggested to not make rapid calls to the sensor and wait around a minute  #
+# before sending another call to the same sensor.                                    #
+#------------------------------------------------------------------------------------#
+def sensorOperations(sensorId):
+    print("Running operations using sensor: " + sensorId)
+    sensorId = str(sensorId)
+
+#--- Sensor History ---
+    # 'JSON' object for history. Time range here is 10 minutes apart.
+    # If your sensor was installed after this date, you may need to
+    # modify the time range
+    params =  "{"
+    params +=   " 'sensorId': '" + sensorId + "', "
+    params +=   " 'startTime': '2017-09-08T01:00:00.000Z', "
+    params +=   " 'endTime': '2017-09-08T01:10:00.000Z' "
+    params += "}"
+    # Test '/api/sensor/history'
+    # Requires a properly installed sensor
+    userInput = input("Get Sensor History (y/n)? ")
+    if userInput == "y" or userInput == "Y":
+        history = sensorHistory(params)
+        # Once history has been populated, you can iterate it to watch
+        # how various fields change over time. This is just a small 10
+        # minute test
+        print("Number of results: " + str(len(history)))
+        wait()
+
+    # 'JSON' object for a number of calls
+    idParam =  "{"
+    idParam +=   " 'sensorId': '" + sensorId + "' "
+    idParam += "}"
+
+#--- Recalibrate ---
+    userInput = input("Recalibrate sensor (y/n)? ")
+    if userInput == "y" or userInput == "Y":
+        # Test '/api/sensor/recalibrate'
+        recalibrate(idParam)
+        wait()
+
+#--- BIST ---
+    userInput = input("Run basic internal self test (BIST) (y/n)? ")
+    if userInput == "y" or userInput == "Y":
+        # Test '/api/sensor/initialize-bist' and '/api/sensor/bist-response/{SensorId}/{LastUpdated}'
+        bist(idParam, sensorId)
+        wait()
+
+#--- Ping Sensor ---
+    userInput = input("Ping sensor (y/n)? ")
+    if userInput == "y" or userInput == "Y":
+        # Test '/api/sensor/ping' and '/api/sensor/ping-response/{SensorId}/{LastUpdated}'
+        ping(idParam, sensorId)
+        wait()
+
+#--- Force Vacant ---
+    userInput = input("Force car presence to vacant (y/n)? ")
+    if userInput == "y" or userInput == "Y":
+        # Test '/api/sensor/force-vacant'
+        forceVacant(idParam)
+        wait()
+
+#--- Force Occupied ---
+    userInput = input("Force are presence to occupied (y/n)? ")
+    if userInput == "y" or userInput == "Y":
+        # Test '/api/sensor/force-occupied'
+        forceOccupied(params)
+        wait()
+
+#--- Set LoRa Wakeup Interval ---
+    userInput = input("Set LoRa Wakeup Interval to 5 minutes (y/n)?" )
+    if userInput == "y" or userInput == "Y":
+        # Test 'api/sensor/set-lora-wakeup-interval'
+        params =  "{"
+        params +=   " 'sensorId': '" + sensorId + "', "
+        params +=   " 'payload': 5 "
+        params += "}"
+        setLoraWakeupInterval(params)
+        wait()
+
+#--- Set LoRa Tx Power ---
+    userInput = input("Set LoRa Tx Power to 11 (y/n)? ")
+    if userInput == "y" or userInput == "Y":
+        # Carefully read the documentation on this function before using it since it can be dangerous!
+        # Test '/api/sensor/set-lora-tx-power'
+        params =  "{"
+        params +=   " 'sensorId': '" + sensorId + "', "
+        params +=   " 'payload': 11 "
+        params += "}"
+        setLoraTxPower(params)
+        wait()
+
+#--- Set Tx Spreading Factor ---
+    userInput = input("Set Tx Spreading Factor to SF 7, BW 125 kHz (y/n)? ")
+    if userInput == "y" or userInput == "Y":
+        # Carefully read the documentation on this function before using it since it can be dangerous!
+        # Test '/api/sensor/set-tx-spreading-factor'
+        params =  "{"
+        params +=   " 'sensorId': '" + sensorId + "', "
+        params +=   " 'payload': 6 "
+        params += "}"
+        setTxSpreadingFactor(params)
+        wait()
+
+#--- Set Frequency Sub Band ---
+    userInput = input("Set Frequency Sub Band to 902.3 kHz  -  903.7 kHz - 125k (y/n)? ")
+    if userInput == "y" or userInput == "Y":
+        # Carefully read the documentation on this function before using it since it can be dangerous!
+        # Test '/api/sensor/set-frequency-sub-band'
+        params =  "{"
+        params +=   " 'sensorId': '" + sensorId + "', "
+        params +=   " 'payload': 1 "
+        params += "}"
+        setFrequencySubBand(params)
+        wait()
+
+#---end sensorOperations
+
+
+#--------------------------------API Functions--------------------------------
+# These functions are listed as they appear on the Swagger API page.
+
+        # -------Placepod API-------
+
+    # ---------Gateway Functions---------
+
+# --- Get Gateways ---
+def getGateways():
+    print("Fetching Gateways...")
+    # Use the cached list if caching is enabled and it hasn't expired
+    payload = cachedList('gateways')
+    if payload is not None:
+        print("Get Gateways Success (cached)")
+        return payload
+    requestedAt = time.monotonic()
+    # Make the api get call and break the json into a list of Gateway objects
+    payload = fetch('GET', "/api/gateways", None, createGatewayPayload)
+    # Stop running if the get call returns empty JSON
+    if payload is None:
+        return
+    # Return the parking lots for later use
+    storeList('gateways', payload, requestedAt)
+    print("Get Gateways Success")
+    return payload
+#---end getGateways
+
+# --- Insert Gateway ---
+def insertGateway(params):
+    print("Inserting Gateway...")
+    try:
+        # Make the api post call
+        post("/api/gateway/insert", params)
+    finally:
+        # The cached list is out of date now, even if the call failed
+        invalidateList('gateways')
+    # If an error didn't occur, then the insert was successful
+    print("Gateway Insert Success")
+#---end insertGateway
+
+#--- Remove Gateway ---
+def removeGateway(params):
+    print("Removing Gateway...")
+    try:
+        # Make the api delete call
+        delete("/api/gateway/remove", params)
+    finally:
+        # The cached list is out of date now, even if the call failed
+        invalidateList('gateways')
+    # If an error didn't occur, then the update was successful
+    print("Gateway Remove Success")
+#---end removeGateway
+
+#--- Update Gateway ---
+def updateGateway(params):
+    print("Updating Gateway...")
+    try:
+        # Make the api put call
+        put("/api/gateway/update", params)
+    finally:
+        # The cached list is out of date now, even if the call failed
+        invalidateList('gateways')
+    # If an error didn't occur, then the update was successful
+    print("Gateway Update Success")
+#---end updateGateway
+
+    #---------Parking Lot Functions---------
+
+#--- Get Parking Lots ---
+def getParkingLots():
+    print("Fetching Parking Lots...")
+    # Use the cached list if caching is enabled and it hasn't expired
+    payload = cachedList('parkingLots')
+    if payload is not None:
+        print("Get Parking Lots Success (cached)")
+        return payload
+    requestedAt = time.monotonic()
+    # Make the api get call and break the json into a list of ParkingLot objects
+    payload = fetch('GET', "/api/parking-lots", None, createParkingLotPayload)
+    # Stop running if the get call returns empty JSON
+    if payload is None:
+        return
+    # Return the parking lots for later use
+    storeList('parkingLots', payload, requestedAt)
+    print("Get Parking Lots Success")
+    return payload
+#---end getParkingLots
+
+#--- Insert Parking Lot ---
+def insertParkingLot(params):
+    print("Inserting Parking Lot...")
+    try:
+        # Make the api post call
+        post("/api/parking-lot/insert", params)
+    finally:
+        # The cached list is out of date now, even if the call failed
+        invalidateList('parkingLots')
+    # If an error didn't occur, then the insert was successful
+    print("Parking Lot Insert Success")
+#---end insertParkingLot
+
+#--- Remove Parking Lot ---
+def removeParkingLot(params):
+    print("Removing Parking Lot...")
+    try:
+        # Make the api delete call
+        delete("/api/parking-lot/remove", params)
+    finally:
+        # The cached lists are out of date now, even if the call failed.
+        # Sensors carry the parking lot name so they are dropped too.
+        invalidateList('parkingLots')
+        invalidateList('sensors')
+    # If an error didn't occur, then the update was successful
+    print("Parking Lot Remove Success")
+#---end removeParkingLot
+
+#--- Update Parking Lot ---
+def updateParkingLot(params):
+    print("Updating Parking Lot...")
+    try:
+        # Make the api put call
+        put("/api/parking-lot/update", params)
+    finally:
+        # The cached lists are out of date now, even if the call failed.
+        # Sensors carry the parking lot name so they are dropped too.
+        invalidateList('parkingLots')
+        invalidateList('sensors')
+    # If an error didn't occur, then the update was successful
+    print("Parking Lot Update Success")
+#---end updateParkingLot
+
+    #---------Sensor Functions---------
+
+#--- Get Sensors ---
+def getSensors():
+    print("Fetching Sensors...")
+    # Use the cached list if caching is enabled and it hasn't expired
+    payload = cachedList('sensors')
+    if payload is not None:
+        print("Get Sensors Success (cached)")
+        return payload
+    requestedAt = time.monotonic()
+    # Sample sensor post request with no filters applied. Breaks the json
+    # into a list of Sensor objects
+    payload = fetch('POST', "/api/sensors", "{}", createSensorPayload)
+    # Stop running if the post call returns empty JSON
+    if payload is None:
+        return
+    # Return the sensors for later use
+    storeList('sensors', payload, requestedAt)
+    print("Get Sensors Success")
+    return payload
+#---end getSensors
+
+#--- Insert Sensor ---
+def insertSensor(params):
+    print("Inserting sensor...")
+    try:
+        # Make the post call
+        post("/api/sensor/insert", params)
+    finally:
+        # The cached list is out of date now, even if the call failed
+        invalidateList('sensors')
+    # If an error didn't occur, then the insert was successful
+    print("Sensor Insert Success")
+#---end insertSensor
+
+#--- Remove Sensor ---
+def removeSensor(params):
+    print("Removing Sensor...")
+    try:
+        # Make the api delete call
+        delete("/api/sensor/remove", params)
+    finally:
+        # The cached list is out of date now, even if the call failed
+        invalidateList('sensors')
+    # If an error didn't occur, then the update was successful
+    print("Sensor Remove Success")
+#---end removeSensor
+
+#--- Update Sensor ---
+def updateSensor(params):
+    print("Updating sensor...")
+    try:
+        # Make the api put call
+        put("/api/sensor/update", params)
+    finally:
+        # The cached list is out of date now, even if the call failed
+        invalidateList('sensors')
+    # If an error didn't occur, then the update was successful
+    print("Sensor Update Success")
+#---end updateSensor
+
+#--- Sensor History ---
+def sensorHistory(params):
+    print("Fetching Sensor history...")
+
+    # Breaks the json into a list of Sensor objects
+    payload = fetch('POST', "/api/sensor/history", params, createSensorPayload)
+    # Stop running if the post call returns empty JSON
+    if payload is None:
+        return
+    # Return the sensors for later use
+    print("Got Sensor History")
+    return payload
+#---end sensorHistory
+
+#--- Stream Sensors ---
+# Same as getSensors, but a generator that reads the response a chunk at a
+# time and yields each Sensor as soon as it has been read. Memory use stays
+# the same no matter how many sensors there are.
+def streamSensors():
+    return streamPost("/api/sensors", "{}", createSensorPayload)
+#---end streamSensors
+
+#--- Stream Sensor History ---
+# Same as sensorHistory, but yields the Sensor rows one at a time as the
+# response is read, so long time ranges don't need to fit in memory.
+def streamSensorHistory(params):
+    return streamPost("/api/sensor/history", params, createSensorPayload)
+#---end streamSensorHistory
+
+#--- Recalibrate ---
+def recalibrate(params):
+    print("Sending Recalibrate...")
+    # Make the post call
+    post("/api/sensor/recalibrate", params)
+    # If an error didn't occur, then the call was successful
+    print("Recalibrate Sent")
+#---end recalibrate
+
+#--- Command calls ---
+# The calls bist() and ping() make, for the batch and MQTT driven senders:
+# the call that sends each kind of command and the one its answer is
+# fetched from (followed by {SensorId}/{LastUpdated})
+COMMAND_CALLS = {
+    'bist': ("/api/sensor/initialize-bist", "/api/sensor/bist-response/"),
+    'ping': ("/api/sensor/ping", "/api/sensor/ping-response/"),
+}
+
+#--- BIST ---
+# This function handles
+#   1) api/sensor/initialize-bist
+#   2) api/sensor/bist-response/{SensorId}/{LastUpdated}
+def bist(params, sensorId):
+    print("Sending BIST...")
+
+    timeStr = commandTime()
+
+    # Make the post call
+    post("/api/sensor/initialize-bist", params)
+    # If an error didn't occur, then the call was successful
+    print("BIST Sent")
+
+    # We want to call the bist-response every second for 5 minutes
+    # or until a response comes back
+    timer = 0
+    while timer < 300:
+        # Make the get call
+        result = get("/api/sensor/bist-response/" + sensorId + "/" + timeStr)
+
+        payload = commandResponse(result)
+
+        # If we get a valid result, exit the loop
+        if payload is not None:
+            break
+
+        timer += 1
+        print("Waiting for Bist Response " + str(timer))
+        time.sleep(1)
+
+    # If we are outside the loop because of the timer, we didn't get a result
+    if timer >= 300:
+        print("No response...")
+        return
+
+    print("BIST response recieved!")
+    print(payload)
+    for i in range(0, len(payload)):
+        print("--> " + payload[i]["sensorType"] + ": " + payload[i]["status"])
+    print("")
+#---end bist
+
+#--- Ping ---
+# This function's implementation is very similar to BIST
+def ping(params, sensorId):
+    print("Sending Ping...")
+
+    timeStr = commandTime()
+
+    # Make the post call
+    post("/api/sensor/ping", params)
+    # If an error didn't occur, then the call was successful
+    print("Ping Sent")
+
+    # We want to call the ping-response every second for 5 minutes
+    # or until a response comes back
+    timer = 0
+    while timer < 300:
+        # Make the get call
+        result = get("/api/sensor/ping-response/" + sensorId + "/" + timeStr)
+
+        payload = commandResponse(result)
+
+        # If we get a valid result, exit the loop
+        if payload is not None:
+            break
+
+        timer += 1
+        print("Waiting for Ping Response " + str(timer))
+        time.sleep(1)
+
+    # If we are outside the loop because of the timer, we didn't get a result
+    if timer >= 300:
+        print("No response...")
+        return
+
+    print("Ping response recieved!")
+    print(payload)
+    for i in range(0, len(payload)):
+        print("--> Ping RSSI: " + str(payload[i]["pingRssi"]) + ", Ping SNR: " + str(payload[i]["pingSNR"])
+              + ". Server time: " + payload[i]["serverTime"])
+    print("")
+#---end ping
+
+#--- Force Vacant ---
+def forceVacant(params):
+    print("Sending Force Vacant...")
+    # Make the post call
+    post("/api/sensor/force-vacant", params)
+    print("Force Vacant Sent")
+#---end forceVacant
+
+#--- Force Occupied ---
+def forceOccupied(params):
+    print("Sending Force Occupied...")
+    # Make the post call
+    post("/api/sensor/force-occupied", params)
+    print("Force Occupied Sent")
+#---end forceOccupied
+
+#--- Set LoRa Wakeup Interval ---
+#  1)
+#  2) /api/sensor/set-tx-spreading-factor
+#  3) /api/sensor/set-frequency-sub-band
+def setLoraWakeupInterval(params):
+    print("Sending Set LoRa Wakeup Interval...")
+    # Make the post call
+    post("/api/sensor/set-lora-wakeup-interval", params)
+    print("Set LoRa Wakeup Interval Sent")
+#---end setLoraWakeupInterval
+
+#--- Set LoRa Tx Power ---
+def setLoraTxPower(params):
+    print("Sending Set LoRa Tx Power...")
+    # Make the post call
+    post("/api/sensor/set-lora-tx-power", params)
+    print("Set LoRa Tx Power Sent")
+#---end setLoraTxPower
+
+#--- Set Tx Spreading Factor ---
+def setTxSpreadingFactor(params):
+    print("Sending Set Tx Spreading Factor...")
+    # Make the post call
+    post("/api/sensor/set-tx-spreading-factor", params)
+    print("Set Tx Spreading Factor Sent")
+#---end setTxSpreadingFactor
+
+#--- Set Frequency Sub Band ---
+def setFrequencySubBand(params):
+    print("Sending Set Frequency Sub Band...")
+    # Make the post call
+    post("/api/sensor/set-frequency-sub-band", params)
+    print("Set Frequency Sub Band Sent")
+#---end setFrequencySubBand
+
+#--- Command helpers ---
+# Gross way to get current time in the format the *-response calls expect
+def commandTime():
+    return datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+#---end commandTime
+
+# Decode the body of a bist-response or ping-response call. Returns None
+# while the sensor hasn't answered yet, otherwise the list of responses.
+# The server sometimes returns the JSON as a string, so decode it twice.
+def commandResponse(result):
+    if result == b'"[]"' or result == b"[]":
+        return None
+    payload = JsonDecoder.loads(result)
+    if type(payload) is str:
+        payload = JsonDecoder.loads(payload)
+    return payload
+#---end commandResponse
+
+# Parse the ISO 8601 times used by the API into timezone aware datetimes
+# ('Z' isn't understood by fromisoformat before 3.11)
+def parseTime(timeStr):
+    if timeStr.endswith('Z'):
+        timeStr = timeStr[:-1] + '+00:00'
+    parsed = datetime.datetime.fromisoformat(timeStr)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
+#---end parseTime
+
+#-----------------------------------------------------------------------------------
+
+
+#--------------------------------List cache-----------------------------------------
+# Optional in-process cache in front of getGateways, getParkingLots and
+# getSensors. Each list is kept for its own number of seconds and is dropped
+# as soon as an insert, update or remove call changes that type of resource.
+# Off by default, turn it on with enableCache().
+
+# Seconds each list is kept for
+DEFAULT_CACHE_TTLS = {'gateways': 300, 'parkingLots': 300, 'sensors': 30}
+
+class ListCache(object):
+    def __init__(self, ttls=None):
+        self.ttls = dict(DEFAULT_CACHE_TTLS)
+        if ttls is not None:
+            self.ttls.update(ttls)
+        self.entries = {}
+        self.invalidated = {}
+        self.hits = dict.fromkeys(self.ttls, 0)
+        self.misses = dict.fromkeys(self.ttls, 0)
+        self.lock = threading.Lock()
+
+    # Cached list, or None if it isn't cached or has expired
+    def get(self, name):
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is None or entry[0] <= time.monotonic():
+                self.misses[name] = self.misses.get(name, 0) + 1
+                return
+            self.hits[name] = self.hits.get(name, 0) + 1
+            # Copy so callers changing the list don't change the cache
+            return list(entry[1])
+
+    # Cache a list fetched by a call started at 'requestedAt'. A list that was
+    # invalidated while the call was running is already out of date, so it
+    # isn't kept.
+    def put(self, name, payload, requestedAt):
+        with self.lock:
+            if requestedAt < self.invalidated.get(name, 0):
+                return
+            self.entries[name] = (time.monotonic() + self.ttls.get(name, 0), list(payload))
+
+    def invalidate(self, name):
+        with self.lock:
+            self.entries.pop(name, None)
+            self.invalidated[name] = time.monotonic()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    # Hit and miss counts per list
+    def stats(self):
+        with self.lock:
+            return {'hits': dict(self.hits), 'misses': dict(self.misses)}
+#---end ListCache
+
+listCache = None
+
+# Turn on the list cache, e.g. enableCache({'sensors': 10}). Returns the cache
+# so its stats() can be read.
+def enableCache(ttls=None):
+    global listCache
+    listCache = ListCache(ttls)
+    return listCache
+#---end enableCache
+
+def disableCache():
+    global listCache
+    listCache = None
+#---end disableCache
+
+def cachedList(name):
+    cache = listCache
+    if cache is None:
+        return
+    return cache.get(name)
+
+def storeList(name, payload, requestedAt):
+    cache = listCache
+    if cache is not None and payload is not None:
+        cache.put(name, payload, requestedAt)
+
+def invalidateList(name):
+    cache = listCache
+    if cache is not None:
+        cache.invalidate(name)
+#-----------------------------------------------------------------------------------
+
+
+#--------------------------------Instrumentation------------------------------------
+# Every api call can be reported to call observers: functions that are given
+# a CallRecord once the call is over. Nothing is timed or recorded while no
+# observer is added, so this costs one list check per call when it is off.
+# Metrics.PrometheusExporter is an observer that keeps Prometheus metrics.
+
+# Functions called with the CallRecord of every api call
+callObservers = []
+
+def addCallObserver(observer):
+    callObservers.append(observer)
+
+def removeCallObserver(observer):
+    if observer in callObservers:
+        callObservers.remove(observer)
+
+# Measurements of one api call
+#   endpoint: path of the call without ids, e.g. /api/sensor/ping-response
+#   status: HTTP status of the last attempt, None if the server couldn't be reached
+#   bytes: size of the response body
+#   attempts: number of times the call was sent, more than 1 if it was retried
+#   network: seconds spent sending the call and reading the response, over all
+#            attempts but without the time waited between them
+#   decode: seconds spent parsing the JSON
+#   model: seconds spent building model objects from the parsed JSON
+#   error: name of the PlacePodError the call raised, None if it succeeded
+#   streamed: True if the body was decoded while it was read. Reading,
+#             parsing and building the models then all count as decode.
+class CallRecord(object):
+    __slots__ = ('method', 'endpoint', 'urlPath', 'status', 'bytes', 'attempts', 'network',
+                 'decode', 'model', 'error', 'streamed')
+
+    def __init__(self, method, urlPath):
+        self.method = method
+        self.endpoint = endpointName(urlPath)
+        self.urlPath = urlPath
+        self.status = None
+        self.bytes = 0
+        self.attempts = 0
+        self.network = 0.0
+        self.decode = 0.0
+        self.model = 0.0
+        self.error = None
+        self.streamed = False
+#---end CallRecord
+
+# Path of an api call without the ids in it, so that every
+# /api/sensor/ping-response/{SensorId}/{LastUpdated} call is one endpoint
+def endpointName(urlPath):
+    return "/".join(urlPath.split("/")[:4])
+
+def publishCall(record):
+    for observer in list(callObservers):
+        try:
+            observer(record)
+        except Exception as error:
+            # A broken observer shouldn't break the api call
+            print("Warning: call observer failed - " + repr(error))
+#---end publishCall
+#-----------------------------------------------------------------------------------
+
+
+#--------------------------------HTTP request methods--------------------------------
+
+#--- Lazy requests import ---
+# requests takes longer to import than the rest of this file, so it is only
+# imported when the first RestClient is created. Code that only uses the
+# models and helpers never loads it.
+requests = None
+
+def loadRequests():
+    global requests
+    if requests is None:
+        import requests.adapters # Used to make calls to the api, with pooled connections
+    return requests
+#---end loadRequests
+
+#--- REST Client ---
+# Holds one requests.Session for the API server so that every call reuses a
+# pooled, kept-alive connection instead of opening a new TCP+TLS connection.
+# The headers are built once here rather than on every request.
+#   poolConnections: number of per-host connection pools to keep
+#   poolSize: max number of connections kept open to the server
+#   keepAlive: set to False to close the connection after every request
+#   timeout: seconds to wait on the server before giving up
+#   retryPolicy: RetryPolicy for failed calls, RetryPolicy(retries=0) turns retries off
+#   breakerThreshold: failures in a row before an endpoint's circuit breaker opens
+#   breakerReset: seconds an open circuit breaker waits before trying the endpoint again
+class RestClient(object):
+    def __init__(self, server=None, apiKey=None, poolConnections=1, poolSize=10,
+                 keepAlive=True, timeout=60, retryPolicy=None, breakerThreshold=5,
+                 breakerReset=30):
+        # Fall back on the module values so existing configuration still works
+        self.server = API_SERVER if server is None else server
+        self.apiKey = API_KEY if apiKey is None else apiKey
+        self.timeout = timeout
+
+        loadRequests()
+        self.adapter = requests.adapters.HTTPAdapter(pool_connections=poolConnections,
+                                                     pool_maxsize=poolSize)
+        self.session = requests.Session()
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+        # Include the api key into the header of every request
+        self.session.headers.update({'X-API-KEY': self.apiKey,
+                                     'Connection': 'keep-alive' if keepAlive else 'close'})
+        # Must set content-type on calls with a body or else a 415 responce error will occur
+        self.jsonHeaders = {'content-type': 'application/json; charset=utf-8'}
+
+        self.retryPolicy = RetryPolicy() if retryPolicy is None else retryPolicy
+        self.breakers = CircuitBreakers(breakerThreshold, breakerReset)
+
+        self.requestCount = 0
+        self.lock = threading.Lock()
+
+    # Make an api call and return the 200 response. Failed calls are retried
+    # as allowed by the retry policy and then raised as a PlacePodError.
+    # Calls to an endpoint whose circuit breaker is open fail straight away
+    # with CircuitOpenError.
+    # A CallRecord passed in is filled in and left for the caller to publish,
+    # otherwise one is made and published here while there are call observers.
+    def send(self, method, urlPath, data=None, stream=False, record=None):
+        publish = record is None and len(callObservers) > 0
+        if publish:
+            record = CallRecord(method, urlPath)
+        try:
+            return self.sendWithRetries(method, urlPath, data, stream, record)
+        except PlacePodError as error:
+            if record is not None:
+                record.error = type(error).__name__
+            raise
+        finally:
+            if publish:
+                publishCall(record)
+
+    def sendWithRetries(self, method, urlPath, data, stream, record):
+        breaker = self.breakers.get(method, urlPath)
+        attempt = 0
+        while True:
+            breaker.before()
+            if record is not None:
+                record.attempts += 1
+                start = time.perf_counter()
+            try:
+                response = self.request(method, urlPath, data, stream)
+            except requests.RequestException as error:
+                response = None
+                failure = ConnectionFailedError(method, urlPath, error)
+            if record is not None:
+                record.network += time.perf_counter() - start
+                if response is not None:
+                    record.status = response.status_code
+                    # A streamed body hasn't been read yet
+                    if not stream:
+                        record.bytes = len(response.content)
+            if response is not None:
+                if response.status_code == 200:
+                    breaker.succeeded()
+                    return response
+                failure = errorHandler(response)
+                response.close()
+            breaker.failed(failure)
+            if not self.retryPolicy.shouldRetry(method, urlPath, failure, attempt):
+                raise failure
+            delay = self.retryPolicy.delay(attempt, failure.retryAfter)
+            print("Warning: " + str(failure) + " - retrying in " + "%.1f" % delay + " seconds")
+            time.sleep(delay)
+            attempt += 1
+
+    # Send a request over the pooled session and return the raw response.
+    # With stream=True the body is left on the socket to be read in chunks.
+    def request(self, method, urlPath, data=None, stream=False):
+        headers = None if data is None else self.jsonHeaders
+        response = self.session.request(method, self.server + urlPath, data=data,
+                                        headers=headers, timeout=self.timeout, stream=stream)
+        with self.lock:
+            self.requestCount += 1
+        return response
+
+    # Number of requests sent, connections opened and requests that reused
+    # an already open connection
+    def connectionStats(self):
+        pools = self.adapter.poolmanager.pools
+        connections = 0
+        for key in pools.keys():
+            connections += pools[key].num_connections
+        with self.lock:
+            requestCount = self.requestCount
+        return {'requests': requestCount,
+                'connections': connections,
+                'reused': max(requestCount - connections, 0)}
+
+    def close(self):
+        self.session.close()
+#---end RestClient
+
+#--- Retry Policy ---
+# Decides which failed calls are tried again and how long to wait first.
+# Waits grow exponentially with random jitter so many clients don't retry
+# at the same moment, and a Retry-After header from the server is honored.
+#   retries: number of times a call is tried again
+#   backoff: base wait in seconds, doubled every retry
+#   maxBackoff: longest wait in seconds, including Retry-After
+#   safePosts: POST calls that only read data and can be repeated safely.
+#              Other POSTs (inserts and sensor commands) are only retried
+#              when the server says it didn't handle them (429 and 503).
+class RetryPolicy(object):
+    def __init__(self, retries=3, backoff=0.5, maxBackoff=30,
+                 safePosts=('/api/sensors', '/api/sensor/history')):
+        self.retries = retries
+        self.backoff = backoff
+        self.maxBackoff = maxBackoff
+        self.safePosts = safePosts
+
+    def shouldRetry(self, method, urlPath, failure, attempt):
+        if attempt >= self.retries or not failure.retryable:
+            return False
+        if isinstance(failure, ApiError) and failure.statusCode in (429, 503):
+            return True
+        return method != 'POST' or urlPath in self.safePosts
+
+    # Seconds to wait before the retry after 'attempt' failed tries
+    def delay(self, attempt, retryAfter=None):
+        if retryAfter is not None:
+            return min(retryAfter, self.maxBackoff)
+        return random.uniform(0, min(self.maxBackoff, self.backoff * 2 ** attempt))
+#---end RetryPolicy
+
+#--- Circuit Breaker ---
+# Tracks failures of one endpoint. After 'threshold' failures in a row the
+# breaker opens and calls fail straight away with CircuitOpenError instead of
+# waiting on a broken endpoint. After 'reset' seconds one call is let through
+# to test it. If that call works the breaker closes, otherwise it opens again.
+class CircuitBreaker(object):
+    def __init__(self, endpoint, threshold, reset):
+        self.endpoint = endpoint
+        self.threshold = threshold
+        self.reset = reset
+        self.failures = 0
+        self.openedAt = None
+        self.testing = False
+        self.lock = threading.Lock()
+
+    # Called before each try, raises CircuitOpenError if the call can't go out
+    def before(self):
+        with self.lock:
+            if self.openedAt is None:
+                return
+            waited = time.monotonic() - self.openedAt
+            if waited < self.reset or self.testing:
+                raise CircuitOpenError(self.endpoint, max(self.reset - waited, 0))
+            # Let this one call through to see if the endpoint is back
+            self.testing = True
+
+    def succeeded(self):
+        with self.lock:
+            self.failures = 0
+            self.openedAt = None
+            self.testing = False
+
+    def failed(self, failure):
+        with self.lock:
+            # Errors like 404 or 401 mean the endpoint itself is working
+            if not failure.retryable:
+                self.failures = 0
+                self.openedAt = None
+            else:
+                self.failures += 1
+                if self.testing or self.failures >= self.threshold:
+                    self.openedAt = time.monotonic()
+            self.testing = False
+
+    def isOpen(self):
+        with self.lock:
+            return self.openedAt is not None
+#---end CircuitBreaker
+
+# One CircuitBreaker per endpoint. Ids in the url (e.g. the sensor id and time
+# of a *-response call) are left out so they share the endpoint's breaker.
+class CircuitBreakers(object):
+    def __init__(self, threshold, reset):
+        self.threshold = threshold
+        self.reset = reset
+        self.breakers = {}
+        self.lock = threading.Lock()
+
+    def get(self, method, urlPath):
+        endpoint = method + " " + endpointName(urlPath)
+        with self.lock:
+            breaker = self.breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(endpoint, self.threshold, self.reset)
+                self.breakers[endpoint] = breaker
+            return breaker
+
+    # Endpoints whose breaker is currently open
+    def open(self):
+        with self.lock:
+            breakers = list(self.breakers.values())
+        return [breaker.endpoint for breaker in breakers if breaker.isOpen()]
+#---end CircuitBreakers
+
+# Shared client used by get/post/put/delete. Created on first use so that
+# API_SERVER and API_KEY can be changed before any call is made.
+client = None
+clientLock = threading.Lock()
+
+def getClient():
+    global client
+    with clientLock:
+        if client is None:
+            client = RestClient()
+    return client
+#---end getClient
+
+# Replace the shared client, e.g. setClient(RestClient(poolSize=50))
+def setClient(newClient):
+    global client
+    with clientLock:
+        if client is not None and client is not newClient:
+            client.close()
+        client = newClient
+#---end setClient
+
+#--- GET ---
+# Makes a get API call using the supplied url and key
+def get(urlPath):
+    # Raises a PlacePodError if the call fails
+    response = getClient().send('GET', urlPath)
+    print("Successful connection...")
+    return response.content
+#---end get
+
+#--- POST ---
+# Makes a post API call using the supplied url, optional filters and key
+def post(urlPath, data):
+    # Raises a PlacePodError if the call fails
+    response = getClient().send('POST', urlPath, data)
+    print("Successful connection...")
+    return response.content
+#---end post
+
+#--- PUT ---
+# Makes a put API call using the supplied url, optional filters and key
+def put(urlPath, data):
+    # Raises a PlacePodError if the call fails
+    response = getClient().send('PUT', urlPath, data)
+    print("Successful connection...")
+    return response.content
+#---end put
+
+#--- DELETE ---
+# Makes a delete API call using the supplied url, optional filters and key
+def delete(urlPath, data):
+    # Raises a PlacePodError if the call fails
+    response = getClient().send('DELETE', urlPath, data)
+    print("Successful connection...")
+    return response.content
+#---end delete
+
+#--- Fetch ---
+# Makes a get or post API call and breaks the returned JSON into model
+# objects with objectHook. Returns None if the call returned no data.
+def fetch(method, urlPath, data, objectHook):
+    record = CallRecord(method, urlPath) if callObservers else None
+    try:
+        # Raises a PlacePodError if the call fails
+        response = getClient().send(method, urlPath, data, record=record)
+        print("Successful connection...")
+        result = response.content
+        # Stop running if the call returns empty JSON
+        if result == b'':
+            print("Error: " + method.capitalize() + " request returned no data")
+            return
+        if record is None:
+            return JsonDecoder.loads(result, objectHook)
+        # Parse first and build the models after, so each step can be timed
+        start = time.perf_counter()
+        payload = JsonDecoder.loads(result)
+        record.decode = time.perf_counter() - start
+        start = time.perf_counter()
+        payload = JsonDecoder.applyObjectHook(payload, objectHook)
+        record.model = time.perf_counter() - start
+        return payload
+    finally:
+        if record is not None:
+            publishCall(record)
+#---end fetch
+
+#--- Streaming POST ---
+# Makes a post API call and yields the objects of the returned JSON list one
+# at a time as the body is read
+def streamPost(urlPath, data, objectHook, chunkSize=65536):
+    record = CallRecord('POST', urlPath) if callObservers else None
+    try:
+        # Raises a PlacePodError if the call fails
+        response = getClient().send('POST', urlPath, data, stream=True, record=record)
+    except PlacePodError:
+        if record is not None:
+            publishCall(record)
+        raise
+    try:
+        print("Successful connection...")
+        chunks = response.iter_content(chunkSize)
+        if record is None:
+            for item in iterJsonList(chunks, objectHook):
+                yield item
+            return
+        record.streamed = True
+        chunks = countBytes(chunks, record)
+        items = iterJsonList(chunks, objectHook)
+        while True:
+            # Only time the decoder, not the caller's work between items
+            start = time.perf_counter()
+            try:
+                item = next(items)
+            except StopIteration:
+                break
+            finally:
+                record.decode += time.perf_counter() - start
+            yield item
+    finally:
+        # Give the connection back to the pool even if the caller stops early
+        response.close()
+        if record is not None:
+            publishCall(record)
+#---end streamPost
+
+# Pass chunks through, adding their size to record.bytes
+def countBytes(chunks, record):
+    for chunk in chunks:
+        record.bytes += len(chunk)
+        yield chunk
+#---end countBytes
+
+# Incrementally decode a JSON list from chunks of bytes, yielding each
+# element as soon as it is complete. Only the element being read is held
+# in memory, plus at most one chunk. Raises ValueError if the body isn't
+# exactly one JSON list.
+def iterJsonList(chunks, objectHook=None):
+    decoder = json.JSONDecoder(object_hook=objectHook)
+    # Chunks can split a multi-byte character, the incremental decoder keeps
+    # the partial character until the next chunk
+    utf8 = codecs.getincrementaldecoder('utf_8')()
+    chunks = iter(chunks)
+    buffer = ''
+    position = 0
+    finished = False
+    # What may come next: '[' before the list, 'first' element or ']',
+    # 'element', ',' or ']' after an element, and nothing once it has ended
+    expect = '['
+
+    while True:
+        while position < len(buffer) and buffer[position] in ' \t\r\n':
+            position += 1
+
+        if position < len(buffer):
+            char = buffer[position]
+            if expect == 'end':
+                raise ValueError("Data after the end of the JSON list")
+            if expect == '[':
+                if char != '[':
+                    raise ValueError("Expected a JSON list")
+                expect = 'first'
+                position += 1
+                continue
+            if expect == ',':
+                if char == ',':
+                    expect = 'element'
+                    position += 1
+                    continue
+                if char != ']':
+                    raise ValueError("Expected ',' or ']' after a JSON list element")
+                expect = 'end'
+                position += 1
+                continue
+            if expect == 'first' and char == ']':
+                expect = 'end'
+                position += 1
+                continue
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # The element isn't complete yet, so read more of it
+                if finished:
+                    raise
+            else:
+                # A number, true, false or null is only complete once
+                # something that can't be part of it follows, e.g. 12 may be
+                # the start of 1234 and 1.5 of 1.5e3
+                if char in '{["' or finished or (end < len(buffer)
+                                                  and buffer[end] not in '0123456789+-.eE'):
+                    position = end
+                    expect = ','
+                    yield item
+                    continue
+
+        if finished:
+            if expect == 'end':
+                return
+            if expect == '[':
+                print("Error: Post request returned no data")
+                return
+            raise ValueError("JSON list ended early")
+        chunk = next(chunks, None)
+        if chunk is None:
+            finished = True
+            chunk = b''
+        # Drop what has already been decoded before adding the next chunk
+        buffer = buffer[position:] + utf8.decode(chunk, final=finished)
+        position = 0
+#---end iterJsonList
+#-----------------------------------------------------------------------------------
+
+
+#-------------------------Objects and object helpers for use in code----------------
+# The objects use __slots__ so they don't each carry a __dict__, and the
+# create*Payload helpers intern fields that repeat across many objects (lot,
+# status, network, ...) so every object shares one copy of the string.
+
+# Intern a string field, leaving None and other values as they are
+def intern(value):
+    return sys.intern(value) if type(value) is str else value
+#---end intern
+
+
+# Api value fields for a gateway as an object
+class Gateway(object):
+    __slots__ = ('id', 'gatewayMac', 'name', 'parkingLotId')
+
+    def __init__(self, id, gatewayMac, name, parkingLotId):
+        self.id = id
+        self.gatewayMac = gatewayMac
+        self.name = name
+        self.parkingLotId = parkingLotId
+#---end Gateway
+
+# Create a Gateway object using the dictionary grabbed from the JSON
+def createGatewayPayload(dct):
+    return Gateway(dct['id'], dct['gatewayMac'], dct['name'], intern(dct['parkingLotId']))
+#--end createGatewayPayload
+
+# Api value fields for a parking lot as an object
+class ParkingLot(object):
+    __slots__ = ('id', 'name')
+
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+#---end ParkingLot
+
+# Create a ParkingLot object using the dictionary grabbed from the JSON
+def createParkingLotPayload(dct):
+    return ParkingLot(dct['id'], dct['name'])
+#---end createParkingLotPayload
+
+# Api value fields for a sensor as an object
+class Sensor(object):
+    __slots__ = ('sensorId', 'parkingSpace', 'parkingLot', 'status', 'carPresence',
+                 'gateWayTime', 'sentralTime', 'temperature', 'battery', 'lat',
+                 'lon', 'network', 'parkingLotId')
+
+    def __init__(self, sensorId, parkingSpace, parkingLot, status, carPresence,
+                 gatewayTime, sentralTime, temperature, battery, lat,
+                 lon, network, parkingLotId):
+        self.sensorId = sensorId
+        self.parkingSpace = parkingSpace
+        self.parkingLot = parkingLot
+        self.status = status
+        self.carPresence = carPresence
+        self.gateWayTime = gatewayTime
+        self.sentralTime = sentralTime
+        self.temperature = temperature
+        self.battery = battery
+        self.lat = lat
+        self.lon = lon
+        self.network = network
+        self.parkingLotId = parkingLotId
+#---end Sensor
+
+# Create a Sensor object using the dictionary grabbed from the JSON
+def createSensorPayload(dct):
+    return Sensor(intern(dct['sensorId']), intern(dct['parkingSpace']), intern(dct['parkingLot']),
+                  intern(dct['status']), dct['carPresence'], dct['gatewayTime'], dct['sentralTime'],
+                  dct['temperature'], dct['battery'], dct['lat'], dct['lon'], intern(dct['network']),
+                  intern(dct['parkingLotId']))
+#---end createSensorPayload
+#-----------------------------------------------------------------------------------
+
+
+#--------------------------------Error Handling-------------------------------------
+# Every failed call raises a PlacePodError. 'retryable' is True for errors
+# that may go away if the call is tried again (429, 5xx, lost connections).
+
+class PlacePodError(Exception):
+    retryable = False
+    retryAfter = None
+#---end PlacePodError
+
+# The server answered with a status other than 200
+#   statusCode: HTTP status of the response
+#   code, message: error details sent by the server, if any
+class ApiError(PlacePodError):
+    def __init__(self, statusCode, code=None, message=None, retryAfter=None):
+        text = "HTTP Error " + str(statusCode)
+        if code is not None:
+            text += " - " + str(code) + ": " + str(message)
+        elif message is not None:
+            text += " - " + str(message)
+        PlacePodError.__init__(self, text)
+        self.statusCode = statusCode
+        self.code = code
+        self.message = message
+        self.retryAfter = retryAfter
+        self.retryable = statusCode == 429 or statusCode >= 500
+#---end ApiError
+
+# 401: Access is denied due to invalid credentials
+class UnauthorizedError(ApiError):
+    pass
+
+# 404: Not found
+class NotFoundError(ApiError):
+    pass
+
+# 415: Unsupported media type
+class UnsupportedMediaTypeError(ApiError):
+    pass
+
+# 429: Too many requests, check retryAfter for how long to wait
+class RateLimitedError(ApiError):
+    pass
+
+# 5xx: The server failed to handle the call
+class ServerError(ApiError):
+    pass
+
+# The call never got a response, e.g. the connection failed or timed out
+class ConnectionFailedError(PlacePodError):
+    retryable = True
+
+    def __init__(self, method, urlPath, error):
+        PlacePodError.__init__(self, method + " " + urlPath + " failed: " + str(error))
+        self.error = error
+#---end ConnectionFailedError
+
+# The endpoint's circuit breaker is open so the call wasn't made
+#   retryAfter: seconds until the breaker lets a test call through
+class CircuitOpenError(PlacePodError):
+    def __init__(self, endpoint, retryAfter):
+        PlacePodError.__init__(self, "Circuit open for " + endpoint + ", not calling it for "
+                               + "%.1f" % retryAfter + " seconds")
+        self.endpoint = endpoint
+        self.retryAfter = retryAfter
+#---end CircuitOpenError
+
+# Build the PlacePodError for a failed response
+def errorHandler(error):
+    return apiError(error.status_code, error.content, error.headers.get('Retry-After'))
+#---end errorHandler
+
+# Build the PlacePodError for a failed call given its status code, response
+# body and Retry-After header
+def apiError(statusCode, content, retryAfter=None):
+    messages = {401: (UnauthorizedError, "Unauthorized: Access is denied due to invalid credentials."),
+                404: (NotFoundError, "Not Found."),
+                415: (UnsupportedMediaTypeError, "Unsupported media type")}
+    if statusCode in messages:
+        errorType, message = messages[statusCode]
+        return errorType(statusCode, None, message)
+
+    errorType = ApiError
+    if statusCode == 429:
+        errorType = RateLimitedError
+    elif statusCode >= 500:
+        errorType = ServerError
+    # The body is usually {"Code": ..., "Message": ...}, but not always
+    try:
+        errorMsg = JsonDecoder.loads(content, createErrorPayload)
+        code, message = errorMsg.code, errorMsg.message
+    except (ValueError, KeyError, AttributeError):
+        code, message = None, content.decode('utf_8', 'replace')[:200] or None
+    return errorType(statusCode, code, message, parseRetryAfter(retryAfter))
+#---end apiError
+
+# Seconds to wait from a Retry-After header, which is either a number of
+# seconds or an HTTP date. None if it is missing or can't be read.
+def parseRetryAfter(value):
+    if value is None:
+        return
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        import email.utils # Only needed for the rare HTTP date form
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    return max((when - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0.0)
+#---end parseRetryAfter
+
+class Error(object):
+    __slots__ = ('code', 'message')
+
+    def __init__(self, code, message):
+        self.code = code
+        self.message = message
+#---end Error
+
+def createErrorPayload(dct):
+    return Error(dct['Code'], dct['Message'])
+#---end createErrorPayload
+#-----------------------------------------------------------------------------------
+
+def wait():
+    input("Press enter to continue...")
+    print("")
+
+
+# Once all functions have been defined, it is safe to execute main.
+# Only run it when started as a script so other modules can import this one.
+if __name__ == "__main__":
+    main()
\ No newline at end of file
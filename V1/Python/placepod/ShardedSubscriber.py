@@ -0,0 +1,251 @@
+# --------------------------------------------------#
+# Sharded multi-process MQTT subscriber             #
+# File: ShardedSubscriber.py                        #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Spreads the MQTT subscription over several        #
+# client connections, each in its own process, so   #
+# decoding and handling use more than one core.     #
+# The topic space is split with a shared            #
+# subscription ($share/<group>/<topic>) or by       #
+# giving each shard its own sensors' uplink topics. #
+# Shards send what they produce back to the parent  #
+# over one multiprocessing queue.                   #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import zlib
+
+from . import MQTT # Client, decoder and handlers used in each shard
+
+
+MODES = ('shared', 'sensors')
+
+# Uplink topic of a single sensor, as documented in the README
+SENSOR_TOPIC = "placepod/uplink/+/{sensorId}"
+
+
+# Split sensorIds over 'shards' the same way MessageQueue.routingKey hashes
+# them, returning one list of uplink topics per shard
+def sensorTopics(sensorIds, shards, pattern=SENSOR_TOPIC):
+    topics = [[] for i in range(0, shards)]
+    for sensorId in sensorIds:
+        topics[zlib.crc32(sensorId.encode('utf_8')) % shards].append(pattern.format(sensorId=sensorId))
+    return topics
+#---end sensorTopics
+
+
+# Body of a shard process: connect with its own topics, decode and handle
+# every message in this process, and send the results of 'process' and the
+# shard's counts back over 'channel' every 'interval' seconds or every
+# 'batchSize' results.
+def runShard(index, topics, options, process, channel, stopping, batchSize, interval):
+    lock = threading.Lock()
+    state = {'results': [], 'events': 0}
+
+    def flush():
+        with lock:
+            results = state['results']
+            state['results'] = []
+            events = state['events']
+        if results:
+            channel.put(('results', index, results))
+        channel.put(('stats', index, {'events': events, 'pid': os.getpid()}))
+
+    def collect(event):
+        result = None if process is None else process(event)
+        with lock:
+            state['events'] += 1
+            if result is None:
+                return
+            state['results'].append(result)
+            full = len(state['results']) >= batchSize
+        if full:
+            flush()
+
+    MQTT.addMessageHandler(collect)
+    client = MQTT.MqttClient(topic=topics, **options).connect()
+    if client is None:
+        channel.put(('error', index, "couldn't connect"))
+        return
+    client.on_subscribe = lambda client, userdata, mid, grantedQos: channel.put(('subscribed', index, None))
+    client.loop_start()
+    try:
+        while not stopping.wait(interval):
+            flush()
+    finally:
+        client.disconnect()
+        client.loop_stop()
+        flush()
+        channel.put(('done', index, None))
+#---end runShard
+
+
+# Example:
+#   def occupied(event):    # runs in the shards, must be importable
+#       return (event.sensorId, event.status) if event.status == 'occupied' else None
+#
+#   subscriber = ShardedSubscriber(shards=4, mode='shared', process=occupied,
+#                                  options={'username': user, 'password': secret})
+#   subscriber.start()
+#   for sensorId, status in subscriber.results():
+#       print(sensorId + " is " + status)
+#
+#   shards: number of client connections / processes, one per core by default
+#   mode: 'shared': every shard subscribes to $share/<group>/<topic> and the
+#                   broker hands each message to one of them. The broker has
+#                   to support shared subscriptions, and retained messages
+#                   aren't sent to them.
+#         'sensors': each shard subscribes to the uplink topics of its part of
+#                    sensorIds, see sensorTopics
+#   topic: topic shared in 'shared' mode, MQTT.topic by default
+#   group: shared subscription group name
+#   sensorIds: sensors split over the shards in 'sensors' mode
+#   process: function run in the shard on every event. What it returns is
+#            sent to the parent unless it is None. Sending every event back
+#            would make the parent the bottleneck again, so return only what
+#            the parent needs.
+#   options: MQTT.MqttClient arguments (serverURL, username, password, port,
+#            caCerts), the MQTT module values by default
+#   batchSize / interval: results are sent in lists of up to batchSize, and
+#                         counts at least every 'interval' seconds
+class ShardedSubscriber(object):
+    def __init__(self, shards=None, mode='shared', topic=None, group="placepod", sensorIds=None,
+                 process=None, options=None, batchSize=500, interval=0.5):
+        if mode not in MODES:
+            raise ValueError("mode must be one of " + ", ".join(MODES))
+        if mode == 'sensors' and not sensorIds:
+            raise ValueError("sensors mode needs the sensorIds to split")
+        self.shards = multiprocessing.cpu_count() if shards is None else shards
+        self.mode = mode
+        self.topic = MQTT.topic if topic is None else topic
+        self.group = group
+        self.sensorIds = sensorIds
+        self.process = process
+        self.options = {} if options is None else options
+        self.batchSize = batchSize
+        self.interval = interval
+        self.channel = multiprocessing.Queue()
+        self.stopping = multiprocessing.Event()
+        self.processes = []
+        # Latest counts from each shard, see stats()
+        self.shardStats = {}
+        self.subscribed = set()
+        self.done = set()
+        self.errors = {}
+        # Results that arrived while waitSubscribed waited, handed out first
+        # by results() and drain()
+        self.early = []
+
+    # Topic filters each shard subscribes to
+    def shardTopics(self):
+        if self.mode == 'shared':
+            return [["$share/" + self.group + "/" + self.topic] for i in range(0, self.shards)]
+        return sensorTopics(self.sensorIds, self.shards)
+
+    def start(self):
+        self.stopping.clear()
+        for index, topics in enumerate(self.shardTopics()):
+            process = multiprocessing.Process(
+                target=runShard, name="ShardedSubscriber-" + str(index), daemon=True,
+                args=(index, topics, self.options, self.process, self.channel, self.stopping,
+                      self.batchSize, self.interval))
+            process.start()
+            self.processes.append(process)
+        return self
+
+    # Read one message from the shards, returning the list of results it
+    # carried (empty for counts). Raises queue.Empty after 'timeout' seconds.
+    def receive(self, timeout=None):
+        kind, index, value = self.channel.get(timeout=timeout)
+        if kind == 'results':
+            return value
+        if kind == 'stats':
+            self.shardStats[index] = value
+        elif kind == 'subscribed':
+            self.subscribed.add(index)
+        elif kind == 'error':
+            self.errors[index] = value
+            self.done.add(index)
+        elif kind == 'done':
+            self.done.add(index)
+        return []
+
+    # Results that arrived while waitSubscribed waited, emptying the buffer
+    def takeEarly(self):
+        early = self.early
+        self.early = []
+        return early
+
+    # Results from every shard as they arrive. Stops once every shard has
+    # stopped, or when nothing has arrived for 'timeout' seconds.
+    def results(self, timeout=None):
+        for result in self.takeEarly():
+            yield result
+        while len(self.done) < len(self.processes):
+            try:
+                for result in self.receive(timeout):
+                    yield result
+            except queue.Empty:
+                return
+
+    # Handle whatever the shards have sent without waiting
+    def drain(self):
+        results = self.takeEarly()
+        while True:
+            try:
+                results.extend(self.receive(0))
+            except queue.Empty:
+                return results
+
+    # Wait until every shard has subscribed, returns False on timeout or if
+    # a shard failed. Results that arrive meanwhile are kept for the next
+    # results() or drain().
+    def waitSubscribed(self, timeout=30):
+        deadline = time.monotonic() + timeout
+        while len(self.subscribed) < len(self.processes) and not self.errors:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                self.early.extend(self.receive(remaining))
+            except queue.Empty:
+                return False
+        return not self.errors
+
+    # Events handled per shard and in total, as of the last counts received
+    def stats(self):
+        perShard = dict((index, stats['events']) for index, stats in self.shardStats.items())
+        return {'events': sum(perShard.values()), 'perShard': perShard,
+                'errors': dict(self.errors)}
+
+    # Stop the shards and wait for them to send their last results, which
+    # are returned
+    def stop(self, timeout=10):
+        self.stopping.set()
+        results = self.takeEarly()
+        deadline = time.monotonic() + timeout
+        while len(self.done) < len(self.processes) and time.monotonic() < deadline:
+            try:
+                results.extend(self.receive(max(deadline - time.monotonic(), 0)))
+            except queue.Empty:
+                break
+        for process in self.processes:
+            process.join(max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                process.terminate()
+        self.processes = []
+        return results
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, excType, exc, tb):
+        self.stop()
+#---end ShardedSubscriber
@@ -0,0 +1,455 @@
+# --------------------------------------------------#
+# Local PlacePod REST API simulator                 #
+# File: Simulator.py                                #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Stand-in for the PlacePod server that implements  #
+# the V1 endpoints used by REST.py over a synthetic #
+# fleet of any size. Latency and error rates can be #
+# injected so clients can be tested and load tested #
+# without touching the production API.              #
+#                                                   #
+# Usage: python -m placepod.Simulator [--port 8080] #
+#        [--sensors 1000] [--latency 0.05]          #
+#        [--error-rate 0.01]                        #
+#                                                   #
+# This script only works with V1 of the API.        #
+#-------------------------------------------------- #
+
+import argparse
+import datetime
+import http.server
+import json
+import random
+import re
+import threading
+import time
+import zlib
+
+
+STATUSES = ('vacant', 'car entering', 'occupied', 'car leaving')
+NETWORKS = ('PNI', 'SENET')
+BIST_SENSORS = ('magnetometer', 'radar', 'temperature', 'LoRa')
+
+# Calls that are accepted for a known sensor without changing anything
+SENSOR_COMMANDS = ('recalibrate', 'set-lora-wakeup-interval', 'set-lora-tx-power',
+                   'set-tx-spreading-factor', 'set-frequency-sub-band')
+
+COMMAND_RESPONSE = re.compile(r'^/api/sensor/(bist|ping)-response/([^/]+)/(.+)$')
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+# SENtralTime is a 36 bit tick counter (see the README) that starts when the
+# sensor boots. The tick rate isn't documented, this one is assumed.
+TICKS_PER_SECOND = 1000
+TICKS_WRAP = 2 ** 36
+
+
+# Synthetic parking lots, gateways and sensors. The same arguments always
+# give the same fleet.
+#   sensors: number of sensors, spread evenly over the lots
+#   lots: number of parking lots
+#   gatewaysPerLot: gateways in every lot
+#   historyInterval: seconds between two rows of sensor history
+#   commandDelay: seconds before a sensor answers a ping or BIST
+class SimulatedFleet(object):
+    def __init__(self, sensors=1000, lots=10, gatewaysPerLot=2, historyInterval=300,
+                 commandDelay=2.0, seed=0):
+        self.historyInterval = historyInterval
+        self.commandDelay = commandDelay
+        self.lock = threading.Lock()
+        self.nextId = 0
+        # sensorId -> list of (kind, sent at, answered at)
+        self.commands = {}
+        # Encoded lists, rebuilt only after a change
+        self.encoded = {}
+
+        generator = random.Random(seed)
+        self.parkingLots = {}
+        self.gateways = {}
+        self.sensors = {}
+        for lot in range(0, lots):
+            lotId = self.newId()
+            self.parkingLots[lotId] = {'id': lotId, 'name': 'Simulated Parking Lot ' + str(lot)}
+            for gateway in range(0, gatewaysPerLot):
+                gatewayId = self.newId()
+                self.gateways[gatewayId] = {'id': gatewayId,
+                                            'gatewayMac': '%016x' % generator.getrandbits(64),
+                                            'name': 'Gateway ' + str(lot) + '-' + str(gateway),
+                                            'parkingLotId': lotId}
+        lotIds = list(self.parkingLots)
+        for i in range(0, sensors):
+            lotId = lotIds[i % len(lotIds)] if lotIds else ''
+            status = generator.randrange(0, len(STATUSES))
+            sensorId = '0080%012x' % (0x4000000 + i)
+            self.sensors[sensorId] = {
+                'sensorId': sensorId,
+                'parkingSpace': 'Space #' + str(i // max(len(lotIds), 1)),
+                'parkingLot': self.parkingLots[lotId]['name'] if lotId else '',
+                'status': STATUSES[status],
+                'carPresence': status + 1,
+                'gatewayTime': formatTime(time.time()),
+                'sentralTime': sentralTicks(sensorId, time.time()),
+                'temperature': generator.randint(10, 35),
+                'battery': round(generator.uniform(3.3, 3.7), 4),
+                'lat': 38.42 + generator.uniform(-0.01, 0.01),
+                'lon': -122.75 + generator.uniform(-0.01, 0.01),
+                'network': NETWORKS[generator.randrange(0, len(NETWORKS))],
+                'parkingLotId': lotId,
+            }
+
+    # Ids look like the 24 digit hex ids of the real server
+    def newId(self):
+        self.nextId += 1
+        return '5a0c6d1f%016x' % self.nextId
+
+    # JSON body for one of the lists, encoded once per change
+    def encodedList(self, name):
+        with self.lock:
+            if name not in self.encoded:
+                self.encoded[name] = json.dumps(list(getattr(self, name).values())).encode('utf_8')
+            return self.encoded[name]
+
+    def changed(self, name):
+        self.encoded.pop(name, None)
+
+    # History rows for a sensor from start to end (datetimes), one every
+    # historyInterval seconds. The status cycles the way a real space would.
+    def history(self, sensorId, start, end):
+        sensor = self.sensors[sensorId]
+        interval = self.historyInterval
+        first = -(-int((start - EPOCH).total_seconds()) // interval)
+        last = int((end - EPOCH).total_seconds()) // interval
+        # hash() of a str changes between runs, crc32 doesn't
+        offset = zlib.crc32(sensorId.encode('utf_8'))
+        rows = []
+        for slot in range(first, last + 1):
+            seconds = slot * interval
+            status = (slot + offset) % len(STATUSES)
+            row = dict(sensor)
+            row['status'] = STATUSES[status]
+            row['carPresence'] = status + 1
+            row['gatewayTime'] = formatTime(seconds)
+            row['sentralTime'] = sentralTicks(sensorId, seconds + 0.143)
+            row['battery'] = round(3.7 - (slot % 1000) * 0.0004, 4)
+            rows.append(row)
+        return rows
+
+    def sendCommand(self, kind, sensorId):
+        now = time.time()
+        with self.lock:
+            self.commands.setdefault(sensorId, []).append((kind, now, now + self.commandDelay))
+
+    # Answers to 'kind' commands sent on or after 'since' that have arrived
+    def commandResponses(self, kind, sensorId, since):
+        now = time.time()
+        with self.lock:
+            commands = list(self.commands.get(sensorId, ()))
+        responses = []
+        for commandKind, sentAt, answeredAt in commands:
+            if commandKind != kind or sentAt < since or answeredAt > now:
+                continue
+            if kind == 'ping':
+                responses.append({'pingRssi': -79, 'pingSNR': 11.6,
+                                  'serverTime': formatTime(answeredAt)})
+            else:
+                for sensorType in BIST_SENSORS:
+                    responses.append({'sensorType': sensorType, 'status': 'pass'})
+        return responses
+#---end SimulatedFleet
+
+
+# Example:
+#   with SimulatorServer(SimulatedFleet(sensors=5000), latency=0.02, errorRate=0.01) as server:
+#       REST.setClient(REST.RestClient(server.url, server.apiKey))
+#       sensors = REST.getSensors()
+#
+#   latency: seconds added to every call
+#   jitter: up to this many extra seconds added at random to every call
+#   errorRate: share of calls answered with a 500
+#   throttleRate: share of calls answered with a 429 and a Retry-After header
+#   stringResponses: send the *-response bodies as a JSON string like the
+#                    real server sometimes does
+class SimulatorServer(object):
+    def __init__(self, fleet=None, host="127.0.0.1", port=0, apiKey="simulator", latency=0,
+                 jitter=0, errorRate=0, throttleRate=0, stringResponses=False, seed=None):
+        self.fleet = SimulatedFleet() if fleet is None else fleet
+        self.apiKey = apiKey
+        self.latency = latency
+        self.jitter = jitter
+        self.errorRate = errorRate
+        self.throttleRate = throttleRate
+        self.stringResponses = stringResponses
+        self.random = random.Random(seed)
+        self.requestCount = 0
+        self.httpd = SimulatorHTTPServer((host, port), SimulatorHandler)
+        self.httpd.simulator = self
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return "http://" + host + ":" + str(port)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        self.stop()
+
+    # Serve from a background thread
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    # Serve on the calling thread until interrupted
+    def serveForever(self):
+        self.httpd.serve_forever()
+
+    # (status, body, headers) for one call
+    def handle(self, method, path, body):
+        self.requestCount += 1
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+        draw = self.random.random()
+        if draw < self.throttleRate:
+            return 429, errorBody("TooManyRequests", "Rate limit exceeded"), {'Retry-After': '1'}
+        if draw < self.throttleRate + self.errorRate:
+            return 500, errorBody("InternalError", "Simulated server error"), {}
+
+        try:
+            params = parseParams(body)
+        except ValueError:
+            return 400, errorBody("BadRequest", "Body isn't valid JSON"), {}
+
+        fleet = self.fleet
+        if method == 'GET' and path == '/api/gateways':
+            return 200, fleet.encodedList('gateways'), {}
+        if method == 'GET' and path == '/api/parking-lots':
+            return 200, fleet.encodedList('parkingLots'), {}
+        if method == 'POST' and path == '/api/sensors':
+            return 200, fleet.encodedList('sensors'), {}
+        if method == 'POST' and path == '/api/sensor/history':
+            return self.sensorHistory(params)
+
+        match = COMMAND_RESPONSE.match(path)
+        if method == 'GET' and match is not None:
+            return self.commandResponse(match.group(1), match.group(2), match.group(3))
+
+        if path.startswith('/api/sensor/') and method == 'POST':
+            command = path[len('/api/sensor/'):]
+            if command in SENSOR_COMMANDS + ('initialize-bist', 'ping', 'force-vacant',
+                                             'force-occupied'):
+                return self.sensorCommand(command, params)
+
+        if path.startswith('/api/'):
+            parts = path[len('/api/'):].split('/')
+            if len(parts) == 2 and parts[0] in ('gateway', 'parking-lot', 'sensor'):
+                operations = {'insert': 'POST', 'update': 'PUT', 'remove': 'DELETE'}
+                if operations.get(parts[1]) == method:
+                    return self.change(parts[0], parts[1], params)
+        return 404, errorBody("NotFound", "No such endpoint: " + method + " " + path), {}
+
+    def sensorHistory(self, params):
+        sensorId = str(params.get('sensorId'))
+        if sensorId not in self.fleet.sensors:
+            return 404, errorBody("NotFound", "Unknown sensor " + sensorId), {}
+        try:
+            start = parseTime(params['startTime'])
+            end = parseTime(params['endTime'])
+        except (KeyError, ValueError):
+            return 400, errorBody("BadRequest", "startTime and endTime are required"), {}
+        return 200, json.dumps(self.fleet.history(sensorId, start, end)).encode('utf_8'), {}
+
+    def sensorCommand(self, command, params):
+        fleet = self.fleet
+        sensorId = str(params.get('sensorId'))
+        if sensorId not in fleet.sensors:
+            return 404, errorBody("NotFound", "Unknown sensor " + sensorId), {}
+        if command == 'initialize-bist':
+            fleet.sendCommand('bist', sensorId)
+        elif command == 'ping':
+            fleet.sendCommand('ping', sensorId)
+        elif command in ('force-vacant', 'force-occupied'):
+            status = 'vacant' if command == 'force-vacant' else 'occupied'
+            with fleet.lock:
+                fleet.sensors[sensorId] = dict(fleet.sensors[sensorId], status=status,
+                                               carPresence=STATUSES.index(status) + 1)
+                fleet.changed('sensors')
+        return 200, b'', {}
+
+    def commandResponse(self, kind, sensorId, timeStr):
+        try:
+            since = (parseTime(timeStr) - EPOCH).total_seconds()
+        except ValueError:
+            return 400, errorBody("BadRequest", "Bad time " + timeStr), {}
+        body = json.dumps(self.fleet.commandResponses(kind, sensorId, since))
+        if self.stringResponses:
+            body = json.dumps(body)
+        return 200, body.encode('utf_8'), {}
+
+    # insert, update or remove a gateway, parking lot or sensor
+    def change(self, kind, operation, params):
+        fleet = self.fleet
+        name = {'gateway': 'gateways', 'parking-lot': 'parkingLots', 'sensor': 'sensors'}[kind]
+        rows = getattr(fleet, name)
+        key = str(params.get('sensorId' if kind == 'sensor' else 'id'))
+        with fleet.lock:
+            if operation == 'insert':
+                if kind == 'sensor':
+                    if key in rows:
+                        return 400, errorBody("BadRequest", "Sensor already exists"), {}
+                    lot = fleet.parkingLots.get(params.get('parkingLotId'), {})
+                    rows[key] = {'sensorId': key, 'parkingSpace': params.get('parkingSpace'),
+                                 'parkingLot': lot.get('name', ''), 'status': 'vacant',
+                                 'carPresence': 1, 'gatewayTime': None, 'sentralTime': None,
+                                 'temperature': None, 'battery': None,
+                                 'lat': params.get('latitude'), 'lon': params.get('longitude'),
+                                 'network': params.get('network'),
+                                 'parkingLotId': params.get('parkingLotId')}
+                elif kind == 'gateway':
+                    key = fleet.newId()
+                    rows[key] = {'id': key, 'gatewayMac': params.get('gatewayMac'),
+                                 'name': params.get('gatewayName'),
+                                 'parkingLotId': params.get('parkingLotId')}
+                else:
+                    key = fleet.newId()
+                    rows[key] = {'id': key, 'name': params.get('parkingLotName')}
+            elif key not in rows:
+                return 404, errorBody("NotFound", "Unknown " + kind + " " + key), {}
+            elif operation == 'update':
+                row = dict(rows[key])
+                for field, value in params.items():
+                    field = {'parkingLotName': 'name', 'gatewayName': 'name',
+                             'latitude': 'lat', 'longitude': 'lon'}.get(field, field)
+                    if field in row:
+                        row[field] = value
+                rows[key] = row
+            else:
+                del rows[key]
+            fleet.changed(name)
+        return 200, b'', {}
+#---end SimulatorServer
+
+
+class SimulatorHTTPServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 makes a burst of new connections wait on SYN
+    # retries, which would show up as one second latencies
+    request_queue_size = 256
+#---end SimulatorHTTPServer
+
+class SimulatorHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, without this every response
+    # with a body waits on the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.respond('GET')
+
+    def do_POST(self):
+        self.respond('POST')
+
+    def do_PUT(self):
+        self.respond('PUT')
+
+    def do_DELETE(self):
+        self.respond('DELETE')
+
+    def respond(self, method):
+        simulator = self.server.simulator
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        if simulator.apiKey and self.headers.get('X-API-KEY') != simulator.apiKey:
+            status, content, headers = 401, b'', {}
+        elif body and 'application/json' not in (self.headers.get('Content-Type') or ''):
+            status, content, headers = 415, b'', {}
+        else:
+            status, content, headers = simulator.handle(method, self.path, body)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    # Keep the console quiet, calls are counted instead
+    def log_message(self, format, *args):
+        pass
+#---end SimulatorHandler
+
+
+#--- Helpers ---
+def errorBody(code, message):
+    return json.dumps({'Code': code, 'Message': message}).encode('utf_8')
+
+# The sample params in REST.py are written with single quotes and sometimes a
+# trailing comma, which the real server accepts, so accept them here too
+def parseParams(body):
+    if not body:
+        return {}
+    text = body.decode('utf_8')
+    try:
+        params = json.loads(text)
+    except ValueError:
+        text = re.sub(r',\s*}', '}', text.replace("'", '"'))
+        params = json.loads(text)
+    if not isinstance(params, dict):
+        raise ValueError("Params must be a JSON object")
+    return params
+
+def parseTime(timeStr):
+    if timeStr.endswith('Z'):
+        timeStr = timeStr[:-1] + '+00:00'
+    value = datetime.datetime.fromisoformat(timeStr)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+# SENtralTime of a sensor at 'seconds' since the epoch. Every sensor gets its
+# own boot time so their counters don't line up.
+def sentralTicks(sensorId, seconds):
+    bootedAt = zlib.crc32(sensorId.encode('utf_8')) % (30 * 24 * 3600)
+    return int((seconds - bootedAt) * TICKS_PER_SECOND) % TICKS_WRAP
+
+# Seconds since the epoch in the format the api uses, e.g. 2017-09-08T01:00:00.000Z
+def formatTime(seconds):
+    value = EPOCH + datetime.timedelta(seconds=seconds)
+    return value.strftime('%Y-%m-%dT%H:%M:%S.') + '%03dZ' % (value.microsecond // 1000)
+#---end Helpers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local PlacePod REST API simulator")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--api-key', default="simulator")
+    parser.add_argument('--sensors', type=int, default=1000)
+    parser.add_argument('--lots', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0, help="seconds added to every call")
+    parser.add_argument('--jitter', type=float, default=0, help="random extra seconds per call")
+    parser.add_argument('--error-rate', type=float, default=0, help="share of calls that get a 500")
+    parser.add_argument('--throttle-rate', type=float, default=0, help="share of calls that get a 429")
+    args = parser.parse_args()
+
+    fleet = SimulatedFleet(sensors=args.sensors, lots=args.lots)
+    server = SimulatorServer(fleet, args.host, args.port, args.api_key, args.latency, args.jitter,
+                             args.error_rate, args.throttle_rate)
+    print("Simulating " + str(args.sensors) + " sensors at " + server.url
+          + " with API key '" + args.api_key + "'")
+    try:
+        server.serveForever()
+    except KeyboardInterrupt:
+        print("Exiting...")
+
+if __name__ == "__main__":
+    main()
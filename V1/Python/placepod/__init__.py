@@ -0,0 +1,16 @@
+# --------------------------------------------------#
+# PlacePod V1 API client package                    #
+# File: __init__.py                                 #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Nothing is imported here, so importing the        #
+# package costs nothing until a module is used,     #
+# e.g. from placepod import REST, MQTT. The         #
+# scripts run as modules from the directory         #
+# that holds the package:                           #
+#   python -m placepod.REST                         #
+#   python -m placepod.MQTT                         #
+#   python -m placepod.Export --start 2017-09-01    #
+#                                                   #
+# This package only works with V1 of the API.       #
+#-------------------------------------------------- #
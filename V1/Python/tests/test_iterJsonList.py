@@ -0,0 +1,70 @@
+# --------------------------------------------------#
+# REST.iterJsonList regression checks               #
+# File: tests/test_iterJsonList.py                  #
+# Date: October 18th, 2026                          #
+# Project interpreter: 3.7+                         #
+# Splits JSON lists into chunks at every byte       #
+# offset and checks the streamed elements match     #
+# json.loads, and that malformed lists raise.       #
+#                                                   #
+# Usage: python -m unittest discover tests          #
+#-------------------------------------------------- #
+
+import json
+import unittest
+
+from placepod import REST
+
+
+BODIES = [
+    b'[]',
+    b' [ ] \n',
+    b'[1, 2, 1234]',
+    b'[-1.5e3,true,false,null,"a,b]"]',
+    b'[{"sensorId": "0080000004000675", "status": "occupied", "battery": 3.6482174396514893},'
+    b' {"sensorId": "0080000004000676", "parkingSpace": "Space \\u00e9 #54"}]',
+    '[["café", 12], {"a": [1, {"b": 2}]}, 309467131]'.encode('utf_8'),
+]
+
+MALFORMED = [
+    b'[{"a": 1}{"a": 2}]',
+    b'[1 2]',
+    b'[1,,2]',
+    b'[,1]',
+    b'[1,]',
+    b'[1, 2',
+    b'[1, 2] x',
+    b'[1, 2]]',
+    b'{"a": 1}',
+]
+
+
+# Every way of splitting 'body' into two or three chunks
+def splits(body):
+    for first in range(0, len(body) + 1):
+        yield [body[:first], body[first:]]
+        for second in range(first, len(body) + 1):
+            yield [body[:first], body[first:second], body[second:]]
+
+
+class IterJsonListTest(unittest.TestCase):
+    def testEverySplit(self):
+        for body in BODIES:
+            expected = json.loads(body.decode('utf_8'))
+            for chunks in splits(body):
+                self.assertEqual(list(REST.iterJsonList(chunks)), expected, chunks)
+
+    def testMalformed(self):
+        for body in MALFORMED:
+            for chunks in splits(body):
+                with self.assertRaises(ValueError, msg=repr(chunks)):
+                    list(REST.iterJsonList(chunks))
+
+    def testObjectHook(self):
+        body = json.dumps([{'a': i} for i in range(0, 5)]).encode('utf_8')
+        for chunks in splits(body):
+            self.assertEqual(list(REST.iterJsonList(chunks, lambda dct: dct['a'])), list(range(0, 5)))
+
+
+if __name__ == "__main__":
+    unittest.main()